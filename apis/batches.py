@@ -0,0 +1,152 @@
+import asyncio
+import json
+import re
+from urllib.parse import unquote
+
+from fastapi import APIRouter, HTTPException, Request, status
+
+from core.authizations import get_current_user
+from core.config import settings
+from core.databases import async_session
+from models.users import User
+from request_schemas.batches import BatchRequest, BatchSubRequest
+from response_schemas.batches import BatchResponse
+
+batch_router = APIRouter()
+
+BATCH_PATH = "/batch"
+FORWARDED_HEADER_EXCLUDES = {b"content-length", b"content-type", b"transfer-encoding"}
+NESTED_BATCH_DETAIL = "batch 요청은 중첩할 수 없습니다."
+
+_REPEATED_SLASHES = re.compile(r"/{2,}")
+
+
+def _normalize_path(path: str) -> str:
+    path = unquote(path.partition("?")[0])
+    return _REPEATED_SLASHES.sub("/", path).rstrip("/") or "/"
+
+
+async def _resolve_current_user(request: Request) -> User | None:
+    if not request.cookies.get("access_token"):
+        return None
+
+    async with async_session() as db:
+        try:
+            return await get_current_user(request, db)
+
+        except HTTPException:
+            return None
+
+
+def _build_scope(
+    request: Request, sub_request: BatchSubRequest, body: bytes, user: User | None
+) -> dict:
+    path, _, query_string = sub_request.path.partition("?")
+    headers = [
+        (name, value)
+        for name, value in request.scope["headers"]
+        if name not in FORWARDED_HEADER_EXCLUDES
+    ]
+    headers += [
+        (name.lower().encode("latin-1"), value.encode("latin-1"))
+        for name, value in sub_request.headers.items()
+    ]
+
+    if body:
+        headers += [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ]
+
+    return {
+        "type": "http",
+        "asgi": request.scope.get("asgi", {"version": "3.0"}),
+        "http_version": request.scope.get("http_version", "1.1"),
+        "method": sub_request.method,
+        "scheme": request.scope.get("scheme", "http"),
+        "root_path": request.scope.get("root_path", ""),
+        "path": unquote(path),
+        "raw_path": path.encode(),
+        "query_string": query_string.encode(),
+        "headers": headers,
+        "client": request.scope.get("client"),
+        "server": request.scope.get("server"),
+        "state": {"in_batch": True, **({"current_user": user} if user else {})},
+    }
+
+
+async def _dispatch(
+    request: Request,
+    sub_request: BatchSubRequest,
+    user: User | None,
+    semaphore: asyncio.Semaphore,
+) -> dict:
+    if _normalize_path(sub_request.path) == BATCH_PATH:
+        return {
+            "id": sub_request.id,
+            "status": status.HTTP_400_BAD_REQUEST,
+            "body": {"detail": NESTED_BATCH_DETAIL},
+        }
+
+    body = b"" if sub_request.body is None else json.dumps(sub_request.body).encode()
+    scope = _build_scope(request, sub_request, body, user)
+    request_sent = False
+    response = {"status": None, "content_type": b"", "body": bytearray()}
+
+    async def receive() -> dict:
+        nonlocal request_sent
+
+        if request_sent:
+            return {"type": "http.disconnect"}
+
+        request_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["content_type"] = dict(message.get("headers", [])).get(
+                b"content-type", b""
+            )
+
+        elif message["type"] == "http.response.body":
+            response["body"] += message.get("body", b"")
+
+    async with semaphore:
+        try:
+            await request.app(scope, receive, send)
+
+        except Exception:
+            if response["status"] is None:
+                response["status"] = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+    content = bytes(response["body"])
+
+    if not content:
+        parsed = None
+    elif response["content_type"].startswith(b"application/json"):
+        parsed = json.loads(content)
+    else:
+        parsed = content.decode(errors="replace")
+
+    return {"id": sub_request.id, "status": response["status"], "body": parsed}
+
+
+@batch_router.post(BATCH_PATH, response_model=BatchResponse)
+async def run_batch(request_obj: Request, request: BatchRequest):
+    # 경로 정규화를 우회한 하위 요청도 scope의 표시로 한 번 더 막습니다.
+    if getattr(request_obj.state, "in_batch", False):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=NESTED_BATCH_DETAIL
+        )
+
+    user = await _resolve_current_user(request_obj)
+    semaphore = asyncio.Semaphore(settings.batch_max_concurrency)
+
+    responses = await asyncio.gather(
+        *(
+            _dispatch(request_obj, sub_request, user, semaphore)
+            for sub_request in request.requests
+        )
+    )
+    return {"responses": responses}
@@ -1,15 +1,37 @@
-from typing import List
-from fastapi import APIRouter, HTTPException, status, Depends
+import asyncio
+from typing import List, Optional
+from fastapi import (
+    APIRouter,
+    HTTPException,
+    status,
+    Depends,
+    Query,
+    WebSocket,
+    WebSocketDisconnect,
+)
 from redis.asyncio import Redis
 
 from crud.meetings import (
     add_to_meeting_room,
     remove_from_meeting_room,
     get_all_meeting_rooms,
-    get_meeting_room_clients,
-    delete_meeting_room,
+    get_meeting_room_rosters,
+    record_heartbeats,
+    restore_client,
+    append_meeting_room_message,
+    get_meeting_room_messages,
+)
+from request_schemas.meetings import (
+    MeetingRoomCreate,
+    RoomJoin,
+    RoomLeave,
+    HeartbeatBatch,
+    ClientReconnect,
+    ChatMessageCreate,
 )
-from request_schemas.meetings import MeetingRoomCreate, RoomJoin, RoomLeave
+from response_schemas.meetings import ChatMessageResponse, ChatMessagePageResponse
+from core.paginations import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
+from core.broadcasters import meeting_room_events
 from core.databases import get_redis
 
 meetings_router = APIRouter(prefix="/meetingroom")
@@ -46,6 +68,21 @@ async def get_meeting_rooms(redis: Redis = Depends(get_redis)):
         )
 
 
+@meetings_router.get("/roster", response_model=List[dict])
+async def get_meeting_room_roster(
+    room_ids: Optional[List[str]] = Query(None, max_length=200),
+    redis: Redis = Depends(get_redis),
+):
+    try:
+        return await get_meeting_room_rosters(redis, room_ids)
+
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Redis에서 미팅룸 참가자 조회 중 오류가 발생했습니다.",
+        )
+
+
 @meetings_router.post("/join", response_model=dict, status_code=status.HTTP_201_CREATED)
 async def join_meeting_room(request: RoomJoin, redis: Redis = Depends(get_redis)):
     try:
@@ -64,13 +101,11 @@ async def join_meeting_room(request: RoomJoin, redis: Redis = Depends(get_redis)
 )
 async def leave_meeting_room(request: RoomLeave, redis: Redis = Depends(get_redis)):
     try:
-        await remove_from_meeting_room(redis, request.room_id, request.client_id)
-
-        remaining_clients = await get_meeting_room_clients(redis, request.room_id)
+        remaining_clients = await remove_from_meeting_room(
+            redis, request.room_id, request.client_id
+        )
 
         if not remaining_clients:
-            await delete_meeting_room(redis, request.room_id)
-
             return {"message": "미팅룸 퇴장 성공 및 미팅룸 삭제"}
 
         return {"message": "미팅룸 퇴장 성공"}
@@ -80,3 +115,130 @@ async def leave_meeting_room(request: RoomLeave, redis: Redis = Depends(get_redi
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Redis에서 미팅룸 퇴장 처리 중 오류가 발생했습니다.",
         )
+
+
+@meetings_router.post("/heartbeat", response_model=dict)
+async def send_heartbeats(request: HeartbeatBatch, redis: Redis = Depends(get_redis)):
+    try:
+        await record_heartbeats(
+            redis, [heartbeat.client_id for heartbeat in request.heartbeats]
+        )
+        return {"message": "하트비트 기록 성공"}
+
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Redis에서 하트비트 기록 중 오류가 발생했습니다.",
+        )
+
+
+@meetings_router.post("/reconnect", response_model=dict)
+async def reconnect_client(request: ClientReconnect, redis: Redis = Depends(get_redis)):
+    try:
+        room_id = await restore_client(redis, request.client_id)
+
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Redis에서 재접속 처리 중 오류가 발생했습니다.",
+        )
+
+    if not room_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="재접속 가능한 미팅룸이 없습니다.",
+        )
+
+    return {"message": "미팅룸 재입장 성공", "room_id": room_id}
+
+
+@meetings_router.post(
+    "/{room_id}/messages",
+    response_model=ChatMessageResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def send_meeting_room_message(
+    room_id: str, request: ChatMessageCreate, redis: Redis = Depends(get_redis)
+):
+    try:
+        message = await append_meeting_room_message(
+            redis, room_id, request.client_id, request.content
+        )
+
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Redis에서 채팅 메시지 저장 중 오류가 발생했습니다.",
+        )
+
+    if not message:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="미팅룸에 참가 중인 클라이언트가 아닙니다.",
+        )
+
+    return message
+
+
+@meetings_router.get("/{room_id}/messages", response_model=ChatMessagePageResponse)
+async def get_meeting_room_message_list(
+    room_id: str,
+    before: Optional[str] = Query(None, pattern=r"^\d+-\d+$"),
+    after: Optional[str] = Query(None, pattern=r"^\d+-\d+$"),
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    redis: Redis = Depends(get_redis),
+):
+    try:
+        return await get_meeting_room_messages(redis, room_id, before, after, limit)
+
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Redis에서 채팅 기록 조회 중 오류가 발생했습니다.",
+        )
+
+
+@meetings_router.websocket("/events")
+async def meeting_room_event_stream(
+    websocket: WebSocket, redis: Redis = Depends(get_redis)
+):
+    await websocket.accept()
+    queue = meeting_room_events.subscribe()
+
+    async def forward_events():
+        await websocket.send_json(
+            {"type": "snapshot", "rooms": await get_all_meeting_rooms(redis)}
+        )
+
+        while (event := await queue.get()) is not None:
+            await websocket.send_text(event)
+
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+
+    async def receive_messages():
+        try:
+            while True:
+                await websocket.receive_text()
+
+        except WebSocketDisconnect:
+            pass
+
+    forward_task = asyncio.create_task(forward_events())
+    receive_task = asyncio.create_task(receive_messages())
+
+    try:
+        await asyncio.wait(
+            {forward_task, receive_task}, return_when=asyncio.FIRST_COMPLETED
+        )
+
+        if forward_task.done() and forward_task.exception() is not None:
+            try:
+                await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+            except Exception:
+                pass
+
+    finally:
+        for task in (forward_task, receive_task):
+            task.cancel()
+        await asyncio.gather(forward_task, receive_task, return_exceptions=True)
+        meeting_room_events.unsubscribe(queue)
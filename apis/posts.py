@@ -1,13 +1,22 @@
-from typing import Annotated, List
+from typing import Annotated, Literal, Optional
 
-from fastapi import APIRouter, Depends, status
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, Query, Request, status
+from redis.asyncio import Redis
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from core.databases import get_db
+from core.config import settings
+from core.databases import get_db, get_redis
 from core.authizations import get_current_user
+from core.paginations import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, MAX_SEARCH_OFFSET
+from core.response_caches import get_versioned_json_response
 from models.users import User
 from request_schemas.posts import NoticeCreate, GuestBookCreate
-from response_schemas.posts import NoticeResponse, GuestBookResponse
+from response_schemas.posts import (
+    NoticeResponse,
+    NoticePageResponse,
+    GuestBookPageResponse,
+    PostSearchPageResponse,
+)
 from crud import posts as posts_crud
 
 post_router = APIRouter(prefix="/posts")
@@ -17,10 +26,12 @@ post_router = APIRouter(prefix="/posts")
 async def create_notice(
     request: NoticeCreate,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
 ):
-    posts_crud.create_notice(
+    await posts_crud.create_notice(
         db=db,
+        redis=redis,
         request=request,
         author_name=current_user.name,
         author_google_id=current_user.google_id,
@@ -28,19 +39,62 @@ async def create_notice(
     return {"message": "게시글 작성 성공"}
 
 
-@post_router.get("/notices", response_model=List[NoticeResponse])
+@post_router.get("/notices", response_model=NoticePageResponse)
 async def get_notice_list(
-    db: Session = Depends(get_db),
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
 ):
-    return posts_crud.get_notice_list(db=db)
+    async def build_payload() -> str:
+        page = await posts_crud.get_notice_list(db=db, cursor=cursor, limit=limit)
+        return NoticePageResponse.model_validate(page).model_dump_json()
+
+    return await get_versioned_json_response(
+        request,
+        redis,
+        version_key=settings.notice_cache_version_key,
+        key_template=settings.notice_cache_key_template,
+        ttl_seconds=settings.notice_cache_ttl_seconds,
+        resource=f"list:{cursor or ''}:{limit}",
+        build_payload=build_payload,
+    )
 
 
 @post_router.get("/notices/{notice_id}", response_model=NoticeResponse)
 async def get_notice(
+    request: Request,
     notice_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+):
+    async def build_payload() -> str:
+        notice = await posts_crud.get_notice(db=db, notice_id=notice_id)
+        return NoticeResponse.model_validate(notice).model_dump_json()
+
+    return await get_versioned_json_response(
+        request,
+        redis,
+        version_key=settings.notice_cache_version_key,
+        key_template=settings.notice_cache_key_template,
+        ttl_seconds=settings.notice_cache_ttl_seconds,
+        resource=f"detail:{notice_id}",
+        build_payload=build_payload,
+    )
+
+
+@post_router.get("/search", response_model=PostSearchPageResponse)
+async def search_posts(
+    q: str = Query(..., min_length=1, max_length=100),
+    target: Optional[Literal["notice", "guestbook"]] = None,
+    offset: int = Query(0, ge=0, le=MAX_SEARCH_OFFSET),
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    db: AsyncSession = Depends(get_db),
 ):
-    return posts_crud.get_notice(db=db, notice_id=notice_id)
+    return await posts_crud.search_posts(
+        db=db, query=q, target=target, offset=offset, limit=limit
+    )
 
 
 @post_router.post(
@@ -52,9 +106,9 @@ async def create_guestbook(
     host_google_id: str,
     request: GuestBookCreate,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    posts_crud.create_guestbook(
+    await posts_crud.create_guestbook(
         db=db,
         request=request,
         author_name=current_user.name,
@@ -64,12 +118,16 @@ async def create_guestbook(
     return {"message": "방명록 작성 성공"}
 
 
-@post_router.get("/guestbooks/{host_google_id}", response_model=List[GuestBookResponse])
+@post_router.get("/guestbooks/{host_google_id}", response_model=GuestBookPageResponse)
 async def get_guestbook_list(
     host_google_id: str,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    db: AsyncSession = Depends(get_db),
 ):
-    return posts_crud.get_guestbook_list(db=db, host_google_id=host_google_id)
+    return await posts_crud.get_guestbook_list(
+        db=db, host_google_id=host_google_id, cursor=cursor, limit=limit
+    )
 
 
 @post_router.delete(
@@ -81,9 +139,9 @@ async def delete_guestbook(
     host_google_id: str,
     guestbook_id: int,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    posts_crud.delete_guestbook(
+    await posts_crud.delete_guestbook(
         db=db,
         host_google_id=host_google_id,
         guestbook_id=guestbook_id,
@@ -0,0 +1,31 @@
+from typing import Annotated, List
+
+from fastapi import APIRouter, Depends, HTTPException, Path, status
+from fastapi.responses import FileResponse
+
+from core.authizations import get_admin_user
+from core.profilers import PROFILE_ID_PATTERN, profile_store
+from models.users import User
+
+profile_router = APIRouter(prefix="/admin/profiles")
+
+
+@profile_router.get("", response_model=List[dict])
+async def get_profile_list(admin_user: Annotated[User, Depends(get_admin_user)]):
+    return await profile_store.list()
+
+
+@profile_router.get("/{profile_id}", response_class=FileResponse)
+async def download_profile(
+    admin_user: Annotated[User, Depends(get_admin_user)],
+    profile_id: str = Path(..., pattern=PROFILE_ID_PATTERN),
+):
+    html_path = profile_store.html_path(profile_id)
+
+    if not html_path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="프로파일을 찾을 수 없습니다.",
+        )
+
+    return FileResponse(html_path, media_type="text/html")
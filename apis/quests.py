@@ -1,13 +1,19 @@
-from typing import Annotated, List
+from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends, status
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, Query, Response, status
+from redis.asyncio import Redis
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from core.databases import get_db
-from core.authizations import get_current_user
+from core.databases import get_db, get_redis
+from core.authizations import get_current_user, get_admin_user
+from core.catalogs import quest_catalog
 from models.users import User
 from request_schemas.quests import QuestResultCreateRequest
-from response_schemas.quests import QuestResponse, QuestResultResponse
+from response_schemas.quests import (
+    QuestResponse,
+    QuestResultResponse,
+    QuestRankResponse,
+)
 from crud import quests as quests_crud
 
 quest_router = APIRouter(prefix="/quests")
@@ -16,9 +22,26 @@ quest_router = APIRouter(prefix="/quests")
 @quest_router.get("/{quest_number}", response_model=QuestResponse)
 async def get_quest(
     quest_number: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
-    return quests_crud.get_quest(db=db, quest_number=quest_number)
+    payload = await quest_catalog.get_or_load(quest_number)
+
+    if payload is not None:
+        return Response(content=payload, media_type="application/json")
+
+    return await quests_crud.get_quest(db=db, quest_number=quest_number)
+
+
+@quest_router.post("/catalog/reload", response_model=dict)
+async def reload_quest_catalog(
+    admin_user: Annotated[User, Depends(get_admin_user)],
+):
+    version = await quest_catalog.reload()
+    return {
+        "message": "문제 카탈로그 갱신 성공",
+        "version": version,
+        "count": len(quest_catalog),
+    }
 
 
 @quest_router.post(
@@ -30,10 +53,12 @@ async def create_quest_result(
     quest_number: int,
     request: QuestResultCreateRequest,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
 ):
-    quests_crud.create_quest_result(
+    await quests_crud.create_quest_result(
         db=db,
+        redis=redis,
         quest_number=quest_number,
         request=request,
         user_email=current_user.email,
@@ -45,6 +70,22 @@ async def create_quest_result(
 @quest_router.get("/results/{quest_number}", response_model=List[QuestResultResponse])
 async def get_quest_results(
     quest_number: int,
-    db: Session = Depends(get_db),
+    limit: Optional[int] = Query(None, ge=1),
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
 ):
-    return quests_crud.get_quest_results(db=db, quest_number=quest_number)
+    return await quests_crud.get_quest_results(
+        db=db, redis=redis, quest_number=quest_number, limit=limit
+    )
+
+
+@quest_router.get("/results/{quest_number}/me", response_model=QuestRankResponse)
+async def get_my_quest_rank(
+    quest_number: int,
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+):
+    return await quests_crud.get_quest_rank(
+        db=db, redis=redis, quest_number=quest_number, user_email=current_user.email
+    )
@@ -0,0 +1,54 @@
+from typing import List
+
+from fastapi import APIRouter, HTTPException, status, Depends
+from redis.asyncio import Redis
+
+from crud.meetings import add_to_room, remove_from_room, get_room_clients
+from request_schemas.meetings import RoomJoin, RoomLeave
+from core.databases import get_redis
+
+rooms_router = APIRouter(prefix="/rooms")
+
+
+@rooms_router.post("/join", response_model=dict, status_code=status.HTTP_201_CREATED)
+async def join_room(request: RoomJoin, redis: Redis = Depends(get_redis)):
+    try:
+        await add_to_room(redis, request.room_id, request.client_id)
+        return {"message": "채팅방 입장 성공"}
+
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Redis에서 채팅방 입장 처리 중 오류가 발생했습니다.",
+        )
+
+
+@rooms_router.post("/leave", response_model=dict, status_code=status.HTTP_201_CREATED)
+async def leave_room(request: RoomLeave, redis: Redis = Depends(get_redis)):
+    try:
+        remaining_clients = await remove_from_room(
+            redis, request.room_id, request.client_id
+        )
+
+        if not remaining_clients:
+            return {"message": "채팅방 퇴장 성공 및 채팅방 삭제"}
+
+        return {"message": "채팅방 퇴장 성공"}
+
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Redis에서 채팅방 퇴장 처리 중 오류가 발생했습니다.",
+        )
+
+
+@rooms_router.get("/{room_id}/clients", response_model=List[str])
+async def get_room_client_list(room_id: str, redis: Redis = Depends(get_redis)):
+    try:
+        return await get_room_clients(redis, room_id)
+
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Redis에서 채팅방 참가자 조회 중 오류가 발생했습니다.",
+        )
@@ -1,22 +1,32 @@
-from typing import Annotated
+from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, HTTPException, Depends, Response, status
-from sqlmodel import Session
+from fastapi import APIRouter, HTTPException, Depends, Query, Response, status
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from core.databases import get_db
 from core.tokenizers import create_access_token
 from core.authizations import get_current_user
+from core.paginations import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
 from models.users import User
 from crud.users import (
-    get_user_by_email,
-    create_new_user,
-    update_last_login,
+    login_user,
     get_all_users,
+    search_users,
     get_user_profile as get_profile,
+    get_user_profiles,
     update_user_profile,
 )
-from request_schemas.users import GoogleSignupRequest, UserProfileUpdateRequest
-from response_schemas.users import UserProfileResponse, UserListResponse
+from request_schemas.users import (
+    GoogleSignupRequest,
+    UserProfileUpdateRequest,
+    UserProfileBatchRequest,
+)
+from response_schemas.users import (
+    UserProfileResponse,
+    UserProfileBatchResponse,
+    UserPageResponse,
+    UserSearchPageResponse,
+)
 
 
 user_router = APIRouter(prefix="/users")
@@ -26,15 +36,10 @@ user_router = APIRouter(prefix="/users")
 async def google_login(
     request: GoogleSignupRequest,
     response: Response,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     try:
-        user = get_user_by_email(db, request.email)
-
-        if not user:
-            user = create_new_user(db, request)
-
-        update_last_login(db, user)
+        user = await login_user(db, request)
 
         token_body = {
             "email": user.email,
@@ -59,33 +64,56 @@ async def google_login(
         return {"message": "로그인 성공"}
 
     except Exception:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="로그인 처리 중 오류가 발생했습니다.",
         )
 
 
-@user_router.get("/all", response_model=list[UserListResponse])
+@user_router.get("/all", response_model=UserPageResponse)
 async def get_users_list(
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    db: AsyncSession = Depends(get_db),
 ):
-    return get_all_users(db)
+    return await get_all_users(db, cursor, limit)
 
 
-@user_router.get("", response_model=list[UserListResponse])
+@user_router.get("", response_model=UserPageResponse)
 async def get_users_list_v2(
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    db: AsyncSession = Depends(get_db),
+):
+    return await get_all_users(db, cursor, limit)
+
+
+@user_router.get("/search", response_model=UserSearchPageResponse)
+async def search_users_endpoint(
+    tech_stack: List[str] = Query([], max_length=20),
+    generation: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    db: AsyncSession = Depends(get_db),
 ):
-    return get_all_users(db)
+    return await search_users(db, tech_stack, generation, cursor, limit)
 
 
 @user_router.get("/profile/{google_id}", response_model=UserProfileResponse)
 async def get_user_profile(
     google_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+):
+    return await get_profile(db, google_id)
+
+
+@user_router.post("/profiles:batch", response_model=List[UserProfileBatchResponse])
+async def get_user_profiles_batch(
+    request: UserProfileBatchRequest,
+    db: AsyncSession = Depends(get_db),
 ):
-    return get_profile(db, google_id)
+    return await get_user_profiles(db, request.google_ids)
 
 
 @user_router.patch("/profile/{google_id}", response_model=UserProfileResponse)
@@ -93,7 +121,7 @@ async def update_user_profile_endpoint(
     google_id: str,
     profile_update: UserProfileUpdateRequest,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     if current_user.google_id != google_id:
         raise HTTPException(
@@ -102,7 +130,7 @@ async def update_user_profile_endpoint(
         )
 
     try:
-        updated_profile = update_user_profile(db, google_id, profile_update)
+        updated_profile = await update_user_profile(db, google_id, profile_update)
         return updated_profile
 
     except Exception:
@@ -0,0 +1,80 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+
+COMPARED_METRICS = ("p50_ms", "p95_ms", "p99_ms")
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float,
+    min_delta_ms: float,
+) -> list[str]:
+    """기준 결과보다 느려진 요청과 오류가 늘어난 요청을 찾습니다.
+
+    지연 시간은 threshold 비율 이상, 그리고 min_delta_ms 이상 늘어난 경우만
+    회귀로 봅니다. 수 ms 단위 요청의 흔들림을 회귀로 잡지 않기 위함입니다.
+    처리량(rps)은 부하 발생기 성능에 영향을 받으므로 참고용으로만 출력합니다.
+    """
+    regressions = []
+
+    for name, before in sorted(baseline["results"].items()):
+        after = current["results"].get(name)
+
+        if after is None:
+            print(f"{name:32} 현재 결과에 없음")
+            continue
+
+        line = [f"{name:32}", f"rps {before['rps']:>8} → {after['rps']:>8}"]
+
+        for metric in COMPARED_METRICS:
+            delta = after[metric] - before[metric]
+            ratio = delta / before[metric] if before[metric] else 0.0
+            line.append(f"{metric} {before[metric]:>8} → {after[metric]:>8}")
+
+            if ratio > threshold and delta > min_delta_ms:
+                regressions.append(
+                    f"{name} {metric}: {before[metric]}ms → {after[metric]}ms "
+                    f"(+{ratio:.0%})"
+                )
+
+        if after["errors"] > before["errors"]:
+            regressions.append(f"{name} errors: {before['errors']} → {after['errors']}")
+
+        print("  ".join(line))
+
+    return regressions
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="두 벤치마크 결과 JSON을 비교해 지연 시간 회귀가 있으면 실패합니다."
+    )
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="회귀로 볼 증가 비율 (기본 20%%)"
+    )
+    parser.add_argument(
+        "--min-delta-ms", type=float, default=2.0, help="회귀로 볼 최소 증가량(ms)"
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    regressions = compare(
+        json.loads(Path(args.baseline).read_text()),
+        json.loads(Path(args.current).read_text()),
+        args.threshold,
+        args.min_delta_ms,
+    )
+
+    if regressions:
+        print("\n회귀가 발견되었습니다:")
+        print("\n".join(f"  {regression}" for regression in regressions))
+        sys.exit(1)
@@ -0,0 +1,63 @@
+TECH_STACKS = [
+    "python",
+    "fastapi",
+    "django",
+    "react",
+    "typescript",
+    "java",
+    "spring",
+    "go",
+    "rust",
+    "kotlin",
+    "swift",
+    "docker",
+    "kubernetes",
+    "aws",
+    "redis",
+    "postgresql",
+]
+
+WORDS = [
+    "정글",
+    "타워",
+    "회의",
+    "프로젝트",
+    "알고리즘",
+    "코딩",
+    "테스트",
+    "스터디",
+    "팀원",
+    "모집",
+    "면접",
+    "배포",
+    "리뷰",
+    "발표",
+    "방명록",
+    "감사합니다",
+    "fastapi",
+    "redis",
+    "python",
+    "react",
+]
+
+SEARCH_QUERIES = ["정글", "알고리즘 스터디", "팀원 모집", "redis", "회의", "배포 리뷰"]
+
+
+def user_google_id(index: int) -> str:
+    return f"bench-google-{index}"
+
+
+def user_email(index: int) -> str:
+    return f"bench-{index}@example.com"
+
+
+def user_name(index: int) -> str:
+    return f"벤치사용자{index}"
+
+
+def meeting_room_id(index: int) -> str:
+    return f"bench-room-{index}"
+
+
+def meeting_room_client_id(room_index: int, client_index: int) -> str:
+    return f"bench-client-{room_index}-{client_index}"
@@ -0,0 +1,209 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import datetime, time as dt_time
+from pathlib import Path
+from typing import Any
+
+import asyncpg
+
+from benchmarks.load import Recorder, _git_commit
+from benchmarks.seed import COPY_CHUNK_SIZE, _quest_results
+from core.config import settings
+
+
+LEGACY_TABLE = "bench_questresult_legacy"
+CURRENT_TABLE = "bench_questresult_current"
+
+# 002 마이그레이션 이전 스키마: duration_ms와 리더보드 인덱스가 없습니다.
+LEGACY_DDL = f"""
+CREATE TABLE {LEGACY_TABLE} (
+    id SERIAL PRIMARY KEY,
+    quest_number INTEGER NOT NULL,
+    user_name VARCHAR NOT NULL,
+    user_email VARCHAR NOT NULL,
+    time_taken VARCHAR NOT NULL,
+    created_at TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP NOT NULL
+)
+"""
+
+CURRENT_DDL = f"""
+CREATE TABLE {CURRENT_TABLE} (
+    id SERIAL PRIMARY KEY,
+    quest_number INTEGER NOT NULL,
+    user_name VARCHAR NOT NULL,
+    user_email VARCHAR NOT NULL,
+    time_taken VARCHAR NOT NULL,
+    duration_ms INTEGER,
+    created_at TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP NOT NULL
+);
+CREATE INDEX ix_{CURRENT_TABLE}_quest_number_created_at_duration_ms
+    ON {CURRENT_TABLE} (quest_number, created_at, duration_ms)
+    INCLUDE (user_name, user_email, time_taken)
+"""
+
+# 스키마 변경 전후 crud/quests.py의 오늘 리더보드 조회와 같은 모양의 쿼리입니다.
+QUERIES = {
+    "leaderboard.legacy": f"""
+        SELECT * FROM {LEGACY_TABLE}
+        WHERE quest_number = $1 AND created_at >= $2 AND created_at <= $3
+        ORDER BY time_taken ASC
+    """,
+    "leaderboard.current": f"""
+        SELECT quest_number, user_name, user_email, time_taken, created_at, duration_ms
+        FROM {CURRENT_TABLE}
+        WHERE quest_number = $1 AND created_at >= $2 AND created_at <= $3
+            AND duration_ms IS NOT NULL
+        ORDER BY duration_ms ASC
+    """,
+}
+
+
+async def _create_tables(conn: asyncpg.Connection, args, now: datetime) -> int:
+    await conn.execute(f"DROP TABLE IF EXISTS {LEGACY_TABLE}, {CURRENT_TABLE}")
+    await conn.execute(LEGACY_DDL)
+    await conn.execute(CURRENT_DDL)
+
+    rows = _quest_results(args, random.Random(args.seed), now)
+    columns = [
+        "quest_number",
+        "user_name",
+        "user_email",
+        "time_taken",
+        "duration_ms",
+        "created_at",
+        "updated_at",
+    ]
+    count = 0
+
+    while True:
+        chunk = [
+            tuple(row[column] for column in columns)
+            for _, row in zip(range(COPY_CHUNK_SIZE), rows)
+        ]
+        if not chunk:
+            break
+
+        await conn.copy_records_to_table(CURRENT_TABLE, records=chunk, columns=columns)
+        await conn.copy_records_to_table(
+            LEGACY_TABLE,
+            records=[record[:4] + record[5:] for record in chunk],
+            columns=columns[:4] + columns[5:],
+        )
+        count += len(chunk)
+
+    for table in (LEGACY_TABLE, CURRENT_TABLE):
+        await conn.execute(f"VACUUM (ANALYZE) {table}")
+
+    return count
+
+
+async def _run_query(
+    pool: asyncpg.Pool, recorder: Recorder, name: str, args, now: datetime
+) -> float:
+    rng = random.Random(args.seed)
+    today_start = datetime.combine(now.date(), dt_time.min)
+    today_end = datetime.combine(now.date(), dt_time.max)
+    remaining = args.iterations
+
+    async def worker() -> None:
+        nonlocal remaining
+
+        while remaining > 0:
+            remaining -= 1
+            started_at = time.perf_counter()
+
+            async with pool.acquire() as conn:
+                await conn.fetch(
+                    QUERIES[name], rng.randint(1, args.quests), today_start, today_end
+                )
+
+            recorder.record(name, time.perf_counter() - started_at, "ok")
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    return time.perf_counter() - started_at
+
+
+async def main(args) -> dict[str, Any]:
+    now = datetime.now()
+    dsn = settings.db_url.replace("+asyncpg", "")
+
+    conn = await asyncpg.connect(dsn)
+    try:
+        started_at = time.perf_counter()
+        rows = await _create_tables(conn, args, now)
+        print(f"{rows}건씩 생성 ({time.perf_counter() - started_at:.1f}s)")
+
+    finally:
+        await conn.close()
+
+    recorder = Recorder()
+    results = {}
+
+    async with asyncpg.create_pool(dsn, max_size=args.concurrency) as pool:
+        for name in QUERIES:
+            # 측정 전에 한 번 실행해 버퍼 캐시를 채웁니다.
+            await pool.fetch(QUERIES[name], 1, now, now)
+
+            elapsed = await _run_query(pool, recorder, name, args, now)
+            results[name] = {
+                "scenario": "leaderboard_schema",
+                **recorder.summary(name, elapsed),
+            }
+            print(
+                f"{name:32} {results[name]['rps']:>8} qps  "
+                f"p50 {results[name]['p50_ms']:>8}ms  "
+                f"p95 {results[name]['p95_ms']:>8}ms  "
+                f"p99 {results[name]['p99_ms']:>8}ms"
+            )
+
+    if not args.keep:
+        async with asyncpg.create_pool(dsn, max_size=1) as pool:
+            await pool.execute(f"DROP TABLE IF EXISTS {LEGACY_TABLE}, {CURRENT_TABLE}")
+
+    report = {
+        "metadata": {
+            "created_at": now.isoformat(),
+            "git_commit": _git_commit(),
+            "concurrency": args.concurrency,
+            "iterations": args.iterations,
+            "seed": args.seed,
+            "dataset": {"quest_results": rows, "quests": args.quests},
+        },
+        "results": results,
+    }
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2))
+    return report
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "같은 문제 해결 결과를 duration_ms 도입 전/후 스키마의 테이블에 각각 넣고 "
+            "오늘의 리더보드 조회 지연 시간을 비교합니다. 기존 테이블은 건드리지 않습니다."
+        )
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--users", type=int, default=5_000)
+    parser.add_argument("--quests", type=int, default=20)
+    parser.add_argument("--quest-results", type=int, default=1_000_000)
+    parser.add_argument("--today-ratio", type=float, default=0.02)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument(
+        "--keep", action="store_true", help="측정 후 비교용 테이블을 남겨 둡니다"
+    )
+    parser.add_argument(
+        "--output", default="benchmarks/results/leaderboard_schema.json"
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,561 @@
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import subprocess
+import time
+import uuid
+from collections import Counter, defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+from benchmarks.datasets import (
+    SEARCH_QUERIES,
+    TECH_STACKS,
+    WORDS,
+    meeting_room_client_id,
+    meeting_room_id,
+    user_email,
+    user_google_id,
+    user_name,
+)
+from core.tokenizers import create_access_token
+
+
+class Recorder:
+    """요청 이름별 응답 시간과 상태 코드를 모읍니다."""
+
+    def __init__(self) -> None:
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.statuses: dict[str, Counter[str]] = defaultdict(Counter)
+        self.enabled = True
+
+    def record(self, name: str, elapsed: float, status: str) -> None:
+        if self.enabled:
+            self.latencies[name].append(elapsed)
+            self.statuses[name][status] += 1
+
+    def summary(self, name: str, elapsed: float) -> dict[str, Any]:
+        latencies = sorted(self.latencies[name])
+        statuses = self.statuses[name]
+        percentiles = (
+            statistics.quantiles(latencies, n=100, method="inclusive")
+            if len(latencies) > 1
+            else latencies * 99
+        )
+
+        return {
+            "requests": len(latencies),
+            "errors": sum(
+                count
+                for status, count in statuses.items()
+                if not status.isdigit() or int(status) >= 500
+            ),
+            "rps": round(len(latencies) / elapsed, 1),
+            "p50_ms": round(percentiles[49] * 1000, 2),
+            "p95_ms": round(percentiles[94] * 1000, 2),
+            "p99_ms": round(percentiles[98] * 1000, 2),
+            "max_ms": round(latencies[-1] * 1000, 2),
+            "status": dict(sorted(statuses.items())),
+        }
+
+
+class LoadContext:
+    def __init__(
+        self, client: httpx.AsyncClient, manifest: dict[str, Any], seed: int
+    ) -> None:
+        self.client = client
+        self.manifest = manifest
+        self.rng = random.Random(seed)
+        self.recorder = Recorder()
+        self._tokens: dict[int, str] = {}
+
+    def random_user(self) -> int:
+        return self.rng.randrange(self.manifest["users"])
+
+    def token(self, user_index: int) -> str:
+        if user_index not in self._tokens:
+            self._tokens[user_index] = create_access_token(
+                {
+                    "email": user_email(user_index),
+                    "name": user_name(user_index),
+                    "google_id": user_google_id(user_index),
+                    "google_image_url": None,
+                    "generation": None,
+                }
+            )
+
+        return self._tokens[user_index]
+
+    async def request(
+        self,
+        name: str,
+        method: str,
+        path: str,
+        *,
+        user: int | None = None,
+        **kwargs,
+    ) -> httpx.Response | None:
+        if user is not None:
+            kwargs["headers"] = {"Cookie": f"access_token={self.token(user)}"}
+
+        started_at = time.perf_counter()
+
+        try:
+            response = await self.client.request(method, path, **kwargs)
+
+        except httpx.HTTPError as e:
+            self.recorder.record(
+                name, time.perf_counter() - started_at, type(e).__name__
+            )
+            return None
+
+        self.recorder.record(
+            name, time.perf_counter() - started_at, str(response.status_code)
+        )
+        return response
+
+
+Scenario = Callable[[LoadContext], Awaitable[None]]
+SCENARIOS: dict[str, Scenario] = {}
+
+
+def scenario(name: str) -> Callable[[Scenario], Scenario]:
+    def register(func: Scenario) -> Scenario:
+        SCENARIOS[name] = func
+        return func
+
+    return register
+
+
+@scenario("health")
+async def health(ctx: LoadContext) -> None:
+    await ctx.request("health", "GET", "/health")
+
+
+@scenario("users.login")
+async def users_login(ctx: LoadContext) -> None:
+    index = ctx.random_user()
+    await ctx.request(
+        "users.login",
+        "POST",
+        "/users/login",
+        json={
+            "email": user_email(index),
+            "name": user_name(index),
+            "google_id": user_google_id(index),
+            "google_image_url": None,
+        },
+    )
+
+
+@scenario("users.list")
+async def users_list(ctx: LoadContext) -> None:
+    response = await ctx.request("users.list", "GET", "/users", params={"limit": 20})
+
+    if response is not None and response.status_code == 200:
+        cursor = response.json().get("next_cursor")
+        if cursor:
+            await ctx.request(
+                "users.list.next",
+                "GET",
+                "/users",
+                params={"limit": 20, "cursor": cursor},
+            )
+
+
+@scenario("users.search")
+async def users_search(ctx: LoadContext) -> None:
+    await ctx.request(
+        "users.search",
+        "GET",
+        "/users/search",
+        params={
+            "tech_stack": ctx.rng.sample(TECH_STACKS, ctx.rng.randint(1, 2)),
+            "limit": 20,
+        },
+    )
+
+
+@scenario("users.profile")
+async def users_profile(ctx: LoadContext) -> None:
+    await ctx.request(
+        "users.profile", "GET", f"/users/profile/{user_google_id(ctx.random_user())}"
+    )
+
+
+@scenario("users.profiles_batch")
+async def users_profiles_batch(ctx: LoadContext) -> None:
+    await ctx.request(
+        "users.profiles_batch",
+        "POST",
+        "/users/profiles:batch",
+        json={"google_ids": [user_google_id(ctx.random_user()) for _ in range(100)]},
+    )
+
+
+@scenario("users.profile_update")
+async def users_profile_update(ctx: LoadContext) -> None:
+    index = ctx.random_user()
+    await ctx.request(
+        "users.profile_update",
+        "PATCH",
+        f"/users/profile/{user_google_id(index)}",
+        user=index,
+        json={"bio": " ".join(ctx.rng.choices(WORDS, k=8))},
+    )
+
+
+@scenario("posts.notices")
+async def posts_notices(ctx: LoadContext) -> None:
+    await ctx.request("posts.notices", "GET", "/posts/notices", params={"limit": 20})
+    await ctx.request(
+        "posts.notice",
+        "GET",
+        f"/posts/notices/{ctx.rng.randint(1, ctx.manifest['notices'])}",
+    )
+
+
+@scenario("posts.notice_create")
+async def posts_notice_create(ctx: LoadContext) -> None:
+    await ctx.request(
+        "posts.notice_create",
+        "POST",
+        "/posts/notices",
+        user=ctx.manifest["admin_user_index"],
+        json={
+            "title": " ".join(ctx.rng.choices(WORDS, k=4)),
+            "content": " ".join(ctx.rng.choices(WORDS, k=40)),
+        },
+    )
+
+
+@scenario("posts.search")
+async def posts_search(ctx: LoadContext) -> None:
+    await ctx.request(
+        "posts.search",
+        "GET",
+        "/posts/search",
+        params={"q": ctx.rng.choice(SEARCH_QUERIES), "limit": 20},
+    )
+
+
+@scenario("posts.guestbooks")
+async def posts_guestbooks(ctx: LoadContext) -> None:
+    host = user_google_id(int(ctx.rng.paretovariate(1.2)) % ctx.manifest["users"])
+    await ctx.request(
+        "posts.guestbooks", "GET", f"/posts/guestbooks/{host}", params={"limit": 20}
+    )
+
+
+@scenario("posts.guestbook_create")
+async def posts_guestbook_create(ctx: LoadContext) -> None:
+    await ctx.request(
+        "posts.guestbook_create",
+        "POST",
+        f"/posts/guestbooks/{user_google_id(ctx.random_user())}",
+        user=ctx.random_user(),
+        json={"content": " ".join(ctx.rng.choices(WORDS, k=12))},
+    )
+
+
+@scenario("quests.get")
+async def quests_get(ctx: LoadContext) -> None:
+    await ctx.request(
+        "quests.get", "GET", f"/quests/{ctx.rng.randint(1, ctx.manifest['quests'])}"
+    )
+
+
+@scenario("quests.result_create")
+async def quests_result_create(ctx: LoadContext) -> None:
+    seconds = ctx.rng.randint(30, 3 * 60 * 60)
+    await ctx.request(
+        "quests.result_create",
+        "POST",
+        f"/quests/results/{ctx.rng.randint(1, ctx.manifest['quests'])}",
+        user=ctx.random_user(),
+        json={
+            "time_taken": f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+        },
+    )
+
+
+@scenario("quests.leaderboard")
+async def quests_leaderboard(ctx: LoadContext) -> None:
+    quest_number = ctx.rng.randint(1, ctx.manifest["quests"])
+    await ctx.request(
+        "quests.leaderboard",
+        "GET",
+        f"/quests/results/{quest_number}",
+        params={"limit": 10},
+    )
+    await ctx.request(
+        "quests.rank",
+        "GET",
+        f"/quests/results/{quest_number}/me",
+        user=ctx.random_user(),
+    )
+
+
+@scenario("meetingroom.list")
+async def meetingroom_list(ctx: LoadContext) -> None:
+    await ctx.request("meetingroom.list", "GET", "/meetingroom/list")
+
+
+@scenario("meetingroom.roster")
+async def meetingroom_roster(ctx: LoadContext) -> None:
+    rooms = ctx.rng.sample(
+        range(ctx.manifest["meeting_rooms"]), min(50, ctx.manifest["meeting_rooms"])
+    )
+    await ctx.request(
+        "meetingroom.roster",
+        "GET",
+        "/meetingroom/roster",
+        params={"room_ids": [meeting_room_id(room) for room in rooms]},
+    )
+
+
+@scenario("meetingroom.join_leave")
+async def meetingroom_join_leave(ctx: LoadContext) -> None:
+    body = {
+        "room_id": meeting_room_id(ctx.rng.randrange(ctx.manifest["meeting_rooms"])),
+        "client_id": f"bench-load-{uuid.uuid4().hex}",
+    }
+    await ctx.request("meetingroom.join", "POST", "/meetingroom/join", json=body)
+    await ctx.request("meetingroom.leave", "POST", "/meetingroom/leave", json=body)
+
+
+@scenario("meetingroom.create_leave")
+async def meetingroom_create_leave(ctx: LoadContext) -> None:
+    body = {
+        "room_id": f"bench-load-room-{uuid.uuid4().hex}",
+        "client_id": f"bench-load-{uuid.uuid4().hex}",
+    }
+    await ctx.request(
+        "meetingroom.create",
+        "POST",
+        "/meetingroom/create",
+        json={**body, "title": "벤치 미팅룸"},
+    )
+    await ctx.request(
+        "meetingroom.leave_and_delete", "POST", "/meetingroom/leave", json=body
+    )
+
+
+@scenario("meetingroom.heartbeat")
+async def meetingroom_heartbeat(ctx: LoadContext) -> None:
+    # 시드한 클라이언트에 하트비트를 보내면 이후 리퍼가 제거하므로 별도 ID를 씁니다.
+    await ctx.request(
+        "meetingroom.heartbeat",
+        "POST",
+        "/meetingroom/heartbeat",
+        json={
+            "heartbeats": [
+                {"client_id": f"bench-heartbeat-{ctx.rng.randrange(10_000)}"}
+                for _ in range(100)
+            ]
+        },
+    )
+
+
+@scenario("meetingroom.chat")
+async def meetingroom_chat(ctx: LoadContext) -> None:
+    room = ctx.rng.randrange(ctx.manifest["meeting_rooms"])
+    await ctx.request(
+        "meetingroom.message_create",
+        "POST",
+        f"/meetingroom/{meeting_room_id(room)}/messages",
+        json={
+            "client_id": meeting_room_client_id(room, 0),
+            "content": " ".join(ctx.rng.choices(WORDS, k=10)),
+        },
+    )
+    await ctx.request(
+        "meetingroom.messages",
+        "GET",
+        f"/meetingroom/{meeting_room_id(room)}/messages",
+        params={"limit": 20},
+    )
+
+
+@scenario("rooms.join_leave")
+async def rooms_join_leave(ctx: LoadContext) -> None:
+    body = {
+        "room_id": f"bench-chat-{ctx.rng.randrange(100)}",
+        "client_id": f"bench-load-{uuid.uuid4().hex}",
+    }
+    await ctx.request("rooms.join", "POST", "/rooms/join", json=body)
+    await ctx.request("rooms.clients", "GET", f"/rooms/{body['room_id']}/clients")
+    await ctx.request("rooms.leave", "POST", "/rooms/leave", json=body)
+
+
+@scenario("batch")
+async def batch(ctx: LoadContext) -> None:
+    await ctx.request(
+        "batch",
+        "POST",
+        "/batch",
+        json={
+            "requests": [
+                {"method": "GET", "path": "/meetingroom/list"},
+                {"method": "GET", "path": "/posts/notices?limit=5"},
+                {
+                    "method": "GET",
+                    "path": f"/users/profile/{user_google_id(ctx.random_user())}",
+                },
+                {"method": "GET", "path": "/quests/results/1?limit=10"},
+                {"method": "GET", "path": "/health"},
+            ]
+        },
+    )
+
+
+async def run_scenario(
+    ctx: LoadContext,
+    func: Scenario,
+    concurrency: int,
+    duration: float,
+    iterations: int | None,
+) -> float:
+    deadline = time.perf_counter() + duration
+    remaining = iterations
+
+    async def worker() -> None:
+        nonlocal remaining
+
+        while time.perf_counter() < deadline:
+            if remaining is not None:
+                if remaining <= 0:
+                    return
+                remaining -= 1
+
+            await func(ctx)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started_at
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _selected_scenarios(patterns: list[str] | None) -> dict[str, Scenario]:
+    if not patterns:
+        return SCENARIOS
+
+    return {
+        name: func
+        for name, func in SCENARIOS.items()
+        if any(
+            name == pattern or name.startswith(f"{pattern}.") for pattern in patterns
+        )
+    }
+
+
+async def main(args) -> dict[str, Any]:
+    manifest = json.loads(Path(args.manifest).read_text())
+    scenarios = _selected_scenarios(args.scenario)
+    results = {}
+
+    async with httpx.AsyncClient(
+        base_url=args.base_url,
+        timeout=args.timeout,
+        limits=httpx.Limits(max_connections=args.concurrency),
+    ) as client:
+        ctx = LoadContext(client, manifest, args.seed)
+
+        for name, func in scenarios.items():
+            if args.warmup:
+                ctx.recorder.enabled = False
+                await run_scenario(ctx, func, args.concurrency, args.warmup, None)
+                ctx.recorder.enabled = True
+
+            elapsed = await run_scenario(
+                ctx, func, args.concurrency, args.duration, args.iterations
+            )
+
+            for request_name in sorted(ctx.recorder.latencies):
+                results[request_name] = {
+                    "scenario": name,
+                    **ctx.recorder.summary(request_name, elapsed),
+                }
+                print(
+                    f"{request_name:32} {results[request_name]['rps']:>8} rps  "
+                    f"p50 {results[request_name]['p50_ms']:>8}ms  "
+                    f"p95 {results[request_name]['p95_ms']:>8}ms  "
+                    f"p99 {results[request_name]['p99_ms']:>8}ms  "
+                    f"errors {results[request_name]['errors']}"
+                )
+
+            ctx.recorder.latencies.clear()
+            ctx.recorder.statuses.clear()
+
+    report = {
+        "metadata": {
+            "created_at": datetime.now().isoformat(),
+            "git_commit": args.app_commit or _git_commit(),
+            "python": platform.python_version(),
+            "base_url": args.base_url,
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "seed": args.seed,
+            "dataset": manifest,
+        },
+        "results": results,
+    }
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2))
+    return report
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="실행 중인 서버에 시나리오별로 동시 요청을 보내고 결과를 JSON으로 저장합니다."
+    )
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--manifest", default="benchmarks/results/seed.json")
+    parser.add_argument("--output", default="benchmarks/results/latest.json")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument(
+        "--duration", type=float, default=20.0, help="시나리오별 측정 시간(초)"
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=None,
+        help="시나리오별 최대 반복 횟수. --duration보다 먼저 끝나면 종료합니다",
+    )
+    parser.add_argument(
+        "--warmup", type=float, default=2.0, help="시나리오별 예열 시간(초)"
+    )
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--app-commit",
+        default=None,
+        help="측정 대상 서버의 커밋. 현재 트리와 다른 코드를 띄웠을 때 기록용 (기본: HEAD)",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        help="실행할 시나리오 이름 또는 접두어 (예: users, meetingroom.chat). 여러 번 지정 가능",
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,199 @@
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from pathlib import Path
+
+import httpx
+
+from benchmarks.standins import start_postgres, start_redis
+
+
+def _stop(process: subprocess.Popen) -> None:
+    process.terminate()
+
+    try:
+        process.wait(timeout=15)
+
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def _checkout(stack: ExitStack, ref: str) -> tuple[str, str]:
+    """ref를 임시 git worktree로 체크아웃하고 (경로, 커밋 해시)를 반환합니다.
+
+    .env가 있으면 worktree에 링크해 같은 설정으로 서버가 뜨도록 합니다.
+    """
+    commit = subprocess.run(
+        ["git", "rev-parse", "--verify", f"{ref}^{{commit}}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+    path = tempfile.mkdtemp(prefix="bench-app-")
+
+    subprocess.run(
+        ["git", "worktree", "add", "--detach", path, commit],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    stack.callback(
+        subprocess.run, ["git", "worktree", "remove", "--force", path], check=False
+    )
+
+    if Path(".env").exists():
+        (Path(path) / ".env").symlink_to(Path(".env").resolve())
+
+    return path, commit
+
+
+def _wait_until_ready(base_url: str, server: subprocess.Popen, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            sys.exit(
+                f"서버가 시작 중에 종료되었습니다 (exit code {server.returncode})."
+            )
+
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return
+
+        except httpx.HTTPError:
+            pass
+
+        time.sleep(0.5)
+
+    sys.exit(f"{timeout}초 안에 서버가 준비되지 않았습니다.")
+
+
+def main(args) -> None:
+    base_url = f"http://127.0.0.1:{args.port}"
+    env = os.environ.copy()
+
+    with ExitStack() as stack:
+        if args.redis == "embedded":
+            env.update(start_redis(stack))
+
+        if args.postgres == "embedded":
+            env.update(start_postgres(stack, args.pgdata, args.pg_bin))
+
+        if not args.skip_seed:
+            subprocess.run(
+                [sys.executable, "-m", "benchmarks.seed", "--reset", *args.seed_arg],
+                env=env,
+                check=True,
+            )
+
+        app_dir, load_args = None, []
+        if args.app_ref:
+            app_dir, commit = _checkout(stack, args.app_ref)
+            load_args = ["--app-commit", commit]
+            # worktree의 모듈이 먼저 import되고, 없는 benchmarks 패키지만 현재 트리에서 찾습니다.
+            env["PYTHONPATH"] = os.pathsep.join(
+                filter(None, [os.getcwd(), env.get("PYTHONPATH")])
+            )
+            subprocess.run(
+                [sys.executable, "-m", "benchmarks.schema"],
+                cwd=app_dir,
+                env=env,
+                check=True,
+            )
+
+        server = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "uvicorn",
+                "main:app",
+                "--host",
+                "127.0.0.1",
+                "--port",
+                str(args.port),
+                "--workers",
+                str(args.workers),
+                "--log-level",
+                "warning",
+            ],
+            cwd=app_dir,
+            env=env,
+        )
+        stack.callback(_stop, server)
+        _wait_until_ready(base_url, server, args.startup_timeout)
+
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.load", "--base-url", base_url]
+            + load_args
+            + args.load_arg,
+            env=env,
+            check=True,
+        )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="데이터 생성, 서버 실행, 부하 측정을 한 번에 수행합니다."
+    )
+    parser.add_argument(
+        "--redis",
+        choices=["local", "embedded"],
+        default="local",
+        help="local: .env의 Redis 사용, embedded: fakeredis TCP 서버 사용",
+    )
+    parser.add_argument(
+        "--postgres",
+        choices=["local", "embedded"],
+        default="local",
+        help="local: .env의 Postgres 사용, embedded: 일회용 클러스터 생성",
+    )
+    parser.add_argument("--pgdata", default="benchmarks/results/pgdata")
+    parser.add_argument(
+        "--pg-bin", default=None, help="initdb/pg_ctl이 있는 디렉터리 (기본: PATH)"
+    )
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--startup-timeout", type=float, default=60.0)
+    parser.add_argument(
+        "--app-ref",
+        default=None,
+        help=(
+            "현재 트리 대신 이 git ref(커밋, 태그, 브랜치)의 코드로 서버를 띄우고, "
+            "시드한 스키마를 그 커밋의 모델에 맞춰 되돌립니다"
+        ),
+    )
+    parser.add_argument(
+        "--skip-seed", action="store_true", help="이미 생성된 데이터를 그대로 사용"
+    )
+    parser.add_argument(
+        "--seed-arg",
+        action="append",
+        default=[],
+        help="benchmarks.seed에 넘길 인자 (예: --seed-arg=--users=1000)",
+    )
+    parser.add_argument(
+        "--load-arg",
+        action="append",
+        default=[],
+        help="benchmarks.load에 넘길 인자 (예: --load-arg=--duration=5)",
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    if args.skip_seed and args.redis == "embedded":
+        sys.exit("내장 Redis는 매번 비어 있으므로 --skip-seed와 함께 쓸 수 없습니다.")
+
+    if args.skip_seed and args.app_ref:
+        sys.exit(
+            "--app-ref는 시드한 스키마를 이전 커밋에 맞춰 되돌리므로 "
+            "--skip-seed와 함께 쓸 수 없습니다."
+        )
+
+    main(args)
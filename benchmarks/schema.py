@@ -0,0 +1,72 @@
+import asyncio
+import importlib
+import pkgutil
+
+import asyncpg
+from sqlalchemy.engine import make_url
+from sqlmodel import SQLModel
+
+import models
+from core.config import settings
+
+
+# 시드는 항상 현재 모델로 테이블을 만듭니다. 이전 커밋의 서버를 측정할 때는
+# run.py가 그 커밋의 작업 트리에서 이 모듈을 실행해, 당시 모델에 없는 컬럼과
+# 인덱스를 지워 스키마를 그 커밋 시점과 같게 되돌립니다.
+
+
+def _dsn() -> str:
+    url = make_url(settings.db_url).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+async def _existing_columns(conn: asyncpg.Connection, table: str) -> set[str]:
+    rows = await conn.fetch(
+        "SELECT column_name FROM information_schema.columns "
+        "WHERE table_schema = 'public' AND table_name = $1",
+        table,
+    )
+    return {row["column_name"] for row in rows}
+
+
+async def _existing_indexes(conn: asyncpg.Connection, table: str) -> set[str]:
+    # 기본 키, 유니크 제약처럼 제약 조건이 소유한 인덱스는 제외합니다.
+    rows = await conn.fetch(
+        """
+        SELECT indexname FROM pg_indexes
+        WHERE schemaname = 'public' AND tablename = $1
+            AND NOT EXISTS (
+                SELECT 1 FROM pg_constraint WHERE conname = pg_indexes.indexname
+            )
+        """,
+        table,
+    )
+    return {row["indexname"] for row in rows}
+
+
+async def align_schema() -> None:
+    for module in pkgutil.iter_modules(models.__path__):
+        importlib.import_module(f"models.{module.name}")
+
+    conn = await asyncpg.connect(_dsn())
+
+    try:
+        for table in SQLModel.metadata.sorted_tables:
+            indexes = await _existing_indexes(conn, table.name)
+            for name in sorted(indexes - {index.name for index in table.indexes}):
+                await conn.execute(f'DROP INDEX "{name}"')
+                print(f"{table.name}: 인덱스 {name} 삭제")
+
+            columns = await _existing_columns(conn, table.name)
+            for name in sorted(columns - {column.name for column in table.columns}):
+                await conn.execute(f'ALTER TABLE "{table.name}" DROP COLUMN "{name}"')
+                print(f"{table.name}: 컬럼 {name} 삭제")
+
+            await conn.execute(f'VACUUM (ANALYZE) "{table.name}"')
+
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(align_schema())
@@ -0,0 +1,282 @@
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import asyncpg
+from sqlalchemy import text
+from sqlmodel import SQLModel
+
+from benchmarks.datasets import (
+    TECH_STACKS,
+    WORDS,
+    meeting_room_client_id,
+    meeting_room_id,
+    user_email,
+    user_google_id,
+    user_name,
+)
+from core.config import settings
+from core.databases import close_redis, engine, redis_client
+from crud.meetings import add_to_meeting_room, set_client_info
+from models.posts import GuestBook, Notice
+from models.quests import Quest, QuestResult
+from models.users import User, UserProfile
+
+
+COPY_CHUNK_SIZE = 50_000
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choices(WORDS, k=words))
+
+
+def _timestamp(rng: random.Random, now: datetime, days: int) -> datetime:
+    return now - timedelta(seconds=rng.randrange(days * 24 * 60 * 60))
+
+
+def _users(args, rng: random.Random, now: datetime) -> Iterator[dict[str, Any]]:
+    for index in range(args.users):
+        created_at = _timestamp(rng, now, 365)
+        yield {
+            "email": user_email(index),
+            "name": user_name(index),
+            "google_id": user_google_id(index),
+            "google_image_url": None,
+            "generation": rng.randint(1, 8),
+            "last_login_at": created_at,
+            "role_level": settings.admin_role_level if index == 0 else 0,
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+
+
+def _user_profiles(args, rng: random.Random, now: datetime) -> Iterator[dict]:
+    for index in range(args.users):
+        yield {
+            "google_id": user_google_id(index),
+            "bio": _sentence(rng, 8),
+            "resume_url": None,
+            "portfolio_url": [],
+            "tech_stack": rng.sample(TECH_STACKS, rng.randint(1, 5)),
+            "created_at": now,
+            "updated_at": now,
+        }
+
+
+def _notices(args, rng: random.Random, now: datetime) -> Iterator[dict[str, Any]]:
+    for _ in range(args.notices):
+        created_at = _timestamp(rng, now, 365)
+        yield {
+            "title": _sentence(rng, 4),
+            "content": _sentence(rng, 40),
+            "author_name": user_name(0),
+            "author_google_id": user_google_id(0),
+            "is_deleted": False,
+            "deleted_at": None,
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+
+
+def _guestbooks(args, rng: random.Random, now: datetime) -> Iterator[dict[str, Any]]:
+    for _ in range(args.guestbooks):
+        created_at = _timestamp(rng, now, 365)
+        yield {
+            "content": _sentence(rng, 12),
+            "author_name": user_name(rng.randrange(args.users)),
+            "guest_google_id": user_google_id(rng.randrange(args.users)),
+            # 일부 사용자에게 방명록이 몰리도록 분포를 치우칩니다.
+            "host_google_id": user_google_id(int(rng.paretovariate(1.2)) % args.users),
+            "is_secret": rng.random() < 0.1,
+            "is_deleted": rng.random() < 0.02,
+            "deleted_at": None,
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+
+
+def _quests(args, rng: random.Random, now: datetime) -> Iterator[dict[str, Any]]:
+    for quest_number in range(1, args.quests + 1):
+        yield {
+            "quest_number": quest_number,
+            "title": f"문제 {quest_number}",
+            "content": _sentence(rng, 60),
+            "input_example": "1 2",
+            "output_example": "3",
+        }
+
+
+def _quest_results(args, rng: random.Random, now: datetime) -> Iterator[dict]:
+    for _ in range(args.quest_results):
+        index = rng.randrange(args.users)
+        duration_ms = rng.randint(30, 3 * 60 * 60) * 1000
+        seconds = duration_ms // 1000
+        # 리더보드 콜드 스타트가 DB를 읽도록 일부 결과는 오늘 날짜로 만듭니다.
+        created_at = (
+            now - timedelta(seconds=rng.randrange(60 * 60))
+            if rng.random() < args.today_ratio
+            else _timestamp(rng, now, 90)
+        )
+        yield {
+            "quest_number": rng.randint(1, args.quests),
+            "user_name": user_name(index),
+            "user_email": user_email(index),
+            "time_taken": f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}",
+            "duration_ms": duration_ms,
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+
+
+async def _copy_rows(
+    conn: asyncpg.Connection,
+    model: type[SQLModel],
+    rows: Iterator[dict[str, Any]],
+) -> int:
+    # search_vector 같은 생성 컬럼과 id는 DB가 채우므로 COPY 대상에서 뺍니다.
+    columns = [
+        column.name
+        for column in model.__table__.columns
+        if not column.primary_key and column.computed is None
+    ]
+    count = 0
+
+    while True:
+        chunk = [
+            tuple(row[column] for column in columns)
+            for _, row in zip(range(COPY_CHUNK_SIZE), rows)
+        ]
+        if not chunk:
+            return count
+
+        await conn.copy_records_to_table(
+            model.__tablename__, records=chunk, columns=columns
+        )
+        count += len(chunk)
+
+
+async def reset_database() -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+
+async def seed_database(args, rng: random.Random, now: datetime) -> dict[str, int]:
+    tables: list[tuple[type[SQLModel], Callable[..., Iterator[dict]]]] = [
+        (User, _users),
+        (UserProfile, _user_profiles),
+        (Notice, _notices),
+        (GuestBook, _guestbooks),
+        (Quest, _quests),
+        (QuestResult, _quest_results),
+    ]
+    counts = {}
+    conn = await asyncpg.connect(settings.db_url.replace("+asyncpg", ""))
+
+    try:
+        for model, rows in tables:
+            started_at = time.perf_counter()
+            counts[model.__tablename__] = await _copy_rows(
+                conn, model, rows(args, rng, now)
+            )
+            print(
+                f"{model.__tablename__}: {counts[model.__tablename__]}건 "
+                f"({time.perf_counter() - started_at:.1f}s)"
+            )
+
+        for model, _ in tables:
+            await conn.execute(f'VACUUM (ANALYZE) "{model.__tablename__}"')
+
+    finally:
+        await conn.close()
+
+    return counts
+
+
+async def seed_redis(args) -> None:
+    semaphore = asyncio.Semaphore(settings.redis_max_connections)
+
+    async def seed_meeting_room(room_index: int) -> None:
+        room_id = meeting_room_id(room_index)
+
+        async with semaphore:
+            for client_index in range(args.clients_per_room):
+                client_id = meeting_room_client_id(room_index, client_index)
+                await add_to_meeting_room(
+                    redis_client,
+                    room_id,
+                    f"벤치 미팅룸 {room_index}" if client_index == 0 else None,
+                    client_id,
+                )
+                await set_client_info(
+                    redis_client, client_id, {"room_id": room_id, "name": client_id}
+                )
+
+    await redis_client.flushdb()
+    await asyncio.gather(*(seed_meeting_room(i) for i in range(args.meeting_rooms)))
+
+
+async def main(args) -> None:
+    rng = random.Random(args.seed)
+    now = datetime.now()
+
+    await reset_database()
+    counts = await seed_database(args, rng, now)
+    await seed_redis(args)
+    await close_redis()
+    await engine.dispose()
+
+    manifest = {
+        "seed": args.seed,
+        "seeded_at": now.isoformat(),
+        "users": args.users,
+        "admin_user_index": 0,
+        "notices": args.notices,
+        "quests": args.quests,
+        "meeting_rooms": args.meeting_rooms,
+        "clients_per_room": args.clients_per_room,
+        "rows": counts,
+    }
+    Path(args.manifest).parent.mkdir(parents=True, exist_ok=True)
+    Path(args.manifest).write_text(json.dumps(manifest, ensure_ascii=False, indent=2))
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="벤치마크용 DB/Redis 데이터를 생성합니다. 기존 데이터는 모두 삭제됩니다."
+    )
+    parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="테이블을 지우고 다시 만드는 데 동의합니다 (필수)",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--users", type=int, default=5_000)
+    parser.add_argument("--notices", type=int, default=1_000)
+    parser.add_argument("--guestbooks", type=int, default=100_000)
+    parser.add_argument("--quests", type=int, default=20)
+    parser.add_argument("--quest-results", type=int, default=1_000_000)
+    parser.add_argument("--today-ratio", type=float, default=0.02)
+    parser.add_argument("--meeting-rooms", type=int, default=300)
+    parser.add_argument("--clients-per-room", type=int, default=6)
+    parser.add_argument("--manifest", default="benchmarks/results/seed.json")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    if not args.reset:
+        sys.exit(
+            f"{settings.aws_rds_db_host}/{settings.aws_rds_db_name}의 데이터가 "
+            "모두 삭제됩니다. 계속하려면 --reset을 붙여 실행하세요."
+        )
+
+    asyncio.run(main(args))
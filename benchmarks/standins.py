@@ -0,0 +1,102 @@
+import socket
+import subprocess
+import threading
+from contextlib import ExitStack
+from pathlib import Path
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_redis(stack: ExitStack) -> dict[str, str]:
+    """fakeredis TCP 서버를 띄우고 앱이 접속할 환경 변수를 반환합니다.
+
+    Lua 스크립트를 실행하려면 lupa가 필요합니다 (pip install "fakeredis[lua]").
+    fakeredis TCP 서버는 오류 응답을 보낸 뒤 연결을 끊는데, 그러면 register_script의
+    첫 EVALSHA가 NOSCRIPT를 받은 뒤 같은 연결로 보내는 SCRIPT LOAD가 실패하므로
+    실제 Redis처럼 오류 응답 후에도 연결을 유지하도록 핸들러를 바꿉니다.
+    """
+    from fakeredis import TcpFakeServer
+    from redis.exceptions import ResponseError
+
+    port = _free_port()
+    server = TcpFakeServer(("127.0.0.1", port))
+
+    class RequestHandler(server.RequestHandlerClass):
+        def setup(self) -> None:
+            super().setup()
+            read_response = self.current_client.read_response
+
+            def read_response_or_error():
+                try:
+                    return read_response()
+
+                except ResponseError as e:
+                    return e
+
+            self.current_client.read_response = read_response_or_error
+
+    server.RequestHandlerClass = RequestHandler
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    stack.callback(server.server_close)
+    stack.callback(server.shutdown)
+
+    return {
+        "AWS_ELASTICACHE_ENDPOINT": "127.0.0.1",
+        "AWS_ELASTICACHE_PORT": str(port),
+    }
+
+
+def start_postgres(
+    stack: ExitStack, data_dir: str, bin_dir: str | None = None
+) -> dict[str, str]:
+    """initdb/pg_ctl로 일회용 Postgres 클러스터를 띄우고 앱이 접속할 환경 변수를 반환합니다.
+
+    로컬에 설치된 Postgres 바이너리(pg_trgm 확장 포함)를 사용하며,
+    bin_dir이 없으면 PATH에서 찾습니다. data_dir이 비어 있으면 새로 초기화하고
+    종료 시 서버를 내립니다. Postgres는 root 계정으로 실행할 수 없습니다.
+    """
+    data_path = Path(data_dir).resolve()
+    initdb, pg_ctl = (
+        str(Path(bin_dir) / name) if bin_dir else name for name in ("initdb", "pg_ctl")
+    )
+
+    if not (data_path / "PG_VERSION").exists():
+        subprocess.run(
+            [initdb, "-D", data_path, "-U", "postgres", "-A", "trust", "-E", "UTF8"],
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+
+    port = _free_port()
+    subprocess.run(
+        [
+            pg_ctl,
+            "-D",
+            data_path,
+            "-l",
+            data_path / "server.log",
+            "-o",
+            f"-h 127.0.0.1 -p {port} -k {data_path}",
+            "-w",
+            "start",
+        ],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    stack.callback(
+        subprocess.run,
+        [pg_ctl, "-D", data_path, "-m", "fast", "-w", "stop"],
+        stdout=subprocess.DEVNULL,
+    )
+
+    return {
+        "AWS_RDS_DB_HOST": "127.0.0.1",
+        "AWS_RDS_DB_PORT": str(port),
+        "AWS_RDS_DB_USERNAME": "postgres",
+        "AWS_RDS_DB_PASSWORD": "",
+        "AWS_RDS_DB_NAME": "postgres",
+    }
@@ -0,0 +1,119 @@
+import argparse
+import itertools
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+
+TARGETS = ("run", "seed", "load")
+
+
+def parse_param(value: str) -> tuple[str, str, list[str]]:
+    """'seed.clients-per-room=2,6,20'을 ('seed', 'clients-per-room', [...])로 나눕니다."""
+    name, _, values = value.partition("=")
+    target, _, option = name.partition(".")
+
+    if target not in TARGETS or not option or not values:
+        raise argparse.ArgumentTypeError(
+            f"'{value}': <{'|'.join(TARGETS)}>.<옵션>=<값>,<값>... 형식이어야 합니다"
+        )
+
+    return target, option, values.split(",")
+
+
+def _run_args(point: tuple[tuple[str, str, str], ...]) -> list[str]:
+    args = []
+
+    for target, option, value in point:
+        if target == "run":
+            args.append(f"--{option}={value}")
+        else:
+            args.append(f"--{target}-arg=--{option}={value}")
+
+    return args
+
+
+def _label(point: tuple[tuple[str, str, str], ...]) -> str:
+    return ",".join(f"{option}={value}" for _, option, value in point)
+
+
+def summarize(reports: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """요청 이름별로 측정 지점마다의 RPS와 p50/p95/p99를 모읍니다."""
+    summary: dict[str, dict[str, Any]] = {}
+
+    for label, report in reports.items():
+        for request_name, result in report["results"].items():
+            summary.setdefault(request_name, {})[label] = {
+                key: result[key] for key in ("rps", "p50_ms", "p95_ms", "p99_ms")
+            }
+
+    return summary
+
+
+def main(args, run_args: list[str]) -> dict[str, Any]:
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    axes = [
+        [(target, option, value) for value in values]
+        for target, option, values in args.param
+    ]
+    reports = {}
+
+    for point in itertools.product(*axes):
+        label = _label(point)
+        output = output_dir / f"{label.replace('/', '_')}.json"
+        print(f"== {label}")
+
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.run", *run_args, *_run_args(point)]
+            + [f"--load-arg=--output={output}"],
+            check=True,
+        )
+        reports[label] = json.loads(output.read_text())
+
+    summary = summarize(reports)
+    (output_dir / "summary.json").write_text(
+        json.dumps(summary, ensure_ascii=False, indent=2)
+    )
+
+    for request_name, points in summary.items():
+        print(f"\n{request_name}")
+        for label, result in points.items():
+            print(
+                f"  {label:40} {result['rps']:>8} rps  "
+                f"p50 {result['p50_ms']:>8}ms  "
+                f"p95 {result['p95_ms']:>8}ms  "
+                f"p99 {result['p99_ms']:>8}ms"
+            )
+
+    return summary
+
+
+def parse_args(
+    argv: list[str] | None = None,
+) -> tuple[argparse.Namespace, list[str]]:
+    parser = argparse.ArgumentParser(
+        description=(
+            "--param으로 지정한 값의 모든 조합마다 benchmarks.run을 실행하고 "
+            "요청별 지연 시간을 한 표로 모읍니다. 나머지 인자는 benchmarks.run에 그대로 넘깁니다."
+        )
+    )
+    parser.add_argument(
+        "--param",
+        type=parse_param,
+        action="append",
+        required=True,
+        help=(
+            "스윕할 옵션과 값 목록 (예: seed.clients-per-room=2,6,20,50, "
+            "load.concurrency=8,32,128, run.app-ref=30ac6f2,HEAD). 여러 번 지정하면 곱집합"
+        ),
+    )
+    parser.add_argument("--output-dir", default="benchmarks/results/sweep")
+    return parser.parse_known_args(argv)
+
+
+if __name__ == "__main__":
+    main(*parse_args())
@@ -1,6 +1,9 @@
 from fastapi import Depends, HTTPException, status, Request
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from core.caches import user_cache
+from core.config import settings
 from core.databases import get_db
 from core.tokenizers import decode_access_token
 from models.users import User
@@ -8,8 +11,13 @@ from models.users import User
 
 async def get_current_user(
     request_obj: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> User:
+    user = getattr(request_obj.state, "current_user", None)
+
+    if user:
+        return user
+
     try:
         access_token = request_obj.cookies.get("access_token")
 
@@ -28,7 +36,13 @@ async def get_current_user(
                 detail="유효하지 않은 인증 정보입니다.",
             )
 
-        user = db.exec(select(User).where(User.google_id == google_id)).first()
+        user = await user_cache.get(google_id)
+
+        if user:
+            return user
+
+        result = await db.exec(select(User).where(User.google_id == google_id))
+        user = result.first()
 
         if not user:
             raise HTTPException(
@@ -36,6 +50,8 @@ async def get_current_user(
                 detail="유효하지 않은 인증 정보입니다.",
             )
 
+        await user_cache.set(google_id, user)
+
         return user
 
     except HTTPException:
@@ -46,3 +62,13 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="인증 처리 중 오류가 발생했습니다.",
         )
+
+
+async def get_admin_user(user: User = Depends(get_current_user)) -> User:
+    if user.role_level < settings.admin_role_level:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 권한이 필요합니다.",
+        )
+
+    return user
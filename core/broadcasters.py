@@ -0,0 +1,57 @@
+import asyncio
+
+from redis.exceptions import RedisError
+
+from core.config import settings
+from core.databases import redis_client
+
+
+class MeetingRoomEventBroadcaster:
+    """Redis pub/sub으로 받은 미팅룸 이벤트를 이 프로세스의 구독자들에게 나눠 줍니다.
+
+    워커마다 채널 구독은 하나만 유지하고, 웹소켓 연결마다 큐를 하나씩 둡니다.
+    다른 워커나 노드에서 발행된 이벤트도 Redis를 거쳐 모든 워커에 전달됩니다.
+    큐가 가득 찬 느린 구독자에게는 None을 보내 연결을 끊고 다시 스냅샷을 받게 합니다.
+    """
+
+    def __init__(self, queue_size: int = 256) -> None:
+        self.queue_size = queue_size
+        self._subscribers: set[asyncio.Queue] = set()
+
+    def subscribe(self) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    def publish_local(self, event: str) -> None:
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(event)
+
+            except asyncio.QueueFull:
+                self._subscribers.discard(queue)
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+
+    async def run(self) -> None:
+        while True:
+            try:
+                async with redis_client.pubsub() as pubsub:
+                    await pubsub.subscribe(settings.meeting_room_events_channel)
+
+                    while True:
+                        message = await pubsub.get_message(
+                            ignore_subscribe_messages=True, timeout=1.0
+                        )
+                        if message:
+                            self.publish_local(message["data"])
+
+            except (RedisError, OSError):
+                await asyncio.sleep(1.0)
+
+
+meeting_room_events = MeetingRoomEventBroadcaster()
@@ -0,0 +1,291 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel, ValidationError
+from redis.exceptions import RedisError
+
+from core.config import settings
+from core.databases import redis_client
+from models.users import User
+from response_schemas.users import UserProfileBatchResponse
+
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+
+class TTLCache:
+    """크기 제한(LRU)과 만료 시간(TTL)을 가진 프로세스 로컬 캐시입니다."""
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class ModelCache(Generic[ModelType]):
+    """모델 객체를 직렬화하여 보관하는 2단계(프로세스 로컬 + Redis) 캐시입니다.
+
+    model에는 SQLModel 테이블 모델이나 응답 스키마를 지정할 수 있으며,
+    다른 타입의 객체를 저장하면 속성을 읽어 model로 변환한 뒤 보관합니다.
+
+    로컬 캐시에서 찾지 못하면 Redis 계층을 조회하고, Redis 오류는 캐시 미스로 처리합니다.
+    조회할 때마다 새 객체를 만들어 반환하므로 세션 간에 객체가 공유되지 않습니다.
+    저장된 데이터가 모델 검증에 실패하면 해당 항목을 버리고 캐시 미스로 처리합니다.
+    무효화는 캐시 무효화 채널로도 발행되어 다른 워커의 로컬 캐시에서도 지워집니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        model: type[ModelType],
+        key_template: str,
+        key_field: str,
+        max_size: int,
+        ttl_seconds: float,
+        redis_enabled: bool = False,
+    ) -> None:
+        self.name = name
+        self.model = model
+        self.key_template = key_template
+        self.key_field = key_field
+        self.ttl_seconds = ttl_seconds
+        self.redis_enabled = redis_enabled
+        self.redis_hits = 0
+        self.redis_misses = 0
+        self._local = TTLCache(max_size, ttl_seconds)
+
+    def _redis_key(self, key: str) -> str:
+        return self.key_template.format(**{self.key_field: key})
+
+    def _to_model(self, obj: Any) -> ModelType:
+        if isinstance(obj, self.model):
+            return obj
+
+        return self.model.model_validate(obj, from_attributes=True)
+
+    def _validate(self, key: str, data: Any) -> ModelType | None:
+        try:
+            return self.model.model_validate(data)
+
+        except ValidationError:
+            self._local.invalidate(key)
+            return None
+
+    async def get(self, key: str) -> ModelType | None:
+        data = self._local.get(key)
+
+        if data is None and self.redis_enabled:
+            try:
+                raw = await redis_client.get(self._redis_key(key))
+            except RedisError:
+                raw = None
+
+            if raw is None:
+                self.redis_misses += 1
+            else:
+                self.redis_hits += 1
+                data = json.loads(raw)
+                self._local.set(key, data)
+
+        if data is None:
+            return None
+
+        return self._validate(key, data)
+
+    async def get_many(self, keys: list[str]) -> dict[str, ModelType]:
+        """여러 키를 한 번에 조회합니다. 로컬 캐시에 없는 키는 Redis MGET 한 번으로 조회합니다."""
+        found = {}
+        missing = []
+
+        for key in keys:
+            data = self._local.get(key)
+
+            if data is None:
+                missing.append(key)
+            else:
+                found[key] = data
+
+        if missing and self.redis_enabled:
+            try:
+                raws = await redis_client.mget(
+                    [self._redis_key(key) for key in missing]
+                )
+            except RedisError:
+                raws = [None] * len(missing)
+
+            for key, raw in zip(missing, raws):
+                if raw is None:
+                    self.redis_misses += 1
+                    continue
+
+                self.redis_hits += 1
+                found[key] = json.loads(raw)
+                self._local.set(key, found[key])
+
+        objs = {key: self._validate(key, data) for key, data in found.items()}
+        return {key: obj for key, obj in objs.items() if obj is not None}
+
+    async def set(self, key: str, obj: Any) -> ModelType:
+        cached = self._to_model(obj)
+        data = cached.model_dump(mode="json")
+        self._local.set(key, data)
+
+        if self.redis_enabled:
+            try:
+                await redis_client.set(
+                    self._redis_key(key), json.dumps(data), ex=int(self.ttl_seconds)
+                )
+            except RedisError:
+                pass
+
+        return cached
+
+    async def set_many(self, objs: dict[str, Any]) -> dict[str, ModelType]:
+        cached = {key: self._to_model(obj) for key, obj in objs.items()}
+        entries = {key: obj.model_dump(mode="json") for key, obj in cached.items()}
+
+        for key, data in entries.items():
+            self._local.set(key, data)
+
+        if self.redis_enabled and entries:
+            try:
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    for key, data in entries.items():
+                        pipe.set(
+                            self._redis_key(key),
+                            json.dumps(data),
+                            ex=int(self.ttl_seconds),
+                        )
+                    await pipe.execute()
+            except RedisError:
+                pass
+
+        return cached
+
+    async def invalidate(self, key: str) -> None:
+        self._local.invalidate(key)
+
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                if self.redis_enabled:
+                    pipe.delete(self._redis_key(key))
+                pipe.publish(
+                    settings.cache_invalidation_channel,
+                    json.dumps({"cache": self.name, "key": key}),
+                )
+                await pipe.execute()
+        except RedisError:
+            pass
+
+    def invalidate_local(self, key: str | None = None) -> None:
+        if key is None:
+            self._local.clear()
+        else:
+            self._local.invalidate(key)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "local": self._local.stats(),
+            "redis": {
+                "enabled": self.redis_enabled,
+                "hits": self.redis_hits,
+                "misses": self.redis_misses,
+            },
+        }
+
+
+user_cache: ModelCache[User] = ModelCache(
+    "user",
+    User,
+    key_template=settings.user_cache_key_template,
+    key_field="google_id",
+    max_size=settings.user_cache_max_size,
+    ttl_seconds=settings.user_cache_ttl_seconds,
+    redis_enabled=settings.user_cache_redis_enabled,
+)
+
+
+profile_cache: ModelCache[UserProfileBatchResponse] = ModelCache(
+    "profile",
+    UserProfileBatchResponse,
+    key_template=settings.profile_cache_key_template,
+    key_field="google_id",
+    max_size=settings.profile_cache_max_size,
+    ttl_seconds=settings.profile_cache_ttl_seconds,
+    redis_enabled=settings.profile_cache_redis_enabled,
+)
+
+
+async def listen_for_cache_invalidations() -> None:
+    """다른 워커가 발행한 캐시 무효화를 받아 이 프로세스의 로컬 캐시에서 지웁니다.
+
+    구독이 끊긴 동안의 무효화는 받을 수 없으므로, 구독할 때마다
+    로컬 캐시를 모두 비우고 시작합니다.
+    """
+    caches = {cache.name: cache for cache in (user_cache, profile_cache)}
+
+    while True:
+        try:
+            async with redis_client.pubsub() as pubsub:
+                await pubsub.subscribe(settings.cache_invalidation_channel)
+
+                for cache in caches.values():
+                    cache.invalidate_local()
+
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=1.0
+                    )
+                    if not message:
+                        continue
+
+                    invalidation = json.loads(message["data"])
+                    cache = caches.get(invalidation.get("cache"))
+                    if cache is not None:
+                        cache.invalidate_local(invalidation.get("key"))
+
+        except (RedisError, OSError):
+            for cache in caches.values():
+                cache.invalidate_local()
+            await asyncio.sleep(1.0)
@@ -0,0 +1,96 @@
+import asyncio
+import logging
+
+from pydantic import ValidationError
+from sqlmodel import select
+
+from core.config import settings
+from core.databases import async_session, redis_client
+from models.quests import Quest
+from response_schemas.quests import QuestResponse
+
+
+logger = logging.getLogger(__name__)
+
+
+class QuestCatalog:
+    """문제 정보를 JSON 바이트로 미리 직렬화해 두는 프로세스 로컬 카탈로그입니다.
+
+    Redis의 버전 키가 바뀌면 다시 적재하므로, 관리자가 문제를 수정한 뒤
+    버전을 올리면 모든 워커가 다음 갱신 주기에 새 내용을 반영합니다.
+    응답 스키마로 검증되지 않는 문제는 건너뛰고 로그를 남기며, 적재에 실패한
+    상태에서는 조회 시점과 다음 갱신 주기에 다시 적재를 시도합니다.
+    """
+
+    def __init__(self) -> None:
+        self.version: str | None = None
+        self.loaded = False
+        self._payloads: dict[int, bytes] = {}
+        self._load_lock = asyncio.Lock()
+
+    def get(self, quest_number: int) -> bytes | None:
+        return self._payloads.get(quest_number)
+
+    async def get_or_load(self, quest_number: int) -> bytes | None:
+        if not self.loaded:
+            async with self._load_lock:
+                if not self.loaded:
+                    try:
+                        await self.load(self.version)
+                    except Exception:
+                        logger.exception("문제 카탈로그를 적재하지 못했습니다.")
+
+        return self.get(quest_number)
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+    async def load(self, version: str | None = None) -> None:
+        async with async_session() as db:
+            result = await db.exec(select(Quest))
+            quests = result.all()
+
+        payloads = {}
+        for quest in quests:
+            try:
+                payloads[quest.quest_number] = (
+                    QuestResponse.model_validate(quest.model_dump())
+                    .model_dump_json()
+                    .encode()
+                )
+            except ValidationError:
+                logger.warning(
+                    "문제 %s번을 카탈로그에서 제외합니다.",
+                    quest.quest_number,
+                    exc_info=True,
+                )
+
+        self._payloads = payloads
+        self.version = version
+        self.loaded = True
+
+    async def reload(self) -> str:
+        version = str(await redis_client.incr(settings.quest_catalog_version_key))
+        await self.load(version)
+        return version
+
+    async def refresh_if_changed(self) -> None:
+        version = await redis_client.get(settings.quest_catalog_version_key)
+
+        if not self.loaded or version != self.version:
+            await self.load(version)
+
+
+quest_catalog = QuestCatalog()
+
+
+async def refresh_quest_catalog() -> None:
+    """카탈로그 버전을 주기적으로 확인하여 바뀌었으면 다시 적재합니다."""
+    while True:
+        await asyncio.sleep(settings.quest_catalog_refresh_interval)
+
+        try:
+            await quest_catalog.refresh_if_changed()
+
+        except Exception:
+            logger.exception("문제 카탈로그를 갱신하지 못했습니다.")
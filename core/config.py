@@ -16,6 +16,7 @@ class Settings(BaseSettings):
     secret_key: str = Field(..., env="SECRET_KEY")
     algorithm: str = Field(..., env="ALGORITHM")
     access_token_expire_hours: int = Field(..., env="ACCESS_TOKEN_EXPIRE_HOURS")
+    admin_role_level: int = Field(1, env="ADMIN_ROLE_LEVEL")
 
     db_pool_size: int = Field(..., env="DB_POOL_SIZE")
     db_max_overflow: int = Field(..., env="DB_MAX_OVERFLOW")
@@ -37,6 +38,49 @@ class Settings(BaseSettings):
     redis_socket_connect_timeout: float = Field(2.0, env="REDIS_SOCKET_CONNECT_TIMEOUT")
     redis_retry_on_timeout: bool = Field(True, env="REDIS_RETRY_ON_TIMEOUT")
     redis_max_connections: int = Field(10, env="REDIS_MAX_CONNECTIONS")
+    redis_health_check_interval: float = Field(30.0, env="REDIS_HEALTH_CHECK_INTERVAL")
+
+    user_cache_max_size: int = Field(1024, env="USER_CACHE_MAX_SIZE")
+    user_cache_ttl_seconds: float = Field(60.0, env="USER_CACHE_TTL_SECONDS")
+    user_cache_redis_enabled: bool = Field(False, env="USER_CACHE_REDIS_ENABLED")
+    user_cache_key_template: str = Field(
+        "user_cache:{google_id}", env="USER_CACHE_KEY_TEMPLATE"
+    )
+    cache_invalidation_channel: str = Field(
+        "cache_invalidations", env="CACHE_INVALIDATION_CHANNEL"
+    )
+    profile_cache_max_size: int = Field(4096, env="PROFILE_CACHE_MAX_SIZE")
+    profile_cache_ttl_seconds: float = Field(300.0, env="PROFILE_CACHE_TTL_SECONDS")
+    profile_cache_redis_enabled: bool = Field(False, env="PROFILE_CACHE_REDIS_ENABLED")
+    profile_cache_key_template: str = Field(
+        "profile_cache:{google_id}", env="PROFILE_CACHE_KEY_TEMPLATE"
+    )
+    batch_max_requests: int = Field(20, env="BATCH_MAX_REQUESTS")
+    batch_max_concurrency: int = Field(5, env="BATCH_MAX_CONCURRENCY")
+    write_behind_max_size: int = Field(10000, env="WRITE_BEHIND_MAX_SIZE")
+    write_behind_batch_size: int = Field(500, env="WRITE_BEHIND_BATCH_SIZE")
+    write_behind_flush_interval: float = Field(1.0, env="WRITE_BEHIND_FLUSH_INTERVAL")
+    write_behind_max_retries: int = Field(3, env="WRITE_BEHIND_MAX_RETRIES")
+    write_behind_retry_backoff: float = Field(0.5, env="WRITE_BEHIND_RETRY_BACKOFF")
+    write_behind_max_retry_backoff: float = Field(
+        30.0, env="WRITE_BEHIND_MAX_RETRY_BACKOFF"
+    )
+    write_behind_dead_letter_key: str = Field(
+        "write_behind:dead_letters", env="WRITE_BEHIND_DEAD_LETTER_KEY"
+    )
+    write_behind_dead_letter_max_length: int = Field(
+        10000, env="WRITE_BEHIND_DEAD_LETTER_MAX_LENGTH"
+    )
+    query_diagnostics_enabled: bool = Field(False, env="QUERY_DIAGNOSTICS_ENABLED")
+    slow_query_threshold_ms: float = Field(200.0, env="SLOW_QUERY_THRESHOLD_MS")
+    slow_query_explain: bool = Field(True, env="SLOW_QUERY_EXPLAIN")
+    n_plus_one_threshold: int = Field(10, env="N_PLUS_ONE_THRESHOLD")
+    profiling_enabled: bool = Field(False, env="PROFILING_ENABLED")
+    profiling_header: str = Field("X-Profile", env="PROFILING_HEADER")
+    profiling_sample_rate: float = Field(0.0, env="PROFILING_SAMPLE_RATE")
+    profiling_interval: float = Field(0.001, env="PROFILING_INTERVAL")
+    profiling_dir: str = Field("/tmp/profiles", env="PROFILING_DIR")
+    profiling_max_files: int = Field(100, env="PROFILING_MAX_FILES")
 
     rooms_key_template: str = Field(..., env="ROOMS_KEY_TEMPLATE")
     client_key_template: str = Field(..., env="CLIENT_KEY_TEMPLATE")
@@ -44,9 +88,44 @@ class Settings(BaseSettings):
         ..., env="DISCONNECTED_CLIENT_KEY_TEMPLATE"
     )
     meeting_room_key_template: str = Field(..., env="MEETING_ROOM_KEY_TEMPLATE")
+    meeting_room_registry_key: str = Field(
+        "meeting_rooms", env="MEETING_ROOM_REGISTRY_KEY"
+    )
+    meeting_room_events_channel: str = Field(
+        "meeting_room_events", env="MEETING_ROOM_EVENTS_CHANNEL"
+    )
+    meeting_room_chat_max_length: int = Field(1000, env="MEETING_ROOM_CHAT_MAX_LENGTH")
+    presence_key: str = Field("meeting_room_presence", env="PRESENCE_KEY")
+    presence_rooms_key: str = Field(
+        "meeting_room_presence_rooms", env="PRESENCE_ROOMS_KEY"
+    )
+    presence_ttl_seconds: int = Field(30, env="PRESENCE_TTL_SECONDS")
+    presence_grace_seconds: int = Field(120, env="PRESENCE_GRACE_SECONDS")
+    presence_reaper_interval: float = Field(10.0, env="PRESENCE_REAPER_INTERVAL")
+    presence_reaper_batch_size: int = Field(500, env="PRESENCE_REAPER_BATCH_SIZE")
+    quest_leaderboard_key_template: str = Field(
+        "quest_leaderboard:{quest_number}:{date}",
+        env="QUEST_LEADERBOARD_KEY_TEMPLATE",
+    )
+    quest_leaderboard_ttl_seconds: int = Field(
+        2 * 24 * 60 * 60, env="QUEST_LEADERBOARD_TTL_SECONDS"
+    )
+    quest_catalog_version_key: str = Field(
+        "quest_catalog:version", env="QUEST_CATALOG_VERSION_KEY"
+    )
+    quest_catalog_refresh_interval: float = Field(
+        30.0, env="QUEST_CATALOG_REFRESH_INTERVAL"
+    )
+    notice_cache_version_key: str = Field(
+        "notice_cache:version", env="NOTICE_CACHE_VERSION_KEY"
+    )
+    notice_cache_key_template: str = Field(
+        "notice_cache:{version}:{resource}", env="NOTICE_CACHE_KEY_TEMPLATE"
+    )
+    notice_cache_ttl_seconds: int = Field(300, env="NOTICE_CACHE_TTL_SECONDS")
 
     def get_db_url(self) -> str:
-        return f"postgresql://{self.aws_rds_db_username}:{self.aws_rds_db_password}@{self.aws_rds_db_host}:{self.aws_rds_db_port}/{self.aws_rds_db_name}"
+        return f"postgresql+asyncpg://{self.aws_rds_db_username}:{self.aws_rds_db_password}@{self.aws_rds_db_host}:{self.aws_rds_db_port}/{self.aws_rds_db_name}"
 
     @property
     def db_url(self) -> str:
@@ -1,20 +1,29 @@
-from typing import Generator, AsyncGenerator
+import asyncio
+from datetime import datetime
+from typing import Any, AsyncGenerator
 
-from redis.asyncio import Redis
-from sqlmodel import Session, create_engine
+from redis.asyncio import ConnectionPool, Redis
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from core.config import settings
+from core.diagnostics import QueryTracker, install_query_diagnostics, query_tracker
+from core.metrics import InstrumentedRedis, instrument_engine
 
 
-engine = create_engine(
+engine = create_async_engine(
     settings.db_url,
     pool_pre_ping=True,
     pool_size=settings.db_pool_size,
     max_overflow=settings.db_max_overflow,
     pool_timeout=settings.db_pool_timeout,
 )
+instrument_engine(engine)
+install_query_diagnostics(engine)
 
-redis_client = Redis(
+async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+redis_pool = ConnectionPool(
     host=settings.aws_elasticache_endpoint,
     port=settings.aws_elasticache_port,
     decode_responses=True,
@@ -24,15 +33,68 @@ redis_client = Redis(
     max_connections=settings.redis_max_connections,
 )
 
+redis_client = InstrumentedRedis(connection_pool=redis_pool)
+
+redis_health: dict[str, Any] = {
+    "healthy": False,
+    "last_checked_at": None,
+    "last_error": None,
+}
+
+
+async def check_redis_health() -> None:
+    """Redis 상태를 주기적으로 확인하여 redis_health에 기록합니다.
+
+    요청마다 PING을 보내는 대신 앱 lifespan 동안 백그라운드 태스크로 실행됩니다.
+    """
+    while True:
+        try:
+            await redis_client.ping()
+            redis_health.update(healthy=True, last_error=None)
+
+        except Exception as e:
+            redis_health.update(healthy=False, last_error=repr(e))
+
+        redis_health["last_checked_at"] = datetime.now()
+        await asyncio.sleep(settings.redis_health_check_interval)
+
+
+def get_redis_pool_stats() -> dict[str, int]:
+    """Redis 커넥션 풀 사용 현황을 반환합니다."""
+    available = len(redis_pool._available_connections)
+    in_use = len(redis_pool._in_use_connections)
+
+    return {
+        "max_connections": redis_pool.max_connections,
+        "created_connections": available + in_use,
+        "available_connections": available,
+        "in_use_connections": in_use,
+    }
+
+
+async def close_redis() -> None:
+    await redis_client.aclose()
+    await redis_pool.aclose()
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    async with async_session() as session:
+        if not settings.query_diagnostics_enabled:
+            yield session
+            return
+
+        # query_budget()이 이미 설치한 추적기가 있으면 그대로 이어서 셉니다.
+        tracker = query_tracker.get()
+        if tracker is None:
+            tracker = QueryTracker()
+            query_tracker.set(tracker)
+
+        try:
+            yield session
 
-def get_db() -> Generator[Session, None, None]:
-    with Session(engine) as session:
-        yield session
+        finally:
+            tracker.report()
 
 
 async def get_redis() -> AsyncGenerator[Redis, None]:
-    try:
-        await redis_client.ping()
-        yield redis_client
-    finally:
-        await redis_client.close()
+    yield redis_client
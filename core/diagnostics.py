@@ -0,0 +1,161 @@
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+_PARAMETER_PATTERN = re.compile(r"\$\d+")
+_PARAMETER_LIST_PATTERN = re.compile(r"\?(?:\s*,\s*\?)+")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_EXPLAIN_SAVEPOINT = "query_diagnostics_explain"
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def normalize_statement(statement: str) -> str:
+    """파라미터 번호와 IN 목록 길이가 달라도 같은 모양의 쿼리로 묶이도록 정규화합니다."""
+    statement = _PARAMETER_PATTERN.sub("?", statement)
+    statement = _PARAMETER_LIST_PATTERN.sub("?", statement)
+    return _WHITESPACE_PATTERN.sub(" ", statement).strip()
+
+
+class QueryTracker:
+    """세션 하나(또는 query_budget 블록 하나)에서 실행된 쿼리를 모양별로 셉니다."""
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.shapes: Counter[str] = Counter()
+
+    def record(self, statement: str) -> None:
+        self.total += 1
+        self.shapes[normalize_statement(statement)] += 1
+
+    def repeated_shapes(self, threshold: int) -> list[tuple[str, int]]:
+        return [
+            (shape, count) for shape, count in self.shapes.items() if count > threshold
+        ]
+
+    def report(self) -> None:
+        for shape, count in self.repeated_shapes(settings.n_plus_one_threshold):
+            logger.warning(
+                "N+1 쿼리 의심: 같은 쿼리가 %d회 실행되었습니다: %s", count, shape
+            )
+
+
+query_tracker: ContextVar[QueryTracker | None] = ContextVar(
+    "query_tracker", default=None
+)
+
+
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[QueryTracker]:
+    """블록 안에서 실행된 쿼리가 max_queries개를 넘으면 QueryBudgetExceeded를 발생시킵니다.
+
+    테스트에서 엔드포인트별 쿼리 수 상한을 고정하는 용도입니다.
+
+    Example:
+        >>> with query_budget(3):
+        ...     client.get("/users")
+    """
+    tracker = QueryTracker()
+    token = query_tracker.set(tracker)
+
+    try:
+        yield tracker
+
+    finally:
+        query_tracker.reset(token)
+
+    if tracker.total > max_queries:
+        shapes = "\n".join(
+            f"  {count}x {shape}" for shape, count in tracker.shapes.most_common()
+        )
+        raise QueryBudgetExceeded(
+            f"쿼리 {tracker.total}개가 실행되어 예산 {max_queries}개를 넘었습니다.\n{shapes}"
+        )
+
+
+def _explain(conn, statement: str, parameters) -> str | None:
+    cursor = conn.connection.dbapi_connection.cursor()
+
+    try:
+        cursor.execute(f"SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+
+        try:
+            cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+            plan = "\n".join(str(row[0]) for row in cursor.fetchall())
+            cursor.execute(f"RELEASE SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+            return plan
+
+        except Exception:
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+            return None
+
+    except Exception:
+        return None
+
+    finally:
+        cursor.close()
+
+
+def install_query_diagnostics(engine: AsyncEngine) -> None:
+    """쿼리 추적과 느린 쿼리 로그를 위한 SQLAlchemy 이벤트를 등록합니다.
+
+    쿼리 추적은 query_tracker가 설정된 경우에만 동작하며,
+    느린 쿼리 로그는 query_diagnostics_enabled일 때만 남습니다.
+    EXPLAIN ANALYZE는 쿼리를 한 번 더 실행하므로 SELECT 문에만,
+    같은 트랜잭션 안의 savepoint에서 별도 커서로 실행합니다.
+    """
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        conn.info.setdefault("diagnostics_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        elapsed_ms = (
+            time.perf_counter() - conn.info["diagnostics_started_at"].pop()
+        ) * 1000
+
+        tracker = query_tracker.get()
+        if tracker is not None:
+            tracker.record(statement)
+
+        if (
+            not settings.query_diagnostics_enabled
+            or elapsed_ms < settings.slow_query_threshold_ms
+        ):
+            return
+
+        plan = None
+        if (
+            settings.slow_query_explain
+            and not many
+            and statement.lstrip()[:6].upper() == "SELECT"
+        ):
+            plan = _explain(conn, statement, parameters)
+
+        logger.warning(
+            "느린 쿼리 (%.1fms): %s%s",
+            elapsed_ms,
+            normalize_statement(statement),
+            f"\n{plan}" if plan else "",
+        )
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("diagnostics_started_at"):
+            conn.info["diagnostics_started_at"].pop()
@@ -0,0 +1,184 @@
+import time
+from contextvars import ContextVar
+
+from prometheus_client import Counter, Histogram
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    ["method", "route", "status"],
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "DB 쿼리 실행 시간",
+    ["operation"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request",
+    "요청 하나에서 실행된 DB 쿼리 수",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+REDIS_COMMAND_DURATION = Histogram(
+    "redis_command_duration_seconds",
+    "Redis 명령 실행 시간 (pipeline은 한 번으로 집계)",
+    ["command"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+REDIS_COMMAND_ERRORS = Counter(
+    "redis_command_errors_total",
+    "실패한 Redis 명령 수",
+    ["command"],
+)
+
+
+class RequestTimings:
+    """요청 하나 동안 누적되는 DB/Redis 호출 횟수와 시간입니다.
+
+    요청 시작 시 contextvar에 넣어 두면, 같은 요청에서 만들어진 태스크들도
+    같은 객체를 참조하므로 하위 태스크의 호출까지 함께 집계됩니다.
+    """
+
+    def __init__(self) -> None:
+        self.started_at = time.perf_counter()
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        self.redis_calls = 0
+        self.redis_seconds = 0.0
+
+    def server_timing(self) -> str:
+        total_ms = (time.perf_counter() - self.started_at) * 1000
+        return ", ".join(
+            [
+                f'db;dur={self.db_seconds * 1000:.1f};desc="{self.db_queries} queries"',
+                f'redis;dur={self.redis_seconds * 1000:.1f};desc="{self.redis_calls} calls"',
+                f"total;dur={total_ms:.1f}",
+            ]
+        )
+
+
+request_timings: ContextVar[RequestTimings | None] = ContextVar(
+    "request_timings", default=None
+)
+
+
+class RequestMetricsMiddleware:
+    """요청마다 처리 시간과 DB 쿼리 수를 기록하는 ASGI 미들웨어입니다.
+
+    응답을 시작할 때 라우트별 히스토그램에 기록하고, 같은 값을
+    Server-Timing 헤더로 돌려줍니다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+
+        async def send_with_metrics(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                route_path = getattr(scope.get("route"), "path", "unmatched")
+                HTTP_REQUEST_DURATION.labels(
+                    scope["method"], route_path, message["status"]
+                ).observe(time.perf_counter() - timings.started_at)
+                DB_QUERIES_PER_REQUEST.labels(route_path).observe(timings.db_queries)
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"server-timing", timings.server_timing().encode("latin-1")),
+                ]
+
+            await send(message)
+
+        token = request_timings.set(timings)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+
+        finally:
+            request_timings.reset(token)
+
+
+def _record_redis_call(command: str, started_at: float, failed: bool) -> None:
+    elapsed = time.perf_counter() - started_at
+    REDIS_COMMAND_DURATION.labels(command).observe(elapsed)
+
+    if failed:
+        REDIS_COMMAND_ERRORS.labels(command).inc()
+
+    timings = request_timings.get()
+    if timings is not None:
+        timings.redis_calls += 1
+        timings.redis_seconds += elapsed
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """엔진의 모든 쿼리 실행 시간을 측정하도록 SQLAlchemy 이벤트를 등록합니다."""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        elapsed = time.perf_counter() - conn.info["query_started_at"].pop()
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement else ""
+        DB_QUERY_DURATION.labels(operation).observe(elapsed)
+
+        timings = request_timings.get()
+        if timings is not None:
+            timings.db_queries += 1
+            timings.db_seconds += elapsed
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_started_at"):
+            conn.info["query_started_at"].pop()
+
+
+class InstrumentedPipeline(Pipeline):
+    async def execute(self, raise_on_error: bool = True):
+        started_at = time.perf_counter()
+        failed = True
+
+        try:
+            result = await super().execute(raise_on_error)
+            failed = False
+            return result
+
+        finally:
+            _record_redis_call("PIPELINE", started_at, failed)
+
+
+class InstrumentedRedis(Redis):
+    """명령마다 실행 시간을 기록하는 Redis 클라이언트입니다."""
+
+    async def execute_command(self, *args, **options):
+        started_at = time.perf_counter()
+        failed = True
+
+        try:
+            result = await super().execute_command(*args, **options)
+            failed = False
+            return result
+
+        finally:
+            _record_redis_call(str(args[0]).upper(), started_at, failed)
+
+    def pipeline(
+        self, transaction: bool = True, shard_hint: str | None = None
+    ) -> InstrumentedPipeline:
+        return InstrumentedPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
@@ -0,0 +1,41 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, Sequence
+
+from fastapi import HTTPException, status
+
+
+DEFAULT_PAGE_LIMIT = 20
+MAX_PAGE_LIMIT = 100
+MAX_SEARCH_OFFSET = 1000
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    raw = f"{created_at.isoformat()}|{id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(id)
+
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 커서입니다.",
+        )
+
+
+def build_page(rows: Sequence[Any], limit: int) -> dict[str, Any]:
+    """limit + 1개로 조회한 결과를 한 페이지와 다음 페이지 커서로 나눕니다."""
+    items = list(rows[:limit])
+    next_cursor = None
+
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+
+    return {"items": items, "next_cursor": next_cursor}
@@ -0,0 +1,25 @@
+import asyncio
+import logging
+
+from core.config import settings
+from core.databases import redis_client
+from crud.meetings import reap_stale_clients
+
+
+logger = logging.getLogger(__name__)
+
+
+async def reap_stale_clients_periodically() -> None:
+    """하트비트가 끊긴 클라이언트를 주기적으로 미팅룸에서 제거합니다."""
+    while True:
+        await asyncio.sleep(settings.presence_reaper_interval)
+
+        try:
+            while (
+                await reap_stale_clients(redis_client)
+                >= settings.presence_reaper_batch_size
+            ):
+                pass
+
+        except Exception:
+            logger.exception("하트비트가 끊긴 클라이언트를 정리하지 못했습니다.")
@@ -0,0 +1,142 @@
+import asyncio
+import json
+import random
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+from fastapi import HTTPException
+from pyinstrument import Profiler
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.authizations import get_current_user
+from core.config import settings
+from core.databases import async_session
+
+
+PROFILE_ID_PATTERN = r"^\d+-[0-9a-f]{8}$"
+
+
+class ProfileStore:
+    """프로파일 결과(HTML)와 메타데이터(JSON)를 디스크에 보관합니다.
+
+    max_files개를 넘으면 오래된 프로파일부터 삭제합니다.
+    """
+
+    def __init__(self, directory: str, max_files: int) -> None:
+        self.directory = Path(directory)
+        self.max_files = max_files
+
+    def html_path(self, profile_id: str) -> Path:
+        return self.directory / f"{profile_id}.html"
+
+    def _save(self, profile_id: str, html: str, metadata: dict[str, Any]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.html_path(profile_id).write_text(html)
+        (self.directory / f"{profile_id}.json").write_text(json.dumps(metadata))
+
+        for stale in sorted(self.directory.glob("*.json"))[: -self.max_files]:
+            stale.unlink(missing_ok=True)
+            self.html_path(stale.stem).unlink(missing_ok=True)
+
+    async def save(self, profile_id: str, html: str, metadata: dict[str, Any]) -> None:
+        await asyncio.to_thread(self._save, profile_id, html, metadata)
+
+    def _list(self) -> list[dict[str, Any]]:
+        if not self.directory.exists():
+            return []
+
+        return [
+            json.loads(path.read_text())
+            for path in sorted(self.directory.glob("*.json"), reverse=True)
+        ]
+
+    async def list(self) -> list[dict[str, Any]]:
+        return await asyncio.to_thread(self._list)
+
+
+profile_store = ProfileStore(settings.profiling_dir, settings.profiling_max_files)
+
+
+async def _is_admin_request(scope: Scope) -> bool:
+    async with async_session() as db:
+        try:
+            user = await get_current_user(Request(scope), db)
+
+        except HTTPException:
+            return False
+
+    return user.role_level >= settings.admin_role_level
+
+
+class ProfilingMiddleware:
+    """요청 하나를 pyinstrument로 프로파일링하는 ASGI 미들웨어입니다.
+
+    관리자가 profiling_header를 붙여 보낸 요청이나 profiling_sample_rate 확률로
+    뽑힌 요청만 프로파일링하며, 결과는 profile_store에 저장됩니다.
+    헤더로 요청한 경우 응답의 같은 헤더에 프로파일 ID를 돌려줍니다.
+    profiling_enabled일 때만 등록되므로, 꺼져 있으면 비용이 없습니다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.header = settings.profiling_header.lower().encode("latin-1")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        requested = any(name == self.header for name, _ in scope["headers"])
+
+        if requested:
+            trigger = "header" if await _is_admin_request(scope) else None
+        elif random.random() < settings.profiling_sample_rate:
+            trigger = "sample"
+        else:
+            trigger = None
+
+        if trigger is None:
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = f"{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}"
+        status_code = None
+
+        async def send_with_profile_id(message: Message) -> None:
+            nonlocal status_code
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+                if trigger == "header":
+                    message["headers"] = [
+                        *message.get("headers", []),
+                        (self.header, profile_id.encode()),
+                    ]
+
+            await send(message)
+
+        profiler = Profiler(interval=settings.profiling_interval, async_mode="enabled")
+        profiler.start()
+
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+
+        finally:
+            profiler.stop()
+            await profile_store.save(
+                profile_id,
+                profiler.output_html(),
+                {
+                    "profile_id": profile_id,
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status_code,
+                    "trigger": trigger,
+                    "duration_ms": round(profiler.last_session.duration * 1000, 1),
+                    "created_at": int(profile_id.split("-", 1)[0]),
+                },
+            )
@@ -0,0 +1,102 @@
+import hashlib
+import logging
+import secrets
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response, status
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+
+logger = logging.getLogger(__name__)
+
+
+def _new_cache_version() -> int:
+    # 키가 flush나 eviction으로 사라진 뒤 예전 ETag와 겹치지 않도록 무작위 값에서 시작합니다.
+    return secrets.randbelow(2**62)
+
+
+async def get_cache_version(redis: Redis, version_key: str) -> str:
+    version = await redis.get(version_key)
+
+    if version is None:
+        await redis.set(version_key, _new_cache_version(), nx=True)
+        version = await redis.get(version_key)
+
+    return version
+
+
+async def bump_cache_version(redis: Redis, version_key: str) -> None:
+    """버전을 올려 캐시된 응답을 무효화합니다.
+
+    쓰기가 이미 커밋된 뒤에 호출되므로 Redis 오류는 로그만 남기고 무시합니다.
+    이 경우 이전 응답은 TTL이 지날 때까지 제공될 수 있습니다.
+    """
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.set(version_key, _new_cache_version(), nx=True)
+            pipe.incr(version_key)
+            await pipe.execute()
+
+    except RedisError:
+        logger.warning("캐시 버전을 올리지 못했습니다: %s", version_key, exc_info=True)
+
+
+def build_etag(version: str, resource: str) -> str:
+    digest = hashlib.sha1(f"{version}:{resource}".encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+
+    if not if_none_match:
+        return False
+
+    return any(tag.strip() in (etag, "*") for tag in if_none_match.split(","))
+
+
+async def get_versioned_json_response(
+    request: Request,
+    redis: Redis,
+    version_key: str,
+    key_template: str,
+    ttl_seconds: int,
+    resource: str,
+    build_payload: Callable[[], Awaitable[str]],
+) -> Response:
+    """버전 카운터로 무효화되는 JSON 응답 캐시를 조회하거나 채웁니다.
+
+    ETag는 버전과 리소스 식별자로만 계산되므로, If-None-Match가 일치하면
+    DB 조회나 직렬화 없이 304를 반환합니다. 캐시에 없으면 build_payload로
+    응답 본문을 만들어 저장합니다. 버전이 오르면 이전 항목은 TTL로 만료됩니다.
+    Redis 오류는 캐시 미스로 처리하며, 버전을 읽지 못하면 ETag 없이 응답합니다.
+    """
+    try:
+        version = await get_cache_version(redis, version_key)
+
+    except RedisError:
+        return Response(content=await build_payload(), media_type="application/json")
+
+    etag = build_etag(version, resource)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if is_not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    cache_key = key_template.format(version=version, resource=resource)
+
+    try:
+        payload = await redis.get(cache_key)
+    except RedisError:
+        payload = None
+
+    if payload is None:
+        payload = await build_payload()
+
+        try:
+            await redis.set(cache_key, payload, ex=ttl_seconds)
+        except RedisError:
+            pass
+
+    return Response(content=payload, media_type="application/json", headers=headers)
@@ -0,0 +1,269 @@
+import asyncio
+import json
+import logging
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Awaitable, Callable
+
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from core.config import settings
+from core.databases import async_session, redis_client
+
+
+logger = logging.getLogger(__name__)
+
+FlushHandler = Callable[[AsyncSession, list[Any]], Awaitable[None]]
+
+# 다시 시도해도 같은 결과가 나오는, 특정 항목의 데이터 때문에 생기는 오류입니다.
+DATA_ERRORS = (IntegrityError, DataError)
+
+
+class WriteBehindQueue:
+    """요청 경로에서 미뤄도 되는 DB 쓰기를 모아 백그라운드에서 일괄 처리하는 큐입니다.
+
+    항목은 (flush 핸들러, 데이터) 쌍으로 들어오며, 워커가 batch_size개 또는
+    flush_interval초 단위로 모아 핸들러별로 한 번씩 호출합니다. 핸들러는 받은
+    데이터를 bulk UPDATE나 multi-row INSERT 한 번으로 처리합니다.
+    큐가 가득 찼거나 종료 중이면 enqueue가 False를 반환하므로,
+    호출하는 쪽에서 동기적으로 쓰기를 수행해야 합니다.
+
+    무결성/데이터 오류(DATA_ERRORS)로 실패한 배치는 항목을 하나씩 처리해
+    문제가 되는 항목만 골라냅니다. 연결 끊김 같은 그 밖의 오류는 DB가 돌아올 때까지
+    배치를 그대로 들고 최대 max_retry_backoff초까지 늘어나는 지수 백오프로 다시 시도합니다.
+    종료 중에는 max_retries번까지만 시도하고, 포기한 뒤 남은 항목은 DB를 거치지 않고
+    바로 내보내므로 DB 장애 중에도 종료가 지연되지 않습니다.
+    끝내 실패한 항목은 로그와 Redis 데드레터 리스트에 남겨 나중에 다시 넣을 수 있게 합니다.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        batch_size: int,
+        flush_interval: float,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        max_retry_backoff: float = 30.0,
+    ) -> None:
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.max_retry_backoff = max_retry_backoff
+        self.enqueued = 0
+        self.rejected = 0
+        self.flushed = 0
+        self.retries = 0
+        self.failed = 0
+        self.batches = 0
+        self.last_batch_size = 0
+        self.max_batch_size = 0
+        self.last_lag_seconds = 0.0
+        self.max_lag_seconds = 0.0
+        self._closed = False
+        self._closing = asyncio.Event()
+        self._gave_up = False
+        self._queue: asyncio.Queue[tuple[FlushHandler, Any, float]] = asyncio.Queue(
+            maxsize=max_size
+        )
+
+    def enqueue(self, handler: FlushHandler, item: Any) -> bool:
+        if self._closed:
+            self.rejected += 1
+            return False
+
+        try:
+            self._queue.put_nowait((handler, item, time.monotonic()))
+
+        except asyncio.QueueFull:
+            self.rejected += 1
+            return False
+
+        self.enqueued += 1
+        return True
+
+    async def _next_batch(self) -> list[tuple[FlushHandler, Any, float]]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval
+        batch = []
+
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+
+            except asyncio.QueueEmpty:
+                pass
+
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _flush(self, batch: list[tuple[FlushHandler, Any, float]]) -> None:
+        grouped: dict[FlushHandler, list[Any]] = defaultdict(list)
+        for handler, item, _ in batch:
+            grouped[handler].append(item)
+
+        for handler, items in grouped.items():
+            failed_items = await self._flush_with_retries(handler, items)
+            self.flushed += len(items) - len(failed_items)
+
+            if failed_items:
+                self.failed += len(failed_items)
+                await self._dead_letter(handler, failed_items)
+
+        lag = time.monotonic() - min(enqueued_at for _, _, enqueued_at in batch)
+        self.batches += 1
+        self.last_batch_size = len(batch)
+        self.max_batch_size = max(self.max_batch_size, len(batch))
+        self.last_lag_seconds = lag
+        self.max_lag_seconds = max(self.max_lag_seconds, lag)
+
+    async def _call(self, handler: FlushHandler, items: list[Any]) -> Exception | None:
+        """handler를 실행하고, 실패하면 발생한 예외를 반환합니다."""
+        try:
+            async with async_session() as db:
+                await handler(db, items)
+            return None
+
+        except Exception as e:
+            logger.warning(
+                "write-behind 처리 실패: %s (%d건)",
+                handler.__name__,
+                len(items),
+                exc_info=True,
+            )
+            return e
+
+    async def _backoff(self, attempt: int) -> None:
+        delay = min(self.retry_backoff * 2 ** (attempt - 1), self.max_retry_backoff)
+
+        # 종료가 시작되면 기다리지 않고 바로 다음 시도로 넘어갑니다.
+        try:
+            await asyncio.wait_for(self._closing.wait(), delay)
+
+        except asyncio.TimeoutError:
+            pass
+
+    async def _flush_with_retries(
+        self, handler: FlushHandler, items: list[Any]
+    ) -> list[Any]:
+        """items를 처리하고, 끝내 처리하지 못한 항목 목록을 반환합니다."""
+        attempt = 0
+
+        while not self._gave_up:
+            error = await self._call(handler, items)
+
+            if error is None:
+                return []
+
+            if isinstance(error, DATA_ERRORS):
+                if len(items) == 1:
+                    return items
+
+                failed_items = []
+                for item in items:
+                    failed_items += await self._flush_with_retries(handler, [item])
+                return failed_items
+
+            if self._closed and attempt >= self.max_retries:
+                logger.error(
+                    "종료 중 DB에 쓰지 못해 남은 write-behind 항목을 데드레터로 보냅니다."
+                )
+                self._gave_up = True
+                break
+
+            attempt += 1
+            self.retries += 1
+            await self._backoff(attempt)
+
+        return items
+
+    async def _dead_letter(self, handler: FlushHandler, items: list[Any]) -> None:
+        entries = [
+            json.dumps(
+                {
+                    "handler": f"{handler.__module__}.{handler.__qualname__}",
+                    "item": (
+                        item.model_dump(mode="json")
+                        if isinstance(item, BaseModel)
+                        else item
+                    ),
+                    "failed_at": datetime.now().isoformat(),
+                },
+                ensure_ascii=False,
+                default=str,
+            )
+            for item in items
+        ]
+
+        for entry in entries:
+            logger.error("write-behind 데드레터: %s", entry)
+
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.lpush(settings.write_behind_dead_letter_key, *entries)
+                pipe.ltrim(
+                    settings.write_behind_dead_letter_key,
+                    0,
+                    settings.write_behind_dead_letter_max_length - 1,
+                )
+                await pipe.execute()
+
+        except RedisError:
+            logger.error(
+                "데드레터 %d건을 Redis에 저장하지 못했습니다.",
+                len(entries),
+                exc_info=True,
+            )
+
+    async def run(self) -> None:
+        while not (self._closed and self._queue.empty()):
+            batch = await self._next_batch()
+
+            if batch:
+                await self._flush(batch)
+
+    def close(self) -> None:
+        """새 항목을 받지 않도록 합니다. run은 남은 항목을 모두 처리한 뒤 종료합니다."""
+        self._closed = True
+        self._closing.set()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "depth": self._queue.qsize(),
+            "max_size": self.max_size,
+            "enqueued": self.enqueued,
+            "rejected": self.rejected,
+            "flushed": self.flushed,
+            "retries": self.retries,
+            "failed": self.failed,
+            "batches": self.batches,
+            "last_batch_size": self.last_batch_size,
+            "max_batch_size": self.max_batch_size,
+            "last_lag_seconds": self.last_lag_seconds,
+            "max_lag_seconds": self.max_lag_seconds,
+        }
+
+
+write_behind = WriteBehindQueue(
+    max_size=settings.write_behind_max_size,
+    batch_size=settings.write_behind_batch_size,
+    flush_interval=settings.write_behind_flush_interval,
+    max_retries=settings.write_behind_max_retries,
+    retry_backoff=settings.write_behind_retry_backoff,
+    max_retry_backoff=settings.write_behind_max_retry_backoff,
+)
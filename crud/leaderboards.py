@@ -0,0 +1,235 @@
+import json
+import logging
+from datetime import date, datetime
+from typing import Sequence
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from core.config import settings
+from core.databases import redis_client
+from models.quests import QuestResult
+
+
+RECORD_QUEST_RESULT_SCRIPT = """
+local current = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if (not current) or tonumber(ARGV[2]) < tonumber(current) then
+    redis.call('ZADD', KEYS[1], ARGV[2], ARGV[1])
+    redis.call('HSET', KEYS[2], ARGV[1], ARGV[3])
+end
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+redis.call('EXPIRE', KEYS[2], ARGV[4])
+return 1
+"""
+
+record_quest_result_script = redis_client.register_script(RECORD_QUEST_RESULT_SCRIPT)
+
+logger = logging.getLogger(__name__)
+
+
+def _leaderboard_keys(quest_number: int, day: date) -> tuple[str, str, str]:
+    board_key = settings.quest_leaderboard_key_template.format(
+        quest_number=quest_number, date=day.isoformat()
+    )
+    return board_key, f"{board_key}:entries", f"{board_key}:ready"
+
+
+def _result_entry(result: QuestResult) -> dict:
+    return {
+        "quest_number": result.quest_number,
+        "user_name": result.user_name,
+        "user_email": result.user_email,
+        "time_taken": result.time_taken,
+        "created_at": result.created_at.isoformat(),
+    }
+
+
+def _serialize_result(result: QuestResult) -> str:
+    return json.dumps(_result_entry(result))
+
+
+async def record_quest_result(redis: Redis, result: QuestResult) -> None:
+    """문제 해결 결과를 해당 날짜의 리더보드에 반영합니다.
+
+    리더보드는 문제 번호와 날짜별 sorted set이며, 해결 시간(ms)을 점수로 사용합니다.
+    사용자별 최고 기록만 유지하며, 더 빠른 기록일 때만 점수와 결과 정보가 갱신됩니다.
+    갱신은 Lua 스크립트로 원자적으로 처리됩니다.
+
+    Args:
+        redis (Redis): Redis 연결 객체
+        result (QuestResult): 저장된 문제 해결 결과
+
+    Returns:
+        None
+
+    Example:
+        >>> await record_quest_result(redis, new_result)
+    """
+    board_key, entries_key, _ = _leaderboard_keys(
+        result.quest_number, result.created_at.date()
+    )
+    await record_quest_result_script(
+        keys=[board_key, entries_key],
+        args=[
+            result.user_email,
+            result.duration_ms,
+            _serialize_result(result),
+            settings.quest_leaderboard_ttl_seconds,
+        ],
+        client=redis,
+    )
+
+
+async def invalidate_leaderboard(redis: Redis, quest_number: int, day: date) -> None:
+    """준비 완료 표시를 지워 다음 조회가 DB에서 리더보드를 다시 채우도록 합니다.
+
+    결과 반영에 실패했을 때 호출되므로 Redis 오류는 로그만 남기고 무시합니다.
+    이 경우 빠진 결과는 리더보드가 만료될 때까지 보이지 않을 수 있습니다.
+    """
+    _, _, ready_key = _leaderboard_keys(quest_number, day)
+
+    try:
+        await redis.delete(ready_key)
+
+    except RedisError:
+        logger.warning(
+            "리더보드 준비 표시를 지우지 못했습니다: %s", ready_key, exc_info=True
+        )
+
+
+def rank_results(results: Sequence[QuestResult]) -> list[dict]:
+    """해결 시간순으로 정렬된 결과에서 사용자별 최고 기록만 남긴 리더보드를 만듭니다.
+
+    Redis를 사용할 수 없을 때 DB에서 읽은 오늘의 결과로 리더보드를 대신하는 용도입니다.
+
+    Args:
+        results (Sequence[QuestResult]): 해결 시간 오름차순으로 정렬된 결과 목록
+
+    Returns:
+        list[dict]: get_leaderboard와 같은 형태의 결과 정보 리스트
+
+    Example:
+        >>> rank_results(await get_today_quest_results(db, 1))
+        [{'quest_number': 1, 'user_name': '홍길동', 'time_taken': '00:03:12', ...}]
+    """
+    best: dict[str, dict] = {}
+
+    for result in results:
+        best.setdefault(result.user_email, _result_entry(result))
+
+    return list(best.values())
+
+
+async def rebuild_leaderboard(
+    redis: Redis, quest_number: int, results: Sequence[QuestResult]
+) -> None:
+    """DB에서 읽은 오늘의 결과로 리더보드를 다시 채웁니다.
+
+    Redis 재시작 등으로 리더보드가 비어 있을 때(콜드 스타트) 사용합니다.
+    이미 기록된 결과와 병합되며, 완료 후 준비 완료 표시를 남겨
+    이후 조회가 DB를 거치지 않도록 합니다.
+
+    Args:
+        redis (Redis): Redis 연결 객체
+        quest_number (int): 대상 문제 번호
+        results (Sequence[QuestResult]): 오늘 생성된 문제 해결 결과 목록
+
+    Returns:
+        None
+
+    Example:
+        >>> await rebuild_leaderboard(redis, 1, results)
+    """
+    board_key, entries_key, ready_key = _leaderboard_keys(
+        quest_number, datetime.now().date()
+    )
+
+    async with redis.pipeline(transaction=False) as pipe:
+        for result in results:
+            await record_quest_result_script(
+                keys=[board_key, entries_key],
+                args=[
+                    result.user_email,
+                    result.duration_ms,
+                    _serialize_result(result),
+                    settings.quest_leaderboard_ttl_seconds,
+                ],
+                client=pipe,
+            )
+        pipe.set(ready_key, 1, ex=settings.quest_leaderboard_ttl_seconds)
+        await pipe.execute()
+
+
+async def get_leaderboard(
+    redis: Redis, quest_number: int, limit: int | None = None
+) -> list[dict] | None:
+    """오늘의 리더보드 상위 결과를 조회합니다.
+
+    해결 시간이 빠른 순으로 정렬된 사용자별 최고 기록을 반환합니다.
+    리더보드가 아직 준비되지 않았다면 None을 반환하므로,
+    호출하는 쪽에서 rebuild_leaderboard로 채운 뒤 다시 조회해야 합니다.
+
+    Args:
+        redis (Redis): Redis 연결 객체
+        quest_number (int): 대상 문제 번호
+        limit (int, optional): 조회할 상위 결과 수. 없으면 전체
+
+    Returns:
+        list[dict] | None: 결과 정보 리스트 또는 None
+
+    Example:
+        >>> await get_leaderboard(redis, 1, 3)
+        [{'quest_number': 1, 'user_name': '홍길동', 'time_taken': '00:03:12', ...}]
+    """
+    board_key, entries_key, ready_key = _leaderboard_keys(
+        quest_number, datetime.now().date()
+    )
+
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.exists(ready_key)
+        pipe.zrange(board_key, 0, (limit or 0) - 1)
+        is_ready, user_emails = await pipe.execute()
+
+    if not is_ready:
+        return None
+
+    if not user_emails:
+        return []
+
+    entries = await redis.hmget(entries_key, user_emails)
+    return [json.loads(entry) for entry in entries if entry]
+
+
+async def get_user_rank(
+    redis: Redis, quest_number: int, user_email: str
+) -> dict | None:
+    """오늘의 리더보드에서 사용자의 순위와 최고 기록을 조회합니다.
+
+    Args:
+        redis (Redis): Redis 연결 객체
+        quest_number (int): 대상 문제 번호
+        user_email (str): 대상 사용자 이메일
+
+    Returns:
+        dict | None: rank(1부터 시작)가 포함된 결과 정보. 기록이 없으면 None
+
+    Example:
+        >>> await get_user_rank(redis, 1, "user@example.com")
+        {'rank': 2, 'quest_number': 1, 'user_name': '홍길동', ...}
+    """
+    board_key, entries_key, _ = _leaderboard_keys(quest_number, datetime.now().date())
+
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.zrank(board_key, user_email)
+        pipe.hget(entries_key, user_email)
+        rank, entry = await pipe.execute()
+
+    if rank is None or entry is None:
+        return None
+
+    return {"rank": rank + 1, **json.loads(entry)}
+
+
+async def is_leaderboard_ready(redis: Redis, quest_number: int) -> bool:
+    _, _, ready_key = _leaderboard_keys(quest_number, datetime.now().date())
+    return bool(await redis.exists(ready_key))
@@ -1,8 +1,171 @@
+import json
+import time
+
 from fastapi import Depends
 from redis.asyncio import Redis
 
 from core.config import settings
-from core.databases import get_redis
+from core.databases import get_redis, redis_client
+
+
+_JOIN_MEETING_ROOM_LUA = """
+local function join_meeting_room(
+    room_key, registry_key, presence_key, client_key, presence_rooms_key,
+    room_id, client_id, title, now, channel, client_ttl
+)
+    if title ~= '' then
+        redis.call('HSET', room_key, 'title', title)
+    end
+    redis.call('HSET', room_key, client_id, '')
+    redis.call('ZADD', registry_key, 'NX', now, room_id)
+    redis.call('ZADD', presence_key, now, client_id)
+    redis.call('HSET', client_key, 'room_id', room_id)
+    redis.call('EXPIRE', client_key, client_ttl)
+    redis.call('HSET', presence_rooms_key, client_id, room_id)
+    local current_title = redis.call('HGET', room_key, 'title') or cjson.null
+    redis.call('PUBLISH', channel, cjson.encode({
+        type = 'join', room_id = room_id, client_id = client_id, title = current_title
+    }))
+end
+"""
+
+_LEAVE_MEETING_ROOM_LUA = """
+local function leave_meeting_room(room_key, registry_key, chat_key, room_id, client_id, channel)
+    local removed = redis.call('HDEL', room_key, client_id)
+    if removed == 1 then
+        redis.call('PUBLISH', channel, cjson.encode({
+            type = 'leave', room_id = room_id, client_id = client_id
+        }))
+    end
+    local remaining = redis.call('HLEN', room_key)
+    if redis.call('HEXISTS', room_key, 'title') == 1 then
+        remaining = remaining - 1
+    end
+    if remaining <= 0 then
+        local deleted = redis.call('DEL', room_key, chat_key) + redis.call('ZREM', registry_key, room_id)
+        if deleted > 0 then
+            redis.call('PUBLISH', channel, cjson.encode({
+                type = 'delete', room_id = room_id
+            }))
+        end
+        remaining = 0
+    end
+    return removed, remaining
+end
+"""
+
+JOIN_MEETING_ROOM_SCRIPT = (
+    _JOIN_MEETING_ROOM_LUA
+    + """
+join_meeting_room(
+    KEYS[1], KEYS[2], KEYS[3], KEYS[4], KEYS[5],
+    ARGV[1], ARGV[2], ARGV[3], ARGV[4], ARGV[5], ARGV[6]
+)
+return 1
+"""
+)
+
+LEAVE_MEETING_ROOM_SCRIPT = (
+    _LEAVE_MEETING_ROOM_LUA
+    + """
+local _, remaining = leave_meeting_room(KEYS[1], KEYS[2], KEYS[3], ARGV[1], ARGV[2], ARGV[3])
+if redis.call('HGET', KEYS[4], ARGV[2]) == ARGV[1] then
+    redis.call('HDEL', KEYS[4], ARGV[2])
+end
+return remaining
+"""
+)
+
+REAP_STALE_CLIENT_SCRIPT = (
+    _LEAVE_MEETING_ROOM_LUA
+    + """
+local last_seen = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if (not last_seen) or tonumber(last_seen) > tonumber(ARGV[2]) then
+    return 0
+end
+if (redis.call('HGET', KEYS[7], ARGV[1]) or '') ~= ARGV[3] then
+    return 0
+end
+redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('DEL', KEYS[2])
+redis.call('HDEL', KEYS[7], ARGV[1])
+if ARGV[3] ~= '' then
+    local title = redis.call('HGET', KEYS[4], 'title') or ''
+    local removed = leave_meeting_room(KEYS[4], KEYS[5], KEYS[6], ARGV[3], ARGV[1], ARGV[5])
+    if removed == 1 then
+        redis.call('SET', KEYS[3], cjson.encode({room_id = ARGV[3], title = title}), 'EX', ARGV[4])
+    end
+end
+return 1
+"""
+)
+
+RESTORE_CLIENT_SCRIPT = (
+    _JOIN_MEETING_ROOM_LUA
+    + """
+if redis.call('GET', KEYS[1]) ~= ARGV[2] then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+join_meeting_room(
+    KEYS[2], KEYS[3], KEYS[4], KEYS[5], KEYS[6],
+    ARGV[3], ARGV[1], ARGV[4], ARGV[5], ARGV[6], ARGV[7]
+)
+return 1
+"""
+)
+
+APPEND_CHAT_MESSAGE_SCRIPT = """
+if redis.call('HEXISTS', KEYS[1], ARGV[1]) == 0 then
+    return false
+end
+return redis.call(
+    'XADD', KEYS[2], 'MAXLEN', '~', ARGV[3], '*',
+    'client_id', ARGV[1], 'content', ARGV[2]
+)
+"""
+
+
+# 스크립트는 모듈 로드 시 한 번만 등록하고, 호출할 때 client로 실제 연결을 넘깁니다.
+join_meeting_room_script = redis_client.register_script(JOIN_MEETING_ROOM_SCRIPT)
+leave_meeting_room_script = redis_client.register_script(LEAVE_MEETING_ROOM_SCRIPT)
+reap_stale_client_script = redis_client.register_script(REAP_STALE_CLIENT_SCRIPT)
+restore_client_script = redis_client.register_script(RESTORE_CLIENT_SCRIPT)
+append_chat_message_script = redis_client.register_script(APPEND_CHAT_MESSAGE_SCRIPT)
+
+
+def _room_key(room_id: str) -> str:
+    return settings.rooms_key_template.format(room_id=f"{{{room_id}}}")
+
+
+def _meeting_room_key(room_id: str) -> str:
+    return settings.meeting_room_key_template.format(room_id=room_id)
+
+
+def _meeting_room_chat_key(room_id: str) -> str:
+    return f"{_meeting_room_key(room_id)}:chat"
+
+
+def _client_ttl() -> int:
+    return settings.presence_ttl_seconds + settings.presence_grace_seconds
+
+
+def _parse_chat_message(message_id: str, fields: dict) -> dict:
+    return {
+        "id": message_id,
+        "client_id": fields.get("client_id"),
+        "content": fields.get("content"),
+        "created_at": int(message_id.split("-", 1)[0]),
+    }
+
+
+def _parse_meeting_room_id(room_key: str) -> str | None:
+    prefix, _, suffix = settings.meeting_room_key_template.partition("{room_id}")
+
+    if not room_key.startswith(prefix) or not room_key.endswith(suffix):
+        return None
+
+    return room_key[len(prefix) : len(room_key) - len(suffix)]
 
 
 async def add_to_room(
@@ -14,6 +177,8 @@ async def add_to_room(
 
     Redis hash 자료구조를 사용하여 특정 room_id에 client_id를 추가합니다.
     이미 존재하는 클라이언트의 경우 값이 덮어씌워집니다.
+    키의 room_id 부분은 Redis Cluster hash tag({room_id})로 감싸므로
+    같은 채팅방의 키들은 항상 같은 슬롯에 배치됩니다.
 
     Args:
         redis (Redis): Redis 연결 객체
@@ -26,18 +191,20 @@ async def add_to_room(
     Example:
         >>> await add_to_room(redis, "room_123", "client_456")
     """
-    await redis.hset(settings.rooms_key_template.format(room_id=room_id), client_id, "")
+    await redis.hset(_room_key(room_id), client_id, "")
 
 
 async def remove_from_room(
     redis: Redis = Depends(get_redis),
     room_id: str = None,
     client_id: str = None,
-) -> None:
-    """일반 채팅방에서 클라이언트를 제거합니다.
+) -> int:
+    """일반 채팅방에서 클라이언트를 제거하고 남은 참가자 수를 반환합니다.
 
-    지정된 room_id의 hash에서 client_id를 삭제합니다.
-    존재하지 않는 client_id에 대해서는 아무 동작도 하지 않습니다.
+    지정된 room_id의 hash에서 client_id를 삭제하고 남은 참가자 수를
+    MULTI/EXEC 트랜잭션으로 한 번에 조회합니다. 마지막 참가자가 나가면
+    Redis가 빈 hash를 자동으로 삭제하므로 채팅방도 함께 사라집니다.
+    존재하지 않는 client_id에 대해서는 남은 참가자 수만 확인합니다.
 
     Args:
         redis (Redis): Redis 연결 객체
@@ -45,12 +212,20 @@ async def remove_from_room(
         client_id (str): 제거할 클라이언트 ID
 
     Returns:
-        None
+        int: 남은 참가자 수. 0이면 채팅방이 삭제된 것입니다.
 
     Example:
         >>> await remove_from_room(redis, "room_123", "client_456")
+        2
     """
-    await redis.hdel(settings.rooms_key_template.format(room_id=room_id), client_id)
+    room_key = _room_key(room_id)
+
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.hdel(room_key, client_id)
+        pipe.hlen(room_key)
+        _, remaining = await pipe.execute()
+
+    return remaining
 
 
 async def get_room_clients(
@@ -73,7 +248,7 @@ async def get_room_clients(
         >>> print(clients)
         ['client_1', 'client_2', 'client_3']
     """
-    return list(await redis.hkeys(settings.rooms_key_template.format(room_id=room_id)))
+    return list(await redis.hkeys(_room_key(room_id)))
 
 
 async def add_to_meeting_room(
@@ -85,7 +260,12 @@ async def add_to_meeting_room(
     """미팅룸에 클라이언트를 추가하고, 필요한 경우 미팅룸 제목을 설정합니다.
 
     Redis hash 자료구조를 사용하여 미팅룸 정보를 관리합니다.
-    title이 제공된 경우 미팅룸의 제목도 함께 설정됩니다.
+    title이 제공된 경우 미팅룸의 제목도 함께 설정되며,
+    미팅룸 ID는 활성 미팅룸 레지스트리(sorted set)에 등록됩니다.
+    입장 시각을 첫 하트비트로 기록하므로, 하트비트를 한 번도 보내지 못하고
+    끊긴 클라이언트도 리퍼가 미팅룸에서 제거합니다.
+    모든 작업은 하나의 Lua 스크립트로 원자적으로, 한 번의 왕복으로 처리되며
+    입장 이벤트가 미팅룸 이벤트 채널로 발행됩니다.
 
     Args:
         redis (Redis): Redis 연결 객체
@@ -99,12 +279,23 @@ async def add_to_meeting_room(
     Example:
         >>> await add_to_meeting_room(redis, "meeting_123", "프로젝트 회의", "client_456")
     """
-    if title:
-        await redis.hset(
-            settings.meeting_room_key_template.format(room_id=room_id), "title", title
-        )
-    await redis.hset(
-        settings.meeting_room_key_template.format(room_id=room_id), client_id, ""
+    await join_meeting_room_script(
+        keys=[
+            _meeting_room_key(room_id),
+            settings.meeting_room_registry_key,
+            settings.presence_key,
+            settings.client_key_template.format(client_id=client_id),
+            settings.presence_rooms_key,
+        ],
+        args=[
+            room_id,
+            client_id,
+            title or "",
+            time.time(),
+            settings.meeting_room_events_channel,
+            _client_ttl(),
+        ],
+        client=redis,
     )
 
 
@@ -112,11 +303,15 @@ async def remove_from_meeting_room(
     redis: Redis = Depends(get_redis),
     room_id: str = None,
     client_id: str = None,
-) -> None:
-    """미팅룸에서 클라이언트를 제거합니다.
+) -> int:
+    """미팅룸에서 클라이언트를 제거하고, 남은 참가자가 없으면 미팅룸을 삭제합니다.
 
-    지정된 미팅룸의 hash에서 client_id를 삭제합니다.
-    존재하지 않는 client_id에 대해서는 아무 동작도 하지 않습니다.
+    지정된 미팅룸의 hash에서 client_id를 삭제한 뒤 남은 참가자 수를 확인하여,
+    참가자가 없으면 미팅룸과 레지스트리 항목, 채팅 기록을 함께 삭제합니다.
+    모든 작업은 하나의 Lua 스크립트로 원자적으로 처리되므로
+    동시에 퇴장하거나 퇴장 도중 입장하는 요청과 경합하지 않습니다.
+    퇴장 및 삭제 이벤트는 미팅룸 이벤트 채널로 발행됩니다.
+    존재하지 않는 client_id에 대해서는 제거 없이 남은 참가자 수만 확인합니다.
 
     Args:
         redis (Redis): Redis 연결 객체
@@ -124,13 +319,21 @@ async def remove_from_meeting_room(
         client_id (str): 제거할 클라이언트 ID
 
     Returns:
-        None
+        int: 남은 참가자 수. 0이면 미팅룸이 삭제된 것입니다.
 
     Example:
         >>> await remove_from_meeting_room(redis, "meeting_123", "client_456")
+        2
     """
-    await redis.hdel(
-        settings.meeting_room_key_template.format(room_id=room_id), client_id
+    return await leave_meeting_room_script(
+        keys=[
+            _meeting_room_key(room_id),
+            settings.meeting_room_registry_key,
+            _meeting_room_chat_key(room_id),
+            settings.presence_rooms_key,
+        ],
+        args=[room_id, client_id, settings.meeting_room_events_channel],
+        client=redis,
     )
 
 
@@ -155,9 +358,7 @@ async def get_meeting_room_clients(
         >>> print(clients)
         ['client_1', 'client_2', 'client_3']
     """
-    data = await redis.hgetall(
-        settings.meeting_room_key_template.format(room_id=room_id)
-    )
+    data = await redis.hgetall(_meeting_room_key(room_id))
     return [key for key in data.keys() if key != "title"]
 
 
@@ -182,9 +383,7 @@ async def get_meeting_room_title(
         >>> print(title)
         '프로젝트 회의'
     """
-    return await redis.hget(
-        settings.meeting_room_key_template.format(room_id=room_id), "title"
-    )
+    return await redis.hget(_meeting_room_key(room_id), "title")
 
 
 async def delete_meeting_room(
@@ -193,7 +392,8 @@ async def delete_meeting_room(
 ) -> None:
     """미팅룸을 완전히 삭제합니다.
 
-    지정된 미팅룸의 모든 정보(제목, 클라이언트 목록 등)를 삭제합니다.
+    지정된 미팅룸의 모든 정보(제목, 클라이언트 목록, 채팅 기록 등)를 삭제하고
+    활성 미팅룸 레지스트리에서도 제거한 뒤 삭제 이벤트를 발행합니다.
     존재하지 않는 미팅룸에 대해서는 아무 동작도 하지 않습니다.
 
     Args:
@@ -206,14 +406,22 @@ async def delete_meeting_room(
     Example:
         >>> await delete_meeting_room(redis, "meeting_123")
     """
-    await redis.delete(settings.meeting_room_key_template.format(room_id=room_id))
+    async with redis.pipeline() as pipe:
+        pipe.delete(_meeting_room_key(room_id), _meeting_room_chat_key(room_id))
+        pipe.zrem(settings.meeting_room_registry_key, room_id)
+        pipe.publish(
+            settings.meeting_room_events_channel,
+            json.dumps({"type": "delete", "room_id": room_id}),
+        )
+        await pipe.execute()
 
 
 async def get_all_meeting_rooms(redis: Redis = Depends(get_redis)) -> list[dict]:
     """모든 활성 미팅룸의 정보를 조회합니다.
 
-    현재 존재하는 모든 미팅룸의 정보를 리스트로 반환합니다.
-    각 미팅룸 정보는 room_id, title, clients를 포함합니다.
+    활성 미팅룸 레지스트리에서 미팅룸 ID를 생성 순으로 읽은 뒤,
+    각 미팅룸의 hash를 하나의 pipeline으로 조회합니다.
+    이미 사라진 미팅룸은 결과에서 제외하고 레지스트리에서도 정리합니다.
 
     Args:
         redis (Redis): Redis 연결 객체
@@ -236,16 +444,232 @@ async def get_all_meeting_rooms(redis: Redis = Depends(get_redis)) -> list[dict]
             ...
         ]
     """
-    room_keys = await redis.keys("meeting_room:*")
+    room_ids = await redis.zrange(settings.meeting_room_registry_key, 0, -1)
+
+    if not room_ids:
+        return []
+
+    async with redis.pipeline(transaction=False) as pipe:
+        for room_id in room_ids:
+            pipe.hgetall(_meeting_room_key(room_id))
+        room_data = await pipe.execute()
+
     rooms = []
-    for room_key in room_keys:
-        room_id = room_key.split(":")[-1]
-        clients = await get_meeting_room_clients(redis, room_id)
-        title = await get_meeting_room_title(redis, room_id)
-        rooms.append({"room_id": room_id, "title": title, "clients": clients})
+    stale_room_ids = []
+    for room_id, data in zip(room_ids, room_data):
+        if not data:
+            stale_room_ids.append(room_id)
+            continue
+
+        rooms.append(
+            {
+                "room_id": room_id,
+                "title": data.get("title"),
+                "clients": [key for key in data.keys() if key != "title"],
+            }
+        )
+
+    if stale_room_ids:
+        await redis.zrem(settings.meeting_room_registry_key, *stale_room_ids)
+
     return rooms
 
 
+async def get_meeting_room_rosters(
+    redis: Redis = Depends(get_redis),
+    room_ids: list[str] | None = None,
+) -> list[dict]:
+    """미팅룸별 참가자 목록을 참가자 정보와 함께 조회합니다.
+
+    미팅룸 hash 조회와 참가자 정보 조회를 각각 하나의 pipeline으로 처리하므로
+    미팅룸 수나 참가자 수와 관계없이 Redis 왕복은 최대 세 번입니다.
+    room_ids가 없으면 활성 미팅룸 레지스트리의 모든 미팅룸을 조회하며,
+    존재하지 않는 미팅룸은 결과에서 제외됩니다.
+
+    Args:
+        redis (Redis): Redis 연결 객체
+        room_ids (list[str], optional): 조회할 미팅룸 ID 리스트. 없으면 전체
+
+    Returns:
+        list[dict]: 미팅룸 정보 리스트. 각 딕셔너리는 다음 키를 포함:
+            - room_id (str): 미팅룸 ID
+            - title (str | None): 미팅룸 제목
+            - clients (list[dict]): client_id와 info를 가진 참가자 리스트
+
+    Example:
+        >>> await get_meeting_room_rosters(redis, ["meeting_123"])
+        [
+            {
+                'room_id': 'meeting_123',
+                'title': '프로젝트 회의',
+                'clients': [{'client_id': 'client_1', 'info': {'name': '홍길동'}}]
+            }
+        ]
+    """
+    if room_ids is None:
+        room_ids = await redis.zrange(settings.meeting_room_registry_key, 0, -1)
+
+    if not room_ids:
+        return []
+
+    async with redis.pipeline(transaction=False) as pipe:
+        for room_id in room_ids:
+            pipe.hgetall(_meeting_room_key(room_id))
+        room_data = await pipe.execute()
+
+    rooms = [
+        {
+            "room_id": room_id,
+            "title": data.get("title"),
+            "client_ids": [key for key in data.keys() if key != "title"],
+        }
+        for room_id, data in zip(room_ids, room_data)
+        if data
+    ]
+    client_ids = list(
+        dict.fromkeys(client_id for room in rooms for client_id in room["client_ids"])
+    )
+
+    async with redis.pipeline(transaction=False) as pipe:
+        for client_id in client_ids:
+            pipe.hgetall(settings.client_key_template.format(client_id=client_id))
+        client_infos = dict(zip(client_ids, await pipe.execute()))
+
+    return [
+        {
+            "room_id": room["room_id"],
+            "title": room["title"],
+            "clients": [
+                {"client_id": client_id, "info": client_infos[client_id]}
+                for client_id in room["client_ids"]
+            ],
+        }
+        for room in rooms
+    ]
+
+
+async def append_meeting_room_message(
+    redis: Redis = Depends(get_redis),
+    room_id: str = None,
+    client_id: str = None,
+    content: str = None,
+) -> dict | None:
+    """미팅룸 채팅 기록에 메시지를 추가합니다.
+
+    채팅 기록은 미팅룸 키 아래의 Redis Stream(`{미팅룸 키}:chat`)에 저장되며,
+    XADD의 MAXLEN ~ 옵션으로 최근 meeting_room_chat_max_length개 안팎만 유지하므로
+    미팅룸당 메모리 사용량이 제한됩니다. 참가 여부 확인과 메시지 추가는
+    하나의 Lua 스크립트로 원자적으로 처리됩니다. 메시지는 미팅룸 이벤트 채널로
+    발행하지 않으므로, 로비의 이벤트 구독자에게 다른 미팅룸의 대화가 전달되지 않습니다.
+
+    Args:
+        redis (Redis): Redis 연결 객체
+        room_id (str): 대상 미팅룸 ID
+        client_id (str): 메시지를 보낸 클라이언트 ID
+        content (str): 메시지 내용
+
+    Returns:
+        dict | None: 추가된 메시지 정보. 미팅룸 참가자가 아니면 None
+            - id (str): Stream 엔트리 ID (커서로 사용)
+            - client_id (str): 메시지를 보낸 클라이언트 ID
+            - content (str): 메시지 내용
+            - created_at (int): 메시지 생성 시각(ms)
+
+    Example:
+        >>> await append_meeting_room_message(redis, "meeting_123", "client_1", "안녕하세요")
+        {'id': '1700000000000-0', 'client_id': 'client_1', 'content': '안녕하세요', ...}
+    """
+    message_id = await append_chat_message_script(
+        keys=[_meeting_room_key(room_id), _meeting_room_chat_key(room_id)],
+        args=[client_id, content, settings.meeting_room_chat_max_length],
+        client=redis,
+    )
+
+    if not message_id:
+        return None
+
+    return _parse_chat_message(message_id, {"client_id": client_id, "content": content})
+
+
+async def get_meeting_room_messages(
+    redis: Redis = Depends(get_redis),
+    room_id: str = None,
+    before: str | None = None,
+    after: str | None = None,
+    limit: int = 20,
+) -> dict:
+    """미팅룸 채팅 기록을 커서 기반으로 조회합니다.
+
+    after가 주어지면 XRANGE로 해당 메시지 이후를 오래된 순으로,
+    그렇지 않으면 XREVRANGE로 before 이전(없으면 최신부터)을 최신 순으로 조회합니다.
+    커서는 Stream 엔트리 ID이며, 범위 시작에 '('를 붙여 커서 자신은 제외합니다.
+    limit + 1개를 읽어 다음 페이지 존재 여부를 판단합니다.
+
+    Args:
+        redis (Redis): Redis 연결 객체
+        room_id (str): 대상 미팅룸 ID
+        before (str, optional): 이 메시지 ID 이전의 메시지를 조회
+        after (str, optional): 이 메시지 ID 이후의 메시지를 조회
+        limit (int): 조회할 메시지 수
+
+    Returns:
+        dict: 메시지 페이지
+            - items (list[dict]): 메시지 정보 리스트
+            - next_cursor (str | None): 같은 방향으로 이어서 조회할 커서
+
+    Example:
+        >>> await get_meeting_room_messages(redis, "meeting_123", limit=2)
+        {'items': [{'id': '1700000000001-0', ...}, {'id': '1700000000000-0', ...}],
+         'next_cursor': '1700000000000-0'}
+    """
+    chat_key = _meeting_room_chat_key(room_id)
+
+    if after:
+        entries = await redis.xrange(chat_key, min=f"({after}", count=limit + 1)
+    else:
+        entries = await redis.xrevrange(
+            chat_key, max=f"({before}" if before else "+", count=limit + 1
+        )
+
+    items = [_parse_chat_message(message_id, fields) for message_id, fields in entries]
+    next_cursor = items[limit - 1]["id"] if len(items) > limit else None
+
+    return {"items": items[:limit], "next_cursor": next_cursor}
+
+
+async def rebuild_meeting_room_registry(redis: Redis = Depends(get_redis)) -> int:
+    """기존 미팅룸 키를 스캔하여 활성 미팅룸 레지스트리를 채웁니다.
+
+    레지스트리가 도입되기 전에 만들어진 미팅룸을 등록하기 위한 용도로,
+    KEYS 대신 SCAN을 사용하므로 Redis를 블로킹하지 않습니다.
+    hash 타입 키만 스캔하므로 채팅 기록 Stream 키는 제외됩니다.
+    이미 등록된 미팅룸의 생성 순서는 유지됩니다.
+
+    Args:
+        redis (Redis): Redis 연결 객체
+
+    Returns:
+        int: 새로 등록된 미팅룸 수
+
+    Example:
+        >>> await rebuild_meeting_room_registry(redis)
+        3
+    """
+    now = time.time()
+    room_ids = {}
+    async for room_key in redis.scan_iter(
+        match=_meeting_room_key("*"), count=1000, _type="HASH"
+    ):
+        room_id = _parse_meeting_room_id(room_key)
+        if room_id:
+            room_ids[room_id] = now
+
+    if not room_ids:
+        return 0
+
+    return await redis.zadd(settings.meeting_room_registry_key, room_ids, nx=True)
+
+
 async def set_client_info(
     redis: Redis = Depends(get_redis),
     client_id: str = None,
@@ -310,3 +734,155 @@ async def delete_client_info(
         >>> await delete_client_info(redis, "client_123")
     """
     await redis.delete(settings.client_key_template.format(client_id=client_id))
+
+
+async def record_heartbeats(
+    redis: Redis = Depends(get_redis),
+    client_ids: list[str] = None,
+) -> None:
+    """여러 클라이언트의 하트비트를 한 번의 pipeline으로 기록합니다.
+
+    접속 상태 sorted set에 마지막 하트비트 시각을 점수로 기록하고
+    클라이언트 정보 hash의 TTL을 연장합니다. 클라이언트가 속한 미팅룸은
+    입장/퇴장 스크립트만 기록하므로, 입장과 경합한 하트비트가 이전 미팅룸을
+    되돌려 쓰는 일이 없습니다.
+
+    Args:
+        redis (Redis): Redis 연결 객체
+        client_ids (list[str]): 하트비트를 보낸 클라이언트 ID 목록
+
+    Returns:
+        None
+
+    Example:
+        >>> await record_heartbeats(redis, ["client_1", "client_2"])
+    """
+    now = time.time()
+    client_ttl = _client_ttl()
+
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.zadd(settings.presence_key, {client_id: now for client_id in client_ids})
+        for client_id in client_ids:
+            pipe.expire(
+                settings.client_key_template.format(client_id=client_id), client_ttl
+            )
+        await pipe.execute()
+
+
+async def reap_stale_clients(redis: Redis = Depends(get_redis)) -> int:
+    """하트비트가 끊긴 클라이언트를 미팅룸에서 일괄 제거합니다.
+
+    presence_ttl_seconds 동안 하트비트가 없던 클라이언트를 최대
+    presence_reaper_batch_size명까지 찾아, 클라이언트마다 Lua 스크립트로
+    미팅룸 퇴장(빈 미팅룸 삭제 포함)과 접속 정보 삭제를 원자적으로 처리합니다.
+    클라이언트의 미팅룸은 만료되지 않는 presence_rooms_key hash에서 읽으므로,
+    리퍼가 오래 멈춰 클라이언트 정보 hash가 먼저 만료되어도 미팅룸에서 제거됩니다.
+    퇴장한 클라이언트의 미팅룸 정보는 재접속 유예 기간 동안
+    disconnected 키에 보관됩니다. 스크립트 실행 시점에 다시 하트비트를 보낸
+    클라이언트는 제거하지 않습니다.
+
+    Args:
+        redis (Redis): Redis 연결 객체
+
+    Returns:
+        int: 제거된 클라이언트 수
+
+    Example:
+        >>> await reap_stale_clients(redis)
+        3
+    """
+    cutoff = time.time() - settings.presence_ttl_seconds
+    client_ids = await redis.zrangebyscore(
+        settings.presence_key,
+        "-inf",
+        cutoff,
+        start=0,
+        num=settings.presence_reaper_batch_size,
+    )
+
+    if not client_ids:
+        return 0
+
+    room_ids = await redis.hmget(settings.presence_rooms_key, client_ids)
+
+    async with redis.pipeline(transaction=False) as pipe:
+        for client_id, room_id in zip(client_ids, room_ids):
+            await reap_stale_client_script(
+                keys=[
+                    settings.presence_key,
+                    settings.client_key_template.format(client_id=client_id),
+                    settings.disconnected_client_key_template.format(
+                        client_id=client_id
+                    ),
+                    _meeting_room_key(room_id or ""),
+                    settings.meeting_room_registry_key,
+                    _meeting_room_chat_key(room_id or ""),
+                    settings.presence_rooms_key,
+                ],
+                args=[
+                    client_id,
+                    cutoff,
+                    room_id or "",
+                    settings.presence_grace_seconds,
+                    settings.meeting_room_events_channel,
+                ],
+                client=pipe,
+            )
+        reaped = await pipe.execute()
+
+    return sum(reaped)
+
+
+async def restore_client(
+    redis: Redis = Depends(get_redis),
+    client_id: str = None,
+) -> str | None:
+    """재접속 유예 기간 안에 돌아온 클라이언트를 원래 미팅룸에 다시 입장시킵니다.
+
+    disconnected 키에 보관된 미팅룸으로 재입장하며, 그 사이 미팅룸이 비어
+    삭제되었다면 보관된 제목으로 다시 만듭니다.
+
+    Args:
+        redis (Redis): Redis 연결 객체
+        client_id (str): 재접속한 클라이언트 ID
+
+    Returns:
+        str | None: 재입장한 미팅룸 ID. 유예 기간이 지났으면 None
+
+    Example:
+        >>> await restore_client(redis, "client_123")
+        'meeting_123'
+    """
+    disconnected_key = settings.disconnected_client_key_template.format(
+        client_id=client_id
+    )
+    raw = await redis.get(disconnected_key)
+
+    if not raw:
+        return None
+
+    disconnected = json.loads(raw)
+    room_id = disconnected["room_id"]
+
+    restored = await restore_client_script(
+        keys=[
+            disconnected_key,
+            _meeting_room_key(room_id),
+            settings.meeting_room_registry_key,
+            settings.presence_key,
+            settings.client_key_template.format(client_id=client_id),
+            settings.presence_rooms_key,
+        ],
+        args=[
+            client_id,
+            raw,
+            room_id,
+            disconnected.get("title") or "",
+            time.time(),
+            settings.meeting_room_events_channel,
+            _client_ttl(),
+        ],
+        client=redis,
+    )
+
+    return room_id if restored else None
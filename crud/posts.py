@@ -1,12 +1,22 @@
-from sqlmodel import Session, select
+from redis.asyncio import Redis
+from sqlalchemy import func, literal, null, or_, union_all
+from sqlmodel import select, tuple_
+from sqlmodel.ext.asyncio.session import AsyncSession
 from fastapi import HTTPException, status
 
+from core.config import settings
+from core.paginations import build_page, decode_cursor
+from core.response_caches import bump_cache_version
 from models.posts import Notice, GuestBook
 from request_schemas.posts import NoticeCreate, GuestBookCreate
 
 
-def create_notice(
-    db: Session, request: NoticeCreate, author_name: str, author_google_id: str
+async def create_notice(
+    db: AsyncSession,
+    redis: Redis,
+    request: NoticeCreate,
+    author_name: str,
+    author_google_id: str,
 ) -> None:
     try:
         new_post = Notice(
@@ -17,29 +27,38 @@ def create_notice(
         )
 
         db.add(new_post)
-        db.commit()
+        await db.commit()
 
     except Exception:
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="게시글 작성 중 오류가 발생했습니다.",
         )
 
+    await bump_cache_version(redis, settings.notice_cache_version_key)
+
+
+async def get_notice_list(db: AsyncSession, cursor: str | None, limit: int):
+    stmt = select(Notice).where(Notice.is_deleted == False)
+
+    if cursor:
+        stmt = stmt.where(
+            tuple_(Notice.created_at, Notice.id) < tuple_(*decode_cursor(cursor))
+        )
 
-def get_notice_list(db: Session):
-    return db.exec(
-        select(Notice)
-        .where(Notice.is_deleted == False)
-        .order_by(Notice.created_at.desc())
-    ).all()
+    result = await db.exec(
+        stmt.order_by(Notice.created_at.desc(), Notice.id.desc()).limit(limit + 1)
+    )
+    return build_page(result.all(), limit)
 
 
-def get_notice(db: Session, notice_id: int):
-    notice = db.exec(
+async def get_notice(db: AsyncSession, notice_id: int):
+    result = await db.exec(
         select(Notice).where(Notice.id == notice_id, Notice.is_deleted == False)
-    ).first()
+    )
+    notice = result.first()
 
     if not notice:
         raise HTTPException(
@@ -50,8 +69,8 @@ def get_notice(db: Session, notice_id: int):
     return notice
 
 
-def create_guestbook(
-    db: Session,
+async def create_guestbook(
+    db: AsyncSession,
     request: GuestBookCreate,
     author_name: str,
     guest_google_id: str,
@@ -67,10 +86,10 @@ def create_guestbook(
         )
 
         db.add(new_guestbook)
-        db.commit()
+        await db.commit()
 
     except Exception:
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -78,27 +97,39 @@ def create_guestbook(
         )
 
 
-def get_guestbook_list(db: Session, host_google_id: str):
-    return db.exec(
-        select(GuestBook)
-        .where(
-            GuestBook.host_google_id == host_google_id,
-            GuestBook.is_deleted == False,
+async def get_guestbook_list(
+    db: AsyncSession, host_google_id: str, cursor: str | None, limit: int
+):
+    stmt = select(GuestBook).where(
+        GuestBook.host_google_id == host_google_id,
+        GuestBook.is_deleted == False,
+    )
+
+    if cursor:
+        stmt = stmt.where(
+            tuple_(GuestBook.created_at, GuestBook.id) < tuple_(*decode_cursor(cursor))
         )
-        .order_by(GuestBook.created_at.desc())
-    ).all()
+
+    result = await db.exec(
+        stmt.order_by(GuestBook.created_at.desc(), GuestBook.id.desc()).limit(limit + 1)
+    )
+    return build_page(result.all(), limit)
 
 
-def delete_guestbook(
-    db: Session, host_google_id: str, guestbook_id: int, current_user_google_id: str
+async def delete_guestbook(
+    db: AsyncSession,
+    host_google_id: str,
+    guestbook_id: int,
+    current_user_google_id: str,
 ) -> None:
-    guestbook = db.exec(
+    result = await db.exec(
         select(GuestBook).where(
             GuestBook.id == guestbook_id,
             GuestBook.host_google_id == host_google_id,
             GuestBook.is_deleted == False,
         )
-    ).first()
+    )
+    guestbook = result.first()
 
     if not guestbook:
         raise HTTPException(
@@ -117,12 +148,92 @@ def delete_guestbook(
 
     try:
         guestbook.soft_delete()
-        db.commit()
+        await db.commit()
 
     except Exception:
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="방명록 삭제 중 오류가 발생했습니다.",
         )
+
+
+def _escape_like(query: str) -> str:
+    return query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+async def search_posts(
+    db: AsyncSession,
+    query: str,
+    target: str | None,
+    offset: int,
+    limit: int,
+) -> dict:
+    ts_query = func.plainto_tsquery("simple", query)
+    pattern = f"%{_escape_like(query)}%"
+    stmts = []
+
+    if target in (None, "notice"):
+        stmts.append(
+            select(
+                literal("notice").label("type"),
+                Notice.id,
+                Notice.title,
+                Notice.content,
+                Notice.author_name,
+                null().label("host_google_id"),
+                Notice.created_at,
+                (
+                    func.ts_rank(Notice.search_vector, ts_query)
+                    + func.word_similarity(query, Notice.title + " " + Notice.content)
+                ).label("rank"),
+            ).where(
+                Notice.is_deleted == False,
+                or_(
+                    Notice.search_vector.op("@@")(ts_query),
+                    Notice.title.ilike(pattern),
+                    Notice.content.ilike(pattern),
+                ),
+            )
+        )
+
+    if target in (None, "guestbook"):
+        stmts.append(
+            select(
+                literal("guestbook").label("type"),
+                GuestBook.id,
+                null().label("title"),
+                GuestBook.content,
+                GuestBook.author_name,
+                GuestBook.host_google_id,
+                GuestBook.created_at,
+                (
+                    func.ts_rank(GuestBook.search_vector, ts_query)
+                    + func.word_similarity(query, GuestBook.content)
+                ).label("rank"),
+            ).where(
+                GuestBook.is_deleted == False,
+                GuestBook.is_secret == False,
+                or_(
+                    GuestBook.search_vector.op("@@")(ts_query),
+                    GuestBook.content.ilike(pattern),
+                ),
+            )
+        )
+
+    matches = union_all(*stmts).subquery()
+    result = await db.exec(
+        select(*matches.c)
+        .order_by(
+            matches.c.rank.desc(), matches.c.created_at.desc(), matches.c.id.desc()
+        )
+        .offset(offset)
+        .limit(limit + 1)
+    )
+    rows = result.mappings().all()
+
+    return {
+        "items": rows[:limit],
+        "next_offset": offset + limit if len(rows) > limit else None,
+    }
@@ -1,12 +1,25 @@
-from sqlmodel import Session, select
+import logging
+from datetime import datetime, time
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import insert
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from fastapi import HTTPException, status
 
+from core.write_buffers import write_behind
+from crud import leaderboards
 from models.quests import Quest, QuestResult
 from request_schemas.quests import QuestResultCreateRequest
 
 
-def get_quest(db: Session, quest_number: int) -> Quest:
-    quest = db.exec(select(Quest).where(Quest.quest_number == quest_number)).first()
+logger = logging.getLogger(__name__)
+
+
+async def get_quest(db: AsyncSession, quest_number: int) -> Quest:
+    result = await db.exec(select(Quest).where(Quest.quest_number == quest_number))
+    quest = result.first()
 
     if not quest:
         raise HTTPException(
@@ -17,45 +30,143 @@ def get_quest(db: Session, quest_number: int) -> Quest:
     return quest
 
 
-def create_quest_result(
-    db: Session,
+async def create_quest_result(
+    db: AsyncSession,
+    redis: Redis,
     quest_number: int,
     request: QuestResultCreateRequest,
     user_email: str,
     user_name: str,
 ) -> None:
+    new_result = QuestResult(
+        quest_number=quest_number,
+        user_email=user_email,
+        user_name=user_name,
+        time_taken=request.time_taken,
+        duration_ms=request.duration_ms,
+    )
+
+    if not write_behind.enqueue(bulk_create_quest_results, new_result):
+        try:
+            db.add(new_result)
+            await db.commit()
+
+        except Exception:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="문제 해결 정보 생성 중 오류가 발생했습니다.",
+            )
+
+    # 결과는 이미 저장(또는 큐에 적재)되었으므로 실패로 응답하면 재시도로 중복 저장됩니다.
     try:
-        new_result = QuestResult(
-            quest_number=quest_number,
-            user_email=user_email,
-            user_name=user_name,
-            time_taken=request.time_taken,
+        await leaderboards.record_quest_result(redis, new_result)
+
+    except RedisError:
+        logger.warning(
+            "리더보드에 문제 해결 결과를 반영하지 못했습니다: %s",
+            quest_number,
+            exc_info=True,
+        )
+        await leaderboards.invalidate_leaderboard(
+            redis, quest_number, new_result.created_at.date()
         )
 
-        db.add(new_result)
-        db.commit()
 
-    except Exception:
-        db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="문제 해결 정보 생성 중 오류가 발생했습니다.",
+async def bulk_create_quest_results(
+    db: AsyncSession, results: list[QuestResult]
+) -> None:
+    await db.exec(
+        insert(QuestResult).values(
+            [result.model_dump(exclude={"id"}) for result in results]
         )
+    )
+    await db.commit()
 
 
-def get_quest_results(db: Session, quest_number: int) -> list[QuestResult]:
-    from datetime import datetime, time
-
+async def get_today_quest_results(db: AsyncSession, quest_number: int) -> list:
     today = datetime.now().date()
     today_start = datetime.combine(today, time.min)
     today_end = datetime.combine(today, time.max)
 
-    return db.exec(
-        select(QuestResult)
+    result = await db.exec(
+        select(
+            QuestResult.quest_number,
+            QuestResult.user_name,
+            QuestResult.user_email,
+            QuestResult.time_taken,
+            QuestResult.created_at,
+            QuestResult.duration_ms,
+        )
         .where(
             QuestResult.quest_number == quest_number,
             QuestResult.created_at >= today_start,
             QuestResult.created_at <= today_end,
+            QuestResult.duration_ms.is_not(None),
+        )
+        .order_by(QuestResult.duration_ms.asc())
+    )
+    return result.all()
+
+
+async def get_quest_results(
+    db: AsyncSession, redis: Redis, quest_number: int, limit: int | None = None
+) -> list[dict]:
+    try:
+        results = await leaderboards.get_leaderboard(redis, quest_number, limit)
+
+        if results is None:
+            await leaderboards.rebuild_leaderboard(
+                redis, quest_number, await get_today_quest_results(db, quest_number)
+            )
+            results = await leaderboards.get_leaderboard(redis, quest_number, limit)
+
+    except RedisError:
+        logger.warning(
+            "리더보드를 Redis에서 읽지 못해 DB에서 조회합니다: %s",
+            quest_number,
+            exc_info=True,
+        )
+        results = leaderboards.rank_results(
+            await get_today_quest_results(db, quest_number)
+        )[:limit]
+
+    return results
+
+
+async def get_quest_rank(
+    db: AsyncSession, redis: Redis, quest_number: int, user_email: str
+) -> dict:
+    try:
+        if not await leaderboards.is_leaderboard_ready(redis, quest_number):
+            await leaderboards.rebuild_leaderboard(
+                redis, quest_number, await get_today_quest_results(db, quest_number)
+            )
+
+        rank = await leaderboards.get_user_rank(redis, quest_number, user_email)
+
+    except RedisError:
+        logger.warning(
+            "리더보드를 Redis에서 읽지 못해 DB에서 조회합니다: %s",
+            quest_number,
+            exc_info=True,
+        )
+        entries = leaderboards.rank_results(
+            await get_today_quest_results(db, quest_number)
+        )
+        rank = next(
+            (
+                {"rank": index, **entry}
+                for index, entry in enumerate(entries, start=1)
+                if entry["user_email"] == user_email
+            ),
+            None,
+        )
+
+    if not rank:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="오늘의 문제 해결 기록을 찾을 수 없습니다.",
         )
-        .order_by(QuestResult.time_taken.asc())
-    ).all()
+
+    return rank
@@ -1,71 +1,223 @@
-from sqlmodel import Session, select, update
+from sqlalchemy import (
+    ARRAY,
+    DateTime,
+    String,
+    any_,
+    column,
+    func,
+    literal,
+    literal_column,
+    true,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import select, update, tuple_
+from sqlmodel.ext.asyncio.session import AsyncSession
 from fastapi import HTTPException, status
 from datetime import datetime
 
+from core.caches import user_cache, profile_cache
+from core.paginations import build_page, decode_cursor
+from core.write_buffers import write_behind
 from models.users import User, UserProfile
 from request_schemas.users import GoogleSignupRequest, UserProfileUpdateRequest
+from response_schemas.users import UserProfileBatchResponse
 
 
-def get_user_by_email(db: Session, email: str) -> User | None:
-    return db.exec(select(User).where(User.email == email)).first()
+USER_SEARCH_FACET_LIMIT = 50
 
 
-def create_new_user(db: Session, user_data: GoogleSignupRequest) -> User:
+async def upsert_user_on_login(
+    db: AsyncSession, user_data: GoogleSignupRequest
+) -> User:
     try:
-        user = User(
-            email=user_data.email,
-            name=user_data.name,
-            google_id=user_data.google_id,
-            google_image_url=user_data.google_image_url,
-            generation=7,
-            role_level=0,
+        now = datetime.now()
+
+        upserted_user = (
+            insert(User)
+            .values(
+                email=user_data.email,
+                name=user_data.name,
+                google_id=user_data.google_id,
+                google_image_url=user_data.google_image_url,
+                generation=7,
+                role_level=0,
+                last_login_at=now,
+                created_at=now,
+                updated_at=now,
+            )
+            .on_conflict_do_update(
+                index_elements=[User.email], set_={"last_login_at": now}
+            )
+            .returning(*User.__table__.c, literal_column("xmax = 0").label("inserted"))
+            .cte("upserted_user")
+        )
+
+        inserted_profile = (
+            insert(UserProfile)
+            .from_select(
+                [
+                    "google_id",
+                    "portfolio_url",
+                    "tech_stack",
+                    "created_at",
+                    "updated_at",
+                ],
+                select(
+                    upserted_user.c.google_id,
+                    literal([], ARRAY(String)),
+                    literal([], ARRAY(String)),
+                    literal(now),
+                    literal(now),
+                ).where(upserted_user.c.inserted),
+            )
+            .cte("inserted_profile")
         )
-        profile = UserProfile(
-            google_id=user_data.google_id,
-            bio=None,
-            resume_url=None,
-            portfolio_url=[],
-            tech_stack=[],
+
+        stmt = select(User).from_statement(
+            select(
+                *(upserted_user.c[column.name] for column in User.__table__.c)
+            ).add_cte(inserted_profile)
         )
 
-        db.add(user)
-        db.add(profile)
-        db.commit()
-        db.refresh(user)
+        user = (await db.exec(stmt)).scalar_one()
+        await db.commit()
+        await user_cache.invalidate(user.google_id)
 
         return user
 
     except Exception:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="사용자 생성 중 오류가 발생했습니다.",
+            detail="사용자 로그인 처리 중 오류가 발생했습니다.",
         )
 
 
-def update_last_login(db: Session, user: User) -> User:
-    try:
-        user.last_login_at = datetime.now()
-        db.commit()
-        db.refresh(user)
+async def login_user(db: AsyncSession, user_data: GoogleSignupRequest) -> User:
+    user = await user_cache.get(user_data.google_id)
+
+    if (
+        user
+        and user.email == user_data.email
+        and write_behind.enqueue(
+            bulk_update_last_login, (user.google_id, datetime.now())
+        )
+    ):
         return user
 
-    except Exception:
-        db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="로그인 시간 업데이트 중 오류가 발생했습니다.",
+    return await upsert_user_on_login(db, user_data)
+
+
+async def bulk_update_last_login(
+    db: AsyncSession, logins: list[tuple[str, datetime]]
+) -> None:
+    latest_logins = {}
+    for google_id, login_at in logins:
+        latest_logins[google_id] = max(login_at, latest_logins.get(google_id, login_at))
+
+    rows = values(
+        column("google_id", String), column("last_login_at", DateTime), name="logins"
+    ).data(list(latest_logins.items()))
+
+    await db.exec(
+        update(User)
+        .where(User.google_id == rows.c.google_id)
+        .values(last_login_at=rows.c.last_login_at)
+    )
+    await db.commit()
+
+
+async def get_all_users(db: AsyncSession, cursor: str | None, limit: int) -> dict:
+    stmt = select(User.name, User.google_id, User.generation, User.created_at, User.id)
+
+    if cursor:
+        stmt = stmt.where(
+            tuple_(User.created_at, User.id) < tuple_(*decode_cursor(cursor))
         )
 
+    result = await db.exec(
+        stmt.order_by(User.created_at.desc(), User.id.desc()).limit(limit + 1)
+    )
+    return build_page(result.all(), limit)
 
-def get_all_users(db: Session) -> list[User]:
-    return db.exec(select(User.name, User.google_id, User.generation)).all()
 
+async def search_users(
+    db: AsyncSession,
+    tech_stack: list[str],
+    generation: int | None,
+    cursor: str | None,
+    limit: int,
+) -> dict:
+    filters = []
 
-def get_user_profile(db: Session, google_id: str) -> UserProfile:
-    profile = db.exec(
+    if tech_stack:
+        filters.append(
+            UserProfile.tech_stack.op("@>")(literal(tech_stack, ARRAY(String)))
+        )
+
+    if generation is not None:
+        filters.append(User.generation == generation)
+
+    stmt = (
+        select(
+            User.name,
+            User.google_id,
+            User.generation,
+            UserProfile.tech_stack,
+            User.created_at,
+            User.id,
+        )
+        .join(UserProfile, UserProfile.google_id == User.google_id)
+        .where(*filters)
+    )
+
+    if cursor:
+        stmt = stmt.where(
+            tuple_(User.created_at, User.id) < tuple_(*decode_cursor(cursor))
+        )
+
+    result = await db.exec(
+        stmt.order_by(User.created_at.desc(), User.id.desc()).limit(limit + 1)
+    )
+    page = build_page(result.all(), limit)
+
+    if cursor:
+        page["facets"] = None
+        return page
+
+    stacks = (
+        func.unnest(UserProfile.tech_stack)
+        .table_valued("tech_stack")
+        .render_derived(name="stacks")
+    )
+    facet_result = await db.exec(
+        select(stacks.c.tech_stack, func.count().label("count"))
+        .select_from(UserProfile)
+        .join(User, User.google_id == UserProfile.google_id)
+        .join(stacks, true())
+        .where(*filters)
+        .group_by(stacks.c.tech_stack)
+        .order_by(func.count().desc(), stacks.c.tech_stack)
+        .limit(USER_SEARCH_FACET_LIMIT)
+    )
+    page["facets"] = facet_result.all()
+
+    return page
+
+
+async def get_user_profile(
+    db: AsyncSession, google_id: str
+) -> UserProfileBatchResponse:
+    profile = await profile_cache.get(google_id)
+
+    if profile:
+        return profile
+
+    result = await db.exec(
         select(UserProfile).where(UserProfile.google_id == google_id)
-    ).first()
+    )
+    profile = result.first()
 
     if not profile:
         raise HTTPException(
@@ -73,11 +225,30 @@ def get_user_profile(db: Session, google_id: str) -> UserProfile:
             detail="해당 사용자의 프로필을 찾을 수 없습니다.",
         )
 
-    return profile
+    return await profile_cache.set(google_id, profile)
+
+
+async def get_user_profiles(
+    db: AsyncSession, google_ids: list[str]
+) -> list[UserProfileBatchResponse]:
+    google_ids = list(dict.fromkeys(google_ids))
+    profiles = await profile_cache.get_many(google_ids)
+    missing = [google_id for google_id in google_ids if google_id not in profiles]
+
+    if missing:
+        result = await db.exec(
+            select(UserProfile).where(
+                UserProfile.google_id == any_(literal(missing, ARRAY(String)))
+            )
+        )
+        loaded = {profile.google_id: profile for profile in result.all()}
+        profiles.update(await profile_cache.set_many(loaded))
+
+    return [profiles[google_id] for google_id in google_ids if google_id in profiles]
 
 
-def update_user_profile(
-    db: Session, google_id: str, profile_update: UserProfileUpdateRequest
+async def update_user_profile(
+    db: AsyncSession, google_id: str, profile_update: UserProfileUpdateRequest
 ) -> UserProfile:
     try:
         stmt = (
@@ -87,7 +258,7 @@ def update_user_profile(
             .returning(UserProfile)
         )
 
-        result = db.exec(stmt)
+        result = (await db.exec(stmt)).scalar_one_or_none()
 
         if not result:
             raise HTTPException(
@@ -95,12 +266,14 @@ def update_user_profile(
                 detail="해당 사용자의 프로필을 찾을 수 없습니다.",
             )
 
-        db.commit()
+        await db.commit()
+        await user_cache.invalidate(google_id)
+        await profile_cache.invalidate(google_id)
 
         return result
 
     except Exception:
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
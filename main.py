@@ -1,14 +1,75 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.openapi.utils import get_openapi
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from redis.exceptions import RedisError
 from starlette.middleware.cors import CORSMiddleware
 
 from apis.users import user_router
 from apis.posts import post_router
 from apis.quests import quest_router
 from apis.meetings import meetings_router
+from apis.rooms import rooms_router
+from apis.batches import batch_router
+from core.broadcasters import meeting_room_events
+from core.caches import user_cache, profile_cache, listen_for_cache_invalidations
+from core.config import settings
+from core.catalogs import quest_catalog, refresh_quest_catalog
+from core.presences import reap_stale_clients_periodically
+from core.write_buffers import write_behind
+from core.metrics import RequestMetricsMiddleware
+from core.databases import (
+    engine,
+    redis_client,
+    check_redis_health,
+    close_redis,
+    get_redis_pool_stats,
+    redis_health,
+)
+from crud.meetings import rebuild_meeting_room_registry
+
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    redis_health_task = asyncio.create_task(check_redis_health())
+    cache_invalidation_task = asyncio.create_task(listen_for_cache_invalidations())
+
+    try:
+        await quest_catalog.load()
+    except Exception:
+        logger.exception("문제 카탈로그를 적재하지 못해 조회 시점에 다시 시도합니다.")
 
-app = FastAPI()
+    quest_catalog_task = asyncio.create_task(refresh_quest_catalog())
+    meeting_room_events_task = asyncio.create_task(meeting_room_events.run())
+    presence_reaper_task = asyncio.create_task(reap_stale_clients_periodically())
+    write_behind_task = asyncio.create_task(write_behind.run())
+
+    try:
+        await rebuild_meeting_room_registry(redis_client)
+    except RedisError:
+        pass
+
+    yield
+
+    redis_health_task.cancel()
+    cache_invalidation_task.cancel()
+    quest_catalog_task.cancel()
+    meeting_room_events_task.cancel()
+    presence_reaper_task.cancel()
+    write_behind.close()
+    await write_behind_task
+    await close_redis()
+    await engine.dispose()
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 def custom_openapi():
@@ -37,6 +98,16 @@ app.include_router(user_router)
 app.include_router(post_router)
 app.include_router(quest_router)
 app.include_router(meetings_router)
+app.include_router(rooms_router)
+app.include_router(batch_router)
+app.add_middleware(RequestMetricsMiddleware)
+
+if settings.profiling_enabled:
+    from apis.profiles import profile_router
+    from core.profilers import ProfilingMiddleware
+
+    app.include_router(profile_router)
+    app.add_middleware(ProfilingMiddleware)
 
 app.add_middleware(
     CORSMiddleware,
@@ -52,5 +123,34 @@ def health_check():
     return {"status": "ok"}
 
 
+@app.get("/health/redis")
+def redis_health_check():
+    return {
+        "status": "ok" if redis_health["healthy"] else "unhealthy",
+        **redis_health,
+        "pool": get_redis_pool_stats(),
+    }
+
+
+@app.get("/health/user-cache")
+def user_cache_stats():
+    return user_cache.stats()
+
+
+@app.get("/health/profile-cache")
+def profile_cache_stats():
+    return profile_cache.stats()
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+@app.get("/health/write-behind")
+def write_behind_stats():
+    return write_behind.stats()
+
+
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
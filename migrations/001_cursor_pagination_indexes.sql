@@ -0,0 +1,11 @@
+-- Composite indexes backing the (created_at, id) keyset pagination of
+-- notices, guestbooks and users.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_notice_is_deleted_created_at_id
+    ON notice (is_deleted, created_at, id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_guestbook_host_google_id_is_deleted_created_at_id
+    ON guestbook (host_google_id, is_deleted, created_at, id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_created_at_id
+    ON "user" (created_at, id);
@@ -0,0 +1,21 @@
+-- Numeric duration for quest results and a covering index for the daily
+-- leaderboard query (quest_number + created_at range, ordered by duration_ms).
+-- Rows whose time_taken does not match the request format (HH:MM:SS with
+-- exactly two hour digits, so the INTEGER milliseconds cannot overflow) keep a
+-- NULL duration and are left off the leaderboard.
+
+ALTER TABLE questresult ADD COLUMN IF NOT EXISTS duration_ms INTEGER;
+
+UPDATE questresult
+SET duration_ms = (
+        split_part(time_taken, ':', 1)::int * 3600
+        + split_part(time_taken, ':', 2)::int * 60
+        + split_part(time_taken, ':', 3)::int
+    ) * 1000
+WHERE time_taken ~ '^\d{2}:[0-5]\d:[0-5]\d$';
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_questresult_quest_number_created_at_duration_ms
+    ON questresult (quest_number, created_at, duration_ms)
+    INCLUDE (user_name, user_email, time_taken);
+
+VACUUM (ANALYZE) questresult;
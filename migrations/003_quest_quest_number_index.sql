@@ -0,0 +1,4 @@
+-- Index for quest lookups by quest_number (catalog load and fallback reads).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_quest_quest_number
+    ON quest (quest_number);
@@ -0,0 +1,33 @@
+-- Full-text search over notices and guestbooks: a generated tsvector column
+-- with a GIN index per table, plus pg_trgm indexes for Korean partial matches
+-- (the 'simple' configuration does not stem, so "회의" will not match "회의는").
+-- Adding a stored generated column rewrites the table under an exclusive lock;
+-- run this outside peak hours.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+ALTER TABLE notice ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(content, ''))
+    ) STORED;
+
+ALTER TABLE guestbook ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (to_tsvector('simple', coalesce(content, ''))) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_notice_search_vector
+    ON notice USING gin (search_vector);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_notice_title_trgm
+    ON notice USING gin (title gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_notice_content_trgm
+    ON notice USING gin (content gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_guestbook_search_vector
+    ON guestbook USING gin (search_vector);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_guestbook_content_trgm
+    ON guestbook USING gin (content gin_trgm_ops);
+
+VACUUM (ANALYZE) notice;
+VACUUM (ANALYZE) guestbook;
@@ -0,0 +1,8 @@
+-- Indexes for the user search endpoint: GIN on the tech_stack array for
+-- containment (@>) filters and a B-tree on generation.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_userprofile_tech_stack
+    ON userprofile USING gin (tech_stack);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_generation
+    ON "user" (generation);
@@ -0,0 +1,12 @@
+-- For databases that applied an earlier version of 002: duration_ms was
+-- NOT NULL DEFAULT 0, so rows whose time_taken did not parse ranked as the
+-- fastest results. Unparseable rows now hold NULL and are excluded from the
+-- leaderboard, using the same format as QuestResultCreateRequest.
+
+ALTER TABLE questresult ALTER COLUMN duration_ms DROP NOT NULL;
+ALTER TABLE questresult ALTER COLUMN duration_ms DROP DEFAULT;
+
+UPDATE questresult
+SET duration_ms = NULL
+WHERE duration_ms IS NOT NULL
+    AND time_taken !~ '^\d{2}:[0-5]\d:[0-5]\d$';
@@ -1,22 +1,83 @@
 from typing import Optional
 
-from sqlmodel import Field
+from sqlalchemy import Column, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
+from sqlmodel import Field, Index
 
 from models.commons import TimeStamp, SoftDelete
 
 
+# 검색 전용 컬럼이므로 목록/상세 조회 시에는 읽지 않도록 deferred로 매핑합니다.
+notice_search_vector = Column(
+    "search_vector",
+    TSVECTOR,
+    Computed(
+        "to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(content, ''))",
+        persisted=True,
+    ),
+)
+guestbook_search_vector = Column(
+    "search_vector",
+    TSVECTOR,
+    Computed("to_tsvector('simple', coalesce(content, ''))", persisted=True),
+)
+
+
 class Notice(TimeStamp, SoftDelete, table=True):
+    __table_args__ = (
+        Index("ix_notice_is_deleted_created_at_id", "is_deleted", "created_at", "id"),
+        Index("ix_notice_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_notice_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_notice_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        ),
+    )
+    __mapper_args__ = {"properties": {"search_vector": deferred(notice_search_vector)}}
+
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str = Field(default="")
     content: str = Field(default="")
     author_name: str = Field(default="")
     author_google_id: str = Field(index=True)
+    search_vector: Optional[str] = Field(default=None, sa_column=notice_search_vector)
 
 
 class GuestBook(TimeStamp, SoftDelete, table=True):
+    __table_args__ = (
+        Index(
+            "ix_guestbook_host_google_id_is_deleted_created_at_id",
+            "host_google_id",
+            "is_deleted",
+            "created_at",
+            "id",
+        ),
+        Index("ix_guestbook_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_guestbook_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        ),
+    )
+    __mapper_args__ = {
+        "properties": {"search_vector": deferred(guestbook_search_vector)}
+    }
+
     id: Optional[int] = Field(default=None, primary_key=True)
     content: str = Field(default="")
     author_name: str = Field(default="")
     guest_google_id: str = Field(index=True)
     host_google_id: str = Field(index=True)
     is_secret: bool = Field(default=False, description="비밀 방명록 여부")
+    search_vector: Optional[str] = Field(
+        default=None, sa_column=guestbook_search_vector
+    )
@@ -1,22 +1,37 @@
 from typing import Optional
 
-from sqlmodel import Field, SQLModel, Column, Text
+from sqlmodel import Field, SQLModel, Column, Text, Index
 
 from models.commons import TimeStamp
 
 
 class Quest(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
-    quest_number: int = Field(default=0)
+    quest_number: int = Field(default=0, index=True)
     title: str = Field(default="")
-    content: str = Field(default="", sa_column=Column(Text, nullable=True))
-    input_example: str = Field(default="", sa_column=Column(Text, nullable=True))
-    output_example: str = Field(default="", sa_column=Column(Text, nullable=True))
+    content: Optional[str] = Field(default="", sa_column=Column(Text, nullable=True))
+    input_example: Optional[str] = Field(
+        default="", sa_column=Column(Text, nullable=True)
+    )
+    output_example: Optional[str] = Field(
+        default="", sa_column=Column(Text, nullable=True)
+    )
 
 
 class QuestResult(TimeStamp, table=True):
+    __table_args__ = (
+        Index(
+            "ix_questresult_quest_number_created_at_duration_ms",
+            "quest_number",
+            "created_at",
+            "duration_ms",
+            postgresql_include=["user_name", "user_email", "time_taken"],
+        ),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     quest_number: int = Field(default=0)
     user_name: str = Field(default="")
     user_email: str = Field(default="")
     time_taken: str = Field(default="00:00:00")
+    duration_ms: Optional[int] = Field(default=None)
@@ -1,12 +1,14 @@
 from datetime import datetime
 from typing import Optional, List
 
-from sqlmodel import Field, Column, ARRAY, String
+from sqlmodel import Field, Column, ARRAY, String, Index
 
 from models.commons import TimeStamp
 
 
 class User(TimeStamp, table=True):
+    __table_args__ = (Index("ix_user_created_at_id", "created_at", "id"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     email: str = Field(unique=True)
     name: str = Field(default="")
@@ -14,19 +16,25 @@ class User(TimeStamp, table=True):
     google_image_url: Optional[str] = Field(
         default=None, sa_column=Column(String, nullable=True)
     )
-    generation: int = Field(default=0, nullable=True)
+    generation: Optional[int] = Field(default=0, nullable=True, index=True)
     last_login_at: Optional[datetime] = None
     role_level: int = Field(default=0)
 
 
 class UserProfile(TimeStamp, table=True):
+    __table_args__ = (
+        Index("ix_userprofile_tech_stack", "tech_stack", postgresql_using="gin"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     google_id: str = Field(index=True)
     bio: Optional[str] = Field(default=None, sa_column=Column(String, nullable=True))
     resume_url: Optional[str] = Field(
         default=None, sa_column=Column(String, nullable=True)
     )
-    portfolio_url: List[str] = Field(
+    portfolio_url: Optional[List[str]] = Field(
+        default_factory=list, sa_column=Column(ARRAY(String))
+    )
+    tech_stack: Optional[List[str]] = Field(
         default_factory=list, sa_column=Column(ARRAY(String))
     )
-    tech_stack: List[str] = Field(default_factory=list, sa_column=Column(ARRAY(String)))
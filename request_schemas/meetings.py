@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from typing import List
+
+from pydantic import BaseModel, Field
 
 
 class MeetingRoomCreate(BaseModel):
@@ -15,3 +17,20 @@ class RoomJoin(BaseModel):
 class RoomLeave(BaseModel):
     room_id: str
     client_id: str
+
+
+class Heartbeat(BaseModel):
+    client_id: str
+
+
+class HeartbeatBatch(BaseModel):
+    heartbeats: List[Heartbeat] = Field(min_length=1, max_length=500)
+
+
+class ClientReconnect(BaseModel):
+    client_id: str
+
+
+class ChatMessageCreate(BaseModel):
+    client_id: str
+    content: str = Field(min_length=1, max_length=1000)
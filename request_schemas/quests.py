@@ -1,5 +1,10 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class QuestResultCreateRequest(BaseModel):
-    time_taken: str
+    time_taken: str = Field(pattern=r"^\d{2}:[0-5]\d:[0-5]\d$")
+
+    @property
+    def duration_ms(self) -> int:
+        hours, minutes, seconds = (int(part) for part in self.time_taken.split(":"))
+        return ((hours * 60 + minutes) * 60 + seconds) * 1000
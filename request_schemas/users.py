@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
 
 
@@ -14,3 +14,7 @@ class UserProfileUpdateRequest(BaseModel):
     resume_url: Optional[str] = None
     portfolio_url: Optional[List[str]] = None
     tech_stack: Optional[List[str]] = None
+
+
+class UserProfileBatchRequest(BaseModel):
+    google_ids: List[str] = Field(min_length=1, max_length=300)
@@ -0,0 +1,13 @@
+from typing import Any, List, Optional
+
+from pydantic import BaseModel
+
+
+class BatchSubResponse(BaseModel):
+    id: Optional[str] = None
+    status: int
+    body: Optional[Any] = None
+
+
+class BatchResponse(BaseModel):
+    responses: List[BatchSubResponse]
@@ -0,0 +1,15 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class ChatMessageResponse(BaseModel):
+    id: str
+    client_id: str
+    content: str
+    created_at: int
+
+
+class ChatMessagePageResponse(BaseModel):
+    items: List[ChatMessageResponse]
+    next_cursor: Optional[str] = None
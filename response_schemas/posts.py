@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict
 
@@ -21,3 +22,29 @@ class GuestBookResponse(BaseModel):
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class NoticePageResponse(BaseModel):
+    items: List[NoticeResponse]
+    next_cursor: Optional[str] = None
+
+
+class GuestBookPageResponse(BaseModel):
+    items: List[GuestBookResponse]
+    next_cursor: Optional[str] = None
+
+
+class PostSearchResult(BaseModel):
+    type: Literal["notice", "guestbook"]
+    id: int
+    title: Optional[str] = None
+    content: str
+    author_name: str
+    host_google_id: Optional[str] = None
+    created_at: datetime
+    rank: float
+
+
+class PostSearchPageResponse(BaseModel):
+    items: List[PostSearchResult]
+    next_offset: Optional[int] = None
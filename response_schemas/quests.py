@@ -1,14 +1,16 @@
 from datetime import datetime
 
+from typing import Optional
+
 from pydantic import BaseModel, ConfigDict
 
 
 class QuestResponse(BaseModel):
     quest_number: int
     title: str
-    content: str
-    input_example: str
-    output_example: str
+    content: Optional[str] = None
+    input_example: Optional[str] = None
+    output_example: Optional[str] = None
 
 
 class QuestResultResponse(BaseModel):
@@ -19,3 +21,7 @@ class QuestResultResponse(BaseModel):
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class QuestRankResponse(QuestResultResponse):
+    rank: int
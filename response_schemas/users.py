@@ -9,7 +9,34 @@ class UserProfileResponse(BaseModel):
     tech_stack: Optional[List[str]] = None
 
 
+class UserProfileBatchResponse(UserProfileResponse):
+    google_id: str
+
+
 class UserListResponse(BaseModel):
     name: str
     google_id: str
-    generation: int
+    generation: Optional[int] = None
+
+
+class UserPageResponse(BaseModel):
+    items: List[UserListResponse]
+    next_cursor: Optional[str] = None
+
+
+class UserSearchResponse(BaseModel):
+    name: str
+    google_id: str
+    generation: Optional[int] = None
+    tech_stack: Optional[List[str]] = None
+
+
+class TechStackFacet(BaseModel):
+    tech_stack: str
+    count: int
+
+
+class UserSearchPageResponse(BaseModel):
+    items: List[UserSearchResponse]
+    next_cursor: Optional[str] = None
+    facets: Optional[List[TechStackFacet]] = None
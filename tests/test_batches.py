@@ -0,0 +1,59 @@
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+
+import apis.batches
+from apis.batches import batch_router
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI()
+    app.include_router(batch_router)
+
+    @app.get("/health")
+    def health_check():
+        return {"status": "ok"}
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "path", ["/batch", "/batch/", "/%62atch", "/%62atch?x=1", "//batch", "/b%61tch//"]
+)
+def test_nested_batch_is_rejected(client, path):
+    response = client.post(
+        "/batch",
+        json={
+            "requests": [
+                {"id": "nested", "method": "POST", "path": path, "body": {}},
+                {"id": "health", "path": "/health"},
+            ]
+        },
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    nested, health = response.json()["responses"]
+    assert nested["status"] == status.HTTP_400_BAD_REQUEST
+    assert health == {"id": "health", "status": 200, "body": {"status": "ok"}}
+
+
+def test_sub_request_routed_back_into_batch_is_rejected(monkeypatch, client):
+    monkeypatch.setattr(apis.batches, "_normalize_path", lambda path: path)
+
+    response = client.post(
+        "/batch",
+        json={
+            "requests": [
+                {
+                    "method": "POST",
+                    "path": "/%62atch",
+                    "body": {"requests": [{"path": "/health"}]},
+                }
+            ]
+        },
+    )
+
+    [nested] = response.json()["responses"]
+    assert nested["status"] == status.HTTP_400_BAD_REQUEST
+    assert nested["body"] == {"detail": apis.batches.NESTED_BATCH_DETAIL}
@@ -0,0 +1,109 @@
+import asyncio
+import json
+
+import core.caches
+from core.caches import listen_for_cache_invalidations, profile_cache, user_cache
+from core.config import settings
+from models.users import User, UserProfile
+
+
+def _user(**fields) -> User:
+    return User(email="user@example.com", google_id="google-1", name="정글", **fields)
+
+
+async def _wait_until(predicate) -> None:
+    for _ in range(200):
+        if await predicate():
+            return
+        await asyncio.sleep(0.01)
+
+    raise AssertionError("조건이 충족되지 않았습니다.")
+
+
+async def _subscribers(redis) -> int:
+    [(_, count)] = await redis.pubsub_numsub(settings.cache_invalidation_channel)
+    return count
+
+
+async def _is_evicted(key: str) -> bool:
+    return user_cache._local.get(key) is None
+
+
+def test_user_with_null_generation_survives_cache_round_trip(monkeypatch, fake_redis):
+    monkeypatch.setattr(core.caches, "redis_client", fake_redis)
+
+    async def scenario():
+        await user_cache.set("google-1", _user(generation=None))
+
+        cached = await user_cache.get("google-1")
+        assert cached is not None
+        assert cached.generation is None
+
+        await user_cache.invalidate("google-1")
+
+    asyncio.run(scenario())
+
+
+def test_entry_failing_validation_is_a_miss(monkeypatch, fake_redis):
+    monkeypatch.setattr(core.caches, "redis_client", fake_redis)
+
+    async def scenario():
+        user_cache._local.set("google-1", {"email": None})
+
+        assert await user_cache.get("google-1") is None
+        assert user_cache._local.get("google-1") is None
+
+    asyncio.run(scenario())
+
+
+def test_published_invalidation_clears_local_tier(monkeypatch, fake_redis):
+    monkeypatch.setattr(core.caches, "redis_client", fake_redis)
+
+    async def scenario():
+        listener = asyncio.create_task(listen_for_cache_invalidations())
+
+        try:
+            await _wait_until(lambda: _subscribers(fake_redis))
+
+            await user_cache.set("google-1", _user(role_level=1))
+            assert await user_cache.get("google-1") is not None
+
+            # 다른 워커가 발행한 무효화 메시지
+            await fake_redis.publish(
+                settings.cache_invalidation_channel,
+                json.dumps({"cache": "user", "key": "google-1"}),
+            )
+
+            await _wait_until(lambda: _is_evicted("google-1"))
+            assert await user_cache.get("google-1") is None
+
+        finally:
+            listener.cancel()
+
+    asyncio.run(scenario())
+
+
+def test_profile_with_null_arrays_survives_cache_round_trip(monkeypatch, fake_redis):
+    monkeypatch.setattr(core.caches, "redis_client", fake_redis)
+    profile = UserProfile(google_id="google-1", bio="안녕하세요")
+    profile.portfolio_url = profile.tech_stack = None
+
+    async def scenario():
+        await profile_cache.set("google-1", profile)
+
+        expected = {
+            "google_id": "google-1",
+            "bio": "안녕하세요",
+            "resume_url": None,
+            "portfolio_url": None,
+            "tech_stack": None,
+        }
+        assert (await profile_cache.get("google-1")).model_dump() == expected
+        assert {
+            key: cached.model_dump()
+            for key, cached in (await profile_cache.get_many(["google-1"])).items()
+        } == {"google-1": expected}
+
+        await profile_cache.invalidate("google-1")
+
+    asyncio.run(scenario())
@@ -0,0 +1,82 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+import core.catalogs
+from core.catalogs import QuestCatalog
+from models.quests import Quest
+
+
+class _Result:
+    def __init__(self, rows: list) -> None:
+        self._rows = rows
+
+    def all(self) -> list:
+        return self._rows
+
+
+def _session_returning(rows: list | Exception):
+    @asynccontextmanager
+    async def session():
+        class Session:
+            async def exec(self, statement):
+                if isinstance(rows, Exception):
+                    raise rows
+                return _Result(rows)
+
+        yield Session()
+
+    return session
+
+
+def test_load_keeps_quests_with_null_text_columns(monkeypatch):
+    quest = Quest(quest_number=1, title="두 수의 합")
+    quest.content = quest.input_example = quest.output_example = None
+    monkeypatch.setattr(core.catalogs, "async_session", _session_returning([quest]))
+
+    catalog = QuestCatalog()
+    asyncio.run(catalog.load())
+
+    assert json.loads(catalog.get(1)) == {
+        "quest_number": 1,
+        "title": "두 수의 합",
+        "content": None,
+        "input_example": None,
+        "output_example": None,
+    }
+
+
+def test_load_skips_quests_failing_validation(monkeypatch):
+    broken = Quest(quest_number=2)
+    broken.title = None
+    monkeypatch.setattr(
+        core.catalogs,
+        "async_session",
+        _session_returning([Quest(quest_number=1, title="정상"), broken]),
+    )
+
+    catalog = QuestCatalog()
+    asyncio.run(catalog.load())
+
+    assert catalog.loaded
+    assert catalog.get(1) is not None
+    assert catalog.get(2) is None
+
+
+def test_get_or_load_retries_after_failed_load(monkeypatch):
+    monkeypatch.setattr(
+        core.catalogs, "async_session", _session_returning(OSError("DB 연결 실패"))
+    )
+    catalog = QuestCatalog()
+
+    assert asyncio.run(catalog.get_or_load(1)) is None
+    assert not catalog.loaded
+
+    monkeypatch.setattr(
+        core.catalogs,
+        "async_session",
+        _session_returning([Quest(quest_number=1, title="정상")]),
+    )
+
+    assert asyncio.run(catalog.get_or_load(1)) is not None
+    assert catalog.loaded
@@ -0,0 +1,40 @@
+import asyncio
+
+from core.config import settings
+from core.databases import get_db
+from core.diagnostics import query_budget, query_tracker
+
+
+def test_get_db_keeps_tracker_installed_by_query_budget(monkeypatch):
+    monkeypatch.setattr(settings, "query_diagnostics_enabled", True)
+
+    async def scenario():
+        with query_budget(10) as tracker:
+            sessions = get_db()
+            await anext(sessions)
+
+            assert query_tracker.get() is tracker
+
+            await sessions.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_users_page_stays_within_query_budget(users_client, max_queries):
+    async def scenario():
+        async with users_client as client:
+            with max_queries(1):
+                first = await client.get("/users", params={"limit": 10})
+
+            with max_queries(1):
+                second = await client.get(
+                    "/users",
+                    params={"limit": 10, "cursor": first.json()["next_cursor"]},
+                )
+
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first.status_code == second.status_code == 200
+    assert len(first.json()["items"]) == len(second.json()["items"]) == 10
@@ -0,0 +1,187 @@
+import asyncio
+import random
+import time
+
+import pytest
+from fastapi import FastAPI, WebSocketDisconnect, status
+from fastapi.testclient import TestClient
+from redis.asyncio import Redis
+
+import crud.meetings
+from apis.meetings import meetings_router
+from core.config import settings
+from core.databases import get_redis
+from crud.meetings import (
+    _meeting_room_key,
+    add_to_meeting_room,
+    append_meeting_room_message,
+    get_all_meeting_rooms,
+    get_meeting_room_messages,
+    reap_stale_clients,
+    record_heartbeats,
+    remove_from_meeting_room,
+    restore_client,
+)
+
+
+ROOMS = 8
+CLIENTS = 200
+
+
+async def _join_then_leave(redis, room_id: str, client_id: str, title: str | None):
+    await add_to_meeting_room(redis, room_id, title, client_id)
+    await asyncio.sleep(random.random() / 1000)
+    await remove_from_meeting_room(redis, room_id, client_id)
+
+
+def test_concurrent_join_leave_leaves_no_rooms(stress_redis):
+    async def scenario():
+        await asyncio.gather(
+            *(
+                _join_then_leave(
+                    stress_redis,
+                    f"room-{index % ROOMS}",
+                    f"client-{index}",
+                    f"미팅룸 {index % ROOMS}" if index % 3 == 0 else None,
+                )
+                for index in range(CLIENTS)
+            )
+        )
+
+        assert await stress_redis.zcard(settings.meeting_room_registry_key) == 0
+        assert await stress_redis.keys(_meeting_room_key("*")) == []
+        assert await get_all_meeting_rooms(stress_redis) == []
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_join_leave_keeps_rooms_with_remaining_clients(stress_redis):
+    async def scenario():
+        for room in range(ROOMS):
+            await add_to_meeting_room(
+                stress_redis, f"room-{room}", f"미팅룸 {room}", f"owner-{room}"
+            )
+
+        await asyncio.gather(
+            *(
+                _join_then_leave(
+                    stress_redis, f"room-{index % ROOMS}", f"client-{index}", None
+                )
+                for index in range(CLIENTS)
+            )
+        )
+
+        rooms = await get_all_meeting_rooms(stress_redis)
+        assert {room["room_id"]: room["clients"] for room in rooms} == {
+            f"room-{room}": [f"owner-{room}"] for room in range(ROOMS)
+        }
+
+        await asyncio.gather(
+            *(
+                remove_from_meeting_room(stress_redis, f"room-{room}", f"owner-{room}")
+                for room in range(ROOMS)
+            )
+        )
+
+        assert await stress_redis.zcard(settings.meeting_room_registry_key) == 0
+        assert await stress_redis.keys(_meeting_room_key("*")) == []
+
+    asyncio.run(scenario())
+
+
+def test_event_stream_closes_with_error_when_forwarding_fails():
+    app = FastAPI()
+    app.include_router(meetings_router)
+    app.dependency_overrides[get_redis] = lambda: Redis(
+        port=1, socket_connect_timeout=0.1, decode_responses=True
+    )
+
+    with TestClient(app).websocket_connect("/meetingroom/events") as websocket:
+        with pytest.raises(WebSocketDisconnect) as disconnect:
+            websocket.receive_json()
+
+    assert disconnect.value.code == status.WS_1011_INTERNAL_ERROR
+
+
+def _skip_past_presence_ttl(monkeypatch) -> None:
+    now = time.time()
+    monkeypatch.setattr(
+        crud.meetings.time,
+        "time",
+        lambda: now + settings.presence_ttl_seconds + 1,
+    )
+
+
+def test_client_that_never_sends_a_heartbeat_is_reaped(monkeypatch, fake_redis):
+    async def scenario():
+        await add_to_meeting_room(fake_redis, "room-1", "미팅룸", "client-1")
+
+        _skip_past_presence_ttl(monkeypatch)
+
+        assert await reap_stale_clients(fake_redis) == 1
+        assert await fake_redis.zcard(settings.meeting_room_registry_key) == 0
+        assert await fake_redis.keys(_meeting_room_key("*")) == []
+
+        assert await restore_client(fake_redis, "client-1") == "room-1"
+        assert await get_all_meeting_rooms(fake_redis) == [
+            {"room_id": "room-1", "title": "미팅룸", "clients": ["client-1"]}
+        ]
+
+    asyncio.run(scenario())
+
+
+def test_heartbeat_does_not_change_the_room_the_reaper_leaves(monkeypatch, fake_redis):
+    async def scenario():
+        await add_to_meeting_room(fake_redis, "room-1", "미팅룸", "client-1")
+        await add_to_meeting_room(fake_redis, "room-1", None, "client-2")
+        await record_heartbeats(fake_redis, ["client-1"])
+
+        _skip_past_presence_ttl(monkeypatch)
+        await record_heartbeats(fake_redis, ["client-2"])
+
+        assert await reap_stale_clients(fake_redis) == 1
+        assert await get_all_meeting_rooms(fake_redis) == [
+            {"room_id": "room-1", "title": "미팅룸", "clients": ["client-2"]}
+        ]
+
+    asyncio.run(scenario())
+
+
+def test_client_info_expiring_before_the_reap_still_leaves_the_room(
+    monkeypatch, fake_redis
+):
+    async def scenario():
+        await add_to_meeting_room(fake_redis, "room-1", "미팅룸", "client-1")
+        await fake_redis.delete(
+            settings.client_key_template.format(client_id="client-1")
+        )
+
+        _skip_past_presence_ttl(monkeypatch)
+
+        assert await reap_stale_clients(fake_redis) == 1
+        assert await fake_redis.keys(_meeting_room_key("*")) == []
+        assert await fake_redis.hlen(settings.presence_rooms_key) == 0
+
+    asyncio.run(scenario())
+
+
+def test_chat_messages_are_not_published_on_the_room_events_channel(fake_redis):
+    async def scenario():
+        await add_to_meeting_room(fake_redis, "room-1", "미팅룸", "client-1")
+
+        async with fake_redis.pubsub() as pubsub:
+            await pubsub.subscribe(settings.meeting_room_events_channel)
+            await pubsub.get_message(timeout=1.0)
+
+            message = await append_meeting_room_message(
+                fake_redis, "room-1", "client-1", "안녕하세요"
+            )
+
+            assert await pubsub.get_message(timeout=0.1) is None
+
+        assert message["content"] == "안녕하세요"
+        assert (await get_meeting_room_messages(fake_redis, "room-1"))["items"] == [
+            message
+        ]
+
+    asyncio.run(scenario())
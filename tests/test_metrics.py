@@ -0,0 +1,38 @@
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+from prometheus_client import REGISTRY
+
+from core.metrics import RequestMetricsMiddleware, request_timings
+
+
+def test_request_metrics_are_recorded_per_route():
+    app = FastAPI()
+    app.add_middleware(RequestMetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        request_timings.get().db_queries += 2
+        return {"id": item_id}
+
+    def count(route: str) -> float:
+        return (
+            REGISTRY.get_sample_value("db_queries_per_request_count", {"route": route})
+            or 0.0
+        )
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            return await client.get("/items/1")
+
+    before = count("/items/{item_id}")
+    response = asyncio.run(scenario())
+
+    assert response.json() == {"id": 1}
+    assert 'desc="2 queries"' in response.headers["Server-Timing"]
+    assert count("/items/{item_id}") == before + 1
+    assert request_timings.get() is None
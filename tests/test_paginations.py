@@ -0,0 +1,57 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from core.paginations import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2024, 12, 25, 9, 30, 15, 123456)
+
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "bm8tc2VwYXJhdG9y", "MjAyNHwx"])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor)
+
+    assert error.value.status_code == 400
+
+
+def test_paging_with_cursors_visits_every_user_once(users_client):
+    async def scenario():
+        pages = []
+        cursor = None
+
+        async with users_client as client:
+            while True:
+                params = {"limit": 7, **({"cursor": cursor} if cursor else {})}
+                page = (await client.get("/users", params=params)).json()
+                pages.append(page["items"])
+                cursor = page["next_cursor"]
+
+                if not cursor:
+                    return pages
+
+    pages = asyncio.run(scenario())
+    google_ids = [user["google_id"] for page in pages for user in page]
+
+    assert [len(page) for page in pages] == [7, 7, 7, 7, 2]
+    # created_at이 같은 사용자끼리는 id 내림차순입니다.
+    assert google_ids == [
+        f"google-{group * 3 + offset}" for group in range(10) for offset in (2, 1, 0)
+    ]
+
+
+def test_invalid_cursor_returns_400(users_client):
+    async def scenario():
+        async with users_client as client:
+            return await client.get("/users", params={"cursor": "not-base64!"})
+
+    response = asyncio.run(scenario())
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "유효하지 않은 커서입니다."}
@@ -0,0 +1,68 @@
+import asyncio
+
+from crud.posts import search_posts
+from models.posts import GuestBook, Notice
+
+
+def _guestbook(content: str, **fields) -> GuestBook:
+    return GuestBook(
+        content=content,
+        author_name="정글",
+        guest_google_id="guest",
+        host_google_id="host",
+        **fields,
+    )
+
+
+def test_search_excludes_secret_and_deleted_posts(postgres_session):
+    async def scenario():
+        async with postgres_session() as db:
+            db.add_all(
+                [
+                    Notice(
+                        title="알고리즘 스터디 모집",
+                        content="매주 화요일",
+                        author_google_id="admin",
+                    ),
+                    Notice(
+                        title="삭제된 알고리즘 공지",
+                        author_google_id="admin",
+                        is_deleted=True,
+                    ),
+                    Notice(title="점심 메뉴", author_google_id="admin"),
+                    _guestbook("알고리즘 같이 풀어요"),
+                    _guestbook("비밀 알고리즘 질문", is_secret=True),
+                    _guestbook("지운 알고리즘 글", is_deleted=True),
+                ]
+            )
+            await db.commit()
+
+            return (
+                await search_posts(db, "알고리즘", None, 0, 10),
+                await search_posts(db, "알고리즘", "guestbook", 0, 10),
+            )
+
+    everything, guestbooks = asyncio.run(scenario())
+
+    assert sorted(
+        (item["type"], item["title"] or item["content"]) for item in everything["items"]
+    ) == [("guestbook", "알고리즘 같이 풀어요"), ("notice", "알고리즘 스터디 모집")]
+    assert everything["next_offset"] is None
+    assert [item["content"] for item in guestbooks["items"]] == ["알고리즘 같이 풀어요"]
+
+
+def test_search_pages_with_offsets(postgres_session):
+    async def scenario():
+        async with postgres_session() as db:
+            db.add_all(_guestbook(f"알고리즘 {index}") for index in range(5))
+            await db.commit()
+
+            first = await search_posts(db, "알고리즘", None, 0, 3)
+            second = await search_posts(db, "알고리즘", None, first["next_offset"], 3)
+            return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert (len(first["items"]), first["next_offset"]) == (3, 3)
+    assert (len(second["items"]), second["next_offset"]) == (2, None)
+    assert len({item["id"] for item in first["items"] + second["items"]}) == 5
@@ -0,0 +1,88 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from pydantic import ValidationError
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+import crud.quests
+from core.write_buffers import write_behind
+from crud import leaderboards
+from crud.quests import create_quest_result, get_quest_rank, get_quest_results
+from models.quests import QuestResult
+from request_schemas.quests import QuestResultCreateRequest
+
+
+def _unreachable_redis() -> Redis:
+    return Redis(port=1, socket_connect_timeout=0.1, decode_responses=True)
+
+
+def _result(user: str, duration_ms: int) -> QuestResult:
+    return QuestResult(
+        quest_number=1,
+        user_name=user,
+        user_email=f"{user}@example.com",
+        time_taken=str(timedelta(milliseconds=duration_ms)),
+        duration_ms=duration_ms,
+        created_at=datetime.now(),
+    )
+
+
+def _today_results(monkeypatch, results: list[QuestResult]) -> None:
+    async def get_today_quest_results(db, quest_number):
+        return results
+
+    monkeypatch.setattr(crud.quests, "get_today_quest_results", get_today_quest_results)
+
+
+def test_leaderboard_error_after_save_is_not_reported_as_failure(
+    monkeypatch, fake_redis
+):
+    monkeypatch.setattr(write_behind, "enqueue", lambda handler, item: True)
+
+    async def failing_evalsha(*args, **kwargs):
+        raise RedisError("리더보드 갱신 실패")
+
+    async def scenario():
+        _, _, ready_key = leaderboards._leaderboard_keys(1, datetime.now().date())
+        await fake_redis.set(ready_key, 1)
+        monkeypatch.setattr(fake_redis, "evalsha", failing_evalsha)
+
+        await create_quest_result(
+            None,
+            fake_redis,
+            1,
+            QuestResultCreateRequest(time_taken="00:03:12"),
+            "user@example.com",
+            "정글",
+        )
+
+        assert not await fake_redis.exists(ready_key)
+
+    asyncio.run(scenario())
+
+
+def test_leaderboard_falls_back_to_db_when_redis_is_down(monkeypatch):
+    _today_results(
+        monkeypatch,
+        [_result("fast", 1_000), _result("slow", 5_000), _result("fast", 9_000)],
+    )
+
+    results = asyncio.run(get_quest_results(None, _unreachable_redis(), 1, limit=10))
+    rank = asyncio.run(
+        get_quest_rank(None, _unreachable_redis(), 1, "slow@example.com")
+    )
+
+    assert [(result["user_name"], result["time_taken"]) for result in results] == [
+        ("fast", "0:00:01"),
+        ("slow", "0:00:05"),
+    ]
+    assert (rank["rank"], rank["user_name"]) == (2, "slow")
+
+
+def test_time_taken_hours_fit_in_an_integer_duration():
+    assert QuestResultCreateRequest(time_taken="99:59:59").duration_ms == 359_999_000
+
+    with pytest.raises(ValidationError):
+        QuestResultCreateRequest(time_taken="999:00:00")
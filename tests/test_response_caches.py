@@ -0,0 +1,71 @@
+import asyncio
+
+from fastapi import Request
+from redis.asyncio import Redis
+
+from core.response_caches import (
+    bump_cache_version,
+    get_cache_version,
+    get_versioned_json_response,
+)
+
+
+VERSION_KEY = "notice_cache:version"
+KEY_TEMPLATE = "notice_cache:{version}:{resource}"
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+def _unreachable_redis() -> Redis:
+    return Redis(port=1, socket_connect_timeout=0.1, decode_responses=True)
+
+
+async def _respond(redis: Redis, request: Request, payload: str = '{"items": []}'):
+    async def build_payload() -> str:
+        return payload
+
+    return await get_versioned_json_response(
+        request,
+        redis,
+        version_key=VERSION_KEY,
+        key_template=KEY_TEMPLATE,
+        ttl_seconds=60,
+        resource="list",
+        build_payload=build_payload,
+    )
+
+
+def test_redis_outage_serves_uncached_response():
+    async def scenario():
+        response = await _respond(_unreachable_redis(), _request('"stale"'))
+
+        assert response.status_code == 200
+        assert response.body == b'{"items": []}'
+        assert "etag" not in response.headers
+
+        await bump_cache_version(_unreachable_redis(), VERSION_KEY)
+
+    asyncio.run(scenario())
+
+
+def test_etag_from_before_flush_does_not_match(fake_redis):
+    async def scenario():
+        etag = (await _respond(fake_redis, _request())).headers["etag"]
+        assert (await _respond(fake_redis, _request(etag))).status_code == 304
+
+        await fake_redis.flushdb()
+
+        assert (await _respond(fake_redis, _request(etag))).status_code == 200
+
+    asyncio.run(scenario())
+
+
+def test_bump_after_flush_starts_from_a_fresh_version(fake_redis):
+    async def scenario():
+        await bump_cache_version(fake_redis, VERSION_KEY)
+        assert await get_cache_version(fake_redis, VERSION_KEY) != "1"
+
+    asyncio.run(scenario())
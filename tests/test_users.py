@@ -0,0 +1,115 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from sqlmodel import func, select
+
+import core.caches
+from crud.users import search_users, upsert_user_on_login
+from models.users import User, UserProfile
+from request_schemas.users import GoogleSignupRequest
+
+
+def _users(now: datetime) -> list[User | UserProfile]:
+    stacks = {
+        "python": (7, ["Python", "FastAPI"]),
+        "react": (7, ["TypeScript", "React"]),
+        "fullstack": (7, ["Python", "React"]),
+        "older": (6, ["Python"]),
+    }
+    rows = []
+
+    for index, (google_id, (generation, tech_stack)) in enumerate(stacks.items()):
+        rows.append(
+            User(
+                email=f"{google_id}@example.com",
+                google_id=google_id,
+                generation=generation,
+                created_at=now - timedelta(minutes=index),
+            )
+        )
+        rows.append(UserProfile(google_id=google_id, tech_stack=tech_stack))
+
+    return rows
+
+
+def test_search_counts_facets_over_filtered_users(postgres_session):
+    async def scenario():
+        async with postgres_session() as db:
+            db.add_all(_users(datetime.now()))
+            await db.commit()
+
+            return (
+                await search_users(db, [], 7, None, 10),
+                await search_users(db, ["Python"], None, None, 10),
+            )
+
+    seventh, python = asyncio.run(scenario())
+
+    assert [user.google_id for user in seventh["items"]] == [
+        "python",
+        "react",
+        "fullstack",
+    ]
+    assert [tuple(facet) for facet in seventh["facets"]] == [
+        ("Python", 2),
+        ("React", 2),
+        ("FastAPI", 1),
+        ("TypeScript", 1),
+    ]
+    assert [user.google_id for user in python["items"]] == [
+        "python",
+        "fullstack",
+        "older",
+    ]
+    assert [tuple(facet) for facet in python["facets"]] == [
+        ("Python", 3),
+        ("FastAPI", 1),
+        ("React", 1),
+    ]
+
+
+def test_search_skips_facets_on_later_pages(postgres_session):
+    async def scenario():
+        async with postgres_session() as db:
+            db.add_all(_users(datetime.now()))
+            await db.commit()
+
+            first = await search_users(db, ["Python"], None, None, 2)
+            second = await search_users(db, ["Python"], None, first["next_cursor"], 2)
+            return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first["facets"] is not None
+    assert [user.google_id for user in second["items"]] == ["older"]
+    assert second["facets"] is None
+    assert second["next_cursor"] is None
+
+
+def test_first_login_creates_a_profile_once(monkeypatch, fake_redis, postgres_session):
+    monkeypatch.setattr(core.caches, "redis_client", fake_redis)
+    login = GoogleSignupRequest(
+        email="new@example.com",
+        name="정글",
+        google_id="new",
+        google_image_url=None,
+    )
+
+    async def scenario():
+        async with postgres_session() as db:
+            first = await upsert_user_on_login(db, login)
+            second = await upsert_user_on_login(db, login)
+            profiles = (
+                await db.exec(select(UserProfile).where(UserProfile.google_id == "new"))
+            ).all()
+            users = (await db.exec(select(func.count()).select_from(User))).one()
+            return first, second, profiles, users
+
+    first, second, profiles, users = asyncio.run(scenario())
+
+    assert first.id == second.id
+    assert second.last_login_at >= first.last_login_at
+    assert users == 1
+    assert [(profile.tech_stack, profile.portfolio_url) for profile in profiles] == [
+        ([], [])
+    ]
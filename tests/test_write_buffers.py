@@ -0,0 +1,132 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+from sqlalchemy.exc import IntegrityError
+
+import core.write_buffers
+from core.config import settings
+from core.write_buffers import WriteBehindQueue
+
+
+@asynccontextmanager
+async def _session():
+    yield None
+
+
+def _queue(monkeypatch, fake_redis, batch_size: int = 100) -> WriteBehindQueue:
+    monkeypatch.setattr(core.write_buffers, "async_session", _session)
+    monkeypatch.setattr(core.write_buffers, "redis_client", fake_redis)
+
+    return WriteBehindQueue(
+        max_size=100, batch_size=batch_size, flush_interval=0.01, retry_backoff=0
+    )
+
+
+async def _dead_letters(fake_redis) -> list:
+    entries = await fake_redis.lrange(settings.write_behind_dead_letter_key, 0, -1)
+    return [json.loads(entry)["item"] for entry in entries]
+
+
+async def _drain(queue: WriteBehindQueue) -> None:
+    queue.close()
+    await queue.run()
+
+
+def test_transient_failure_is_retried(monkeypatch, fake_redis):
+    queue = _queue(monkeypatch, fake_redis)
+    written = []
+    attempts = 0
+
+    async def flaky_insert(db, items):
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise OSError("DB 연결 끊김")
+        written.extend(items)
+
+    for item in range(5):
+        queue.enqueue(flaky_insert, item)
+    asyncio.run(_drain(queue))
+
+    assert written == [0, 1, 2, 3, 4]
+    assert queue.stats()["retries"] == 2
+    assert queue.stats()["failed"] == 0
+
+
+def test_bad_row_is_dead_lettered_and_the_rest_are_written(monkeypatch, fake_redis):
+    queue = _queue(monkeypatch, fake_redis)
+    written = []
+
+    async def insert(db, items):
+        if "bad" in items:
+            raise IntegrityError("INSERT ...", {}, ValueError("잘못된 행"))
+        written.extend(items)
+
+    for item in ["a", "bad", "b"]:
+        queue.enqueue(insert, item)
+
+    async def scenario():
+        await _drain(queue)
+        return await _dead_letters(fake_redis)
+
+    dead_letters = asyncio.run(scenario())
+
+    assert written == ["a", "b"]
+    assert queue.stats()["flushed"] == 2
+    assert queue.stats()["failed"] == 1
+    assert dead_letters == ["bad"]
+
+
+def test_db_outage_at_shutdown_gives_up_without_splitting(monkeypatch, fake_redis):
+    queue = _queue(monkeypatch, fake_redis, batch_size=2)
+    calls = []
+
+    async def insert(db, items):
+        calls.append(items)
+        raise ConnectionRefusedError("DB에 연결할 수 없음")
+
+    for item in range(5):
+        queue.enqueue(insert, item)
+
+    async def scenario():
+        await _drain(queue)
+        return await _dead_letters(fake_redis)
+
+    dead_letters = asyncio.run(scenario())
+
+    # 첫 배치만 max_retries번 다시 시도하고, 나머지는 DB를 거치지 않고 내보냅니다.
+    assert calls == [[0, 1]] * (queue.max_retries + 1)
+    assert queue.stats()["failed"] == 5
+    assert sorted(dead_letters) == [0, 1, 2, 3, 4]
+
+
+def test_db_outage_keeps_the_batch_queued_until_the_db_recovers(
+    monkeypatch, fake_redis
+):
+    queue = _queue(monkeypatch, fake_redis)
+    written = []
+    attempts = 0
+
+    async def insert(db, items):
+        nonlocal attempts
+        attempts += 1
+        if attempts <= queue.max_retries + 2:
+            raise ConnectionRefusedError("DB에 연결할 수 없음")
+        written.extend(items)
+
+    async def scenario():
+        task = asyncio.create_task(queue.run())
+        for item in range(3):
+            queue.enqueue(insert, item)
+
+        while not written:
+            await asyncio.sleep(0.01)
+
+        queue.close()
+        await task
+
+    asyncio.run(scenario())
+
+    assert written == [0, 1, 2]
+    assert queue.stats()["failed"] == 0